@@ -70,11 +70,39 @@ class AnalysisRunner:
         Returns:
             dict: Results summary with success status and message
         """
+        prepared = self.prepare_analysis(
+            ticker_weights, benches, selected_charts,
+            status_callback=status_callback, sanitize_func=sanitize_func,
+            capital=capital, currency=currency
+        )
+        if not prepared["success"]:
+            return prepared
+        self.show_warnings(prepared)
+        return self.finish_analysis(selected_charts, prepared, status_callback=status_callback)
+    
+    def prepare_analysis(self, ticker_weights, benches, selected_charts, 
+                         status_callback=None, sanitize_func=None, capital=None, currency=None):
+        """
+        Data phase of the analysis: load prices, compute metrics, run Monte Carlo
+        
+        Does no plotting and no Tk calls, so it can run on a worker thread; the
+        charts are then drawn by finish_analysis on the Tk thread (matplotlib GUI
+        is not thread-safe). Warnings meant for the user are returned in the
+        result and shown with show_warnings from the Tk thread.
+        
+        Args:
+            Same as run_analysis
+        
+        Returns:
+            dict: {"success": True, "start_capital", "currency", "warnings"} or a failure summary
+        """
         
         def update_status(msg, color="#2196F3"):
             if status_callback:
                 status_callback(msg, color)
         
+        warnings = []
+        
         try:
             # Use provided capital or default
             start_capital = capital if capital is not None else START_CAPITAL
@@ -141,13 +169,10 @@ class AnalysisRunner:
                     )
                 except Exception as fetch_err:
                     print(f"Yahoo fetch failed, falling back to local CSVs: {fetch_err}")
-                    try:
-                        messagebox.showwarning(
-                            "Yahoo fetch failed",
-                            f"Yahoo download failed. Falling back to local CSVs.\n\n{fetch_err}"
-                        )
-                    except Exception:
-                        pass
+                    warnings.append((
+                        "Yahoo fetch failed",
+                        f"Yahoo download failed. Falling back to local CSVs.\n\n{fetch_err}"
+                    ))
                     self.etf_prices = slice_recent_safe(
                         align_business_days(load_prices_from_dir(self.data_dir)), ESTIMATION_YEARS
                     )
@@ -180,6 +205,50 @@ class AnalysisRunner:
                 update_status("Running Monte Carlo simulations...", "#2196F3")
                 self.mc_results = self._run_monte_carlo(self.portfolio_metrics, start_capital)
             
+            return {
+                "success": True,
+                "start_capital": start_capital,
+                "currency": portfolio_currency,
+                "warnings": warnings
+            }
+            
+        except Exception as e:
+            return self._failure_result(e, update_status)
+    
+    def show_warnings(self, prepared):
+        """
+        Show the warnings collected by prepare_analysis (must run on the Tk thread)
+        
+        Args:
+            prepared: Result of prepare_analysis
+        """
+        for title, message in prepared.get("warnings", ()):
+            try:
+                messagebox.showwarning(title, message)
+            except Exception:
+                pass
+    
+    def finish_analysis(self, selected_charts, prepared, status_callback=None):
+        """
+        Chart phase of the analysis (must run on the Tk thread)
+        
+        Args:
+            selected_charts: list of chart numbers to generate
+            prepared: Successful result of prepare_analysis
+            status_callback: Optional callback(message, color) for status updates
+        
+        Returns:
+            dict: Results summary with success status and message
+        """
+        
+        def update_status(msg, color="#2196F3"):
+            if status_callback:
+                status_callback(msg, color)
+        
+        start_capital = prepared["start_capital"]
+        portfolio_currency = prepared["currency"]
+        
+        try:
             # Generate selected charts
             update_status(f"Generating {len(selected_charts)} charts...", "#2196F3")
             self.generate_selected_charts(selected_charts, self.mc_results, start_capital, portfolio_currency)
@@ -195,16 +264,20 @@ class AnalysisRunner:
             }
             
         except Exception as e:
-            update_status("ERROR - Check console", "red")
-            print(f"\nERROR: {e}")
-            import traceback
-            traceback.print_exc()
-            
-            return {
-                "success": False,
-                "message": f"Analysis failed: {str(e)}",
-                "error": str(e)
-            }
+            return self._failure_result(e, update_status)
+    
+    def _failure_result(self, error, update_status):
+        """Report an analysis error and build the failure summary"""
+        update_status("ERROR - Check console", "red")
+        print(f"\nERROR: {error}")
+        import traceback
+        traceback.print_exc()
+        
+        return {
+            "success": False,
+            "message": f"Analysis failed: {str(error)}",
+            "error": str(error)
+        }
     
     def _normalize_weights(self, ticker_weights):
         """
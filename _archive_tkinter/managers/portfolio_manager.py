@@ -47,6 +47,35 @@ class PortfolioManager:
                 pass
         return total
     
+    def snapshot_validated(self, get_symbol):
+        """
+        Single pass over the rows: validated (symbol, weight) pairs and total weight
+        
+        Args:
+            get_symbol: Function (idx, row) -> normalized symbol or empty string
+        
+        Returns:
+            tuple: (list of (symbol, weight) for validated rows, total weight of all rows)
+        """
+        pairs = []
+        total = 0.0
+        for idx, row in enumerate(self.ticker_rows):
+            weight_entry = row.get("weight_entry")
+            try:
+                weight = float(weight_entry.get().strip()) if weight_entry else 0.0
+            except ValueError:
+                weight = 0.0
+            total += weight
+            
+            status_lbl = row.get("status")
+            if not row.get("entry") or not status_lbl:
+                continue
+            if status_lbl.cget("text") == "✓":
+                symbol = get_symbol(idx, row)
+                if symbol:
+                    pairs.append((symbol, weight))
+        return pairs, total
+    
     def update_amount_from_weight(self, idx):
         """
         Update amount field based on weight percentage
@@ -221,13 +250,14 @@ class PortfolioManager:
             # Clear weight
             weight_entry = row.get("weight_entry")
             if weight_entry:
-                weight_entry.delete(0, tk.END)
-                weight_entry.insert(0, "0.0")
+                if weight_entry.get() != "0.0":
+                    weight_entry.delete(0, tk.END)
+                    weight_entry.insert(0, "0.0")
                 count += 1
             
             # Clear amount
             amount_entry = row.get("amount_entry")
-            if amount_entry:
+            if amount_entry and amount_entry.get() != "0":
                 amount_entry.delete(0, tk.END)
                 amount_entry.insert(0, "0")
         
@@ -743,8 +743,8 @@ class SymbolUIHandler:
         """
         top, lb = self.ensure_dropdown(kind, idx)
         lb.delete(0, tk.END)
-        for s in labels:
-            lb.insert(tk.END, s)
+        if labels:
+            lb.insert(tk.END, *labels)
         if lb.size() > 0:
             lb.selection_clear(0, tk.END)
             lb.selection_set(0)
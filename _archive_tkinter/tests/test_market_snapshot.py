@@ -0,0 +1,102 @@
+# test_market_snapshot.py - Tests de get_market_snapshot avec yf.download simulé
+"""
+Tests for utils_data.get_market_snapshot; yfinance.download is mocked, no network.
+
+Usage:
+    python test_market_snapshot.py
+"""
+import sys
+import os
+from unittest import mock
+
+import pandas as pd
+
+# Add parent directory to path to enable imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DATES = pd.date_range("2024-01-01", periods=3, freq="D")
+
+
+def _ohlc(closes):
+    return pd.DataFrame({"Open": closes, "Close": closes}, index=DATES)
+
+
+def _snapshot_with(frame, symbols):
+    """Run get_market_snapshot with yfinance.download returning frame"""
+    import yfinance
+    from utils.utils_data import get_market_snapshot
+
+    with mock.patch.object(yfinance, "download", return_value=frame) as download:
+        snapshot = get_market_snapshot(symbols)
+    return snapshot, download
+
+
+def test_snapshot_multiindex():
+    """Batched result: one download, each symbol uses its own last two closes"""
+    print("[TEST] Testing get_market_snapshot (MultiIndex)...")
+
+    frame = pd.concat({
+        "EURUSD=X": _ohlc([1.00, 1.10, 1.21]),
+        "^GSPC": _ohlc([100.0, 200.0, float("nan")]),  # closed on the last day
+    }, axis=1)
+    snapshot, download = _snapshot_with(frame, ["EURUSD=X", "^GSPC", "EURUSD=X"])
+
+    assert download.call_count == 1
+    assert download.call_args.kwargs["tickers"] == ["EURUSD=X", "^GSPC"]  # deduplicated
+
+    price, change_pts, change_pct = snapshot["EURUSD=X"]
+    assert price == 1.21
+    assert abs(change_pts - 0.11) < 1e-9
+    assert abs(change_pct - 10.0) < 1e-9
+    assert snapshot["^GSPC"] == (200.0, 100.0, 100.0)
+    print("[OK] MultiIndex snapshot OK\n")
+
+
+def test_snapshot_flat_single_symbol():
+    """Older yfinance returns flat columns for a single ticker"""
+    print("[TEST] Testing get_market_snapshot (flat columns)...")
+
+    snapshot, _ = _snapshot_with(_ohlc([50.0, 40.0, 50.0]), ["GC=F"])
+    assert snapshot == {"GC=F": (50.0, 10.0, 25.0)}
+    print("[OK] Flat snapshot OK\n")
+
+
+def test_snapshot_missing_symbol():
+    """Symbols absent from the download are omitted"""
+    print("[TEST] Testing get_market_snapshot (missing symbol)...")
+
+    frame = pd.concat({"^NDX": _ohlc([10.0, 10.0, 12.0])}, axis=1)
+    snapshot, _ = _snapshot_with(frame, ["^NDX", "XXXX"])
+    assert set(snapshot) == {"^NDX"}
+
+    snapshot, download = _snapshot_with(pd.DataFrame(), ["^NDX"])
+    assert snapshot == {}
+
+    snapshot, download = _snapshot_with(frame, [])
+    assert snapshot == {}
+    assert download.call_count == 0
+    print("[OK] Missing symbol handling OK\n")
+
+
+def main():
+    """Run all tests"""
+    print("=" * 60)
+    print("Testing Market Snapshot")
+    print("=" * 60 + "\n")
+
+    for test in (test_snapshot_multiindex, test_snapshot_flat_single_symbol,
+                 test_snapshot_missing_symbol):
+        try:
+            test()
+        except AssertionError as e:
+            print(f"[FAIL] {test.__name__} failed: {e}\n")
+        except Exception as e:
+            print(f"[ERROR] {test.__name__} error: {e}\n")
+
+    print("=" * 60)
+    print("Testing Complete!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,11 @@
 # menu_principal.py - Portfolio Analysis Control Panel (Orchestrator)
+import queue
+import threading
 import tkinter as tk
 from tkinter import messagebox
+from types import MappingProxyType
+from contextlib import contextmanager
+from concurrent.futures import Future
 
 # Import configuration
 from core.config import WEIGHTS_RAW, BENCH_DEF
@@ -8,7 +13,6 @@ from core.config import WEIGHTS_RAW, BENCH_DEF
 # Import modules
 from ui.ui_builder import UIBuilder
 from managers.symbol_handler import SymbolValidator, SymbolUIHandler
-from core.analysis_runner import AnalysisRunner
 from ui.theme_colors import LightPremiumTheme as T
 
 # Import new specialized modules
@@ -35,6 +39,32 @@ class ChartControlPanel:
     - AnalysisRunner: Executes portfolio analysis
     """
     
+    # Summary panel text constants
+    _SEP25 = "-" * 25
+    _PORT_HEADER = "Ticker    Weight"
+    _BENCH_HEADER = "Index          Ticker"
+    
+    # Chart groups for UI organization
+    CHART_GROUPS = MappingProxyType({
+        "Portfolio & Sector (1-6)": tuple(range(1, 7)),
+        "Monte Carlo (7-12)": tuple(range(7, 13)),
+        "Risk Metrics (13-17)": tuple(range(13, 18)),
+        "Benchmarks (18-21)": tuple(range(18, 22)),
+        "Sector & Regime (22-24)": tuple(range(22, 25)),
+    })
+    
+    # Chart names for display
+    CHART_NAMES = MappingProxyType({
+        1: "Portfolio Allocation", 2: "Correlation Matrix", 3: "Risk Contribution",
+        4: "Performance vs Benchmarks", 5: "Sector Decomposition", 6: "Sector Risk Contribution",
+        7: "MC Paths (Normal)", 8: "MC Paths (Randomness)", 9: "Volatility (Normal)",
+        10: "Volatility (Randomness)", 11: "Max Drawdown (Normal)", 12: "Max Drawdown (Randomness)",
+        13: "VaR 95%", 14: "Expected Shortfall", 15: "Max DD Duration", 16: "Calmar Ratio",
+        17: "Sharpe Ratio", 18: "Risk vs Indexes", 19: "Forward Excess", 
+        20: "Portfolio vs Benchmarks (Normal)", 21: "Portfolio vs Benchmarks (Random)", 
+        22: "Sector Performance", 23: "Regime Analysis", 24: "Sector Rotation"
+    })
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Portfolio Architect")
@@ -47,26 +77,9 @@ class ChartControlPanel:
         # Chart selection variables
         self.chart_vars = {}
         
-        # Chart groups for UI organization
-        self.chart_groups = {
-            "Portfolio & Sector (1-6)": list(range(1, 7)),
-            "Monte Carlo (7-12)": list(range(7, 13)),
-            "Risk Metrics (13-17)": list(range(13, 18)),
-            "Benchmarks (18-21)": list(range(18, 22)),
-            "Sector & Regime (22-24)": list(range(22, 25)),
-        }
-        
-        # Chart names for display
-        self.chart_names = {
-            1: "Portfolio Allocation", 2: "Correlation Matrix", 3: "Risk Contribution",
-            4: "Performance vs Benchmarks", 5: "Sector Decomposition", 6: "Sector Risk Contribution",
-            7: "MC Paths (Normal)", 8: "MC Paths (Randomness)", 9: "Volatility (Normal)",
-            10: "Volatility (Randomness)", 11: "Max Drawdown (Normal)", 12: "Max Drawdown (Randomness)",
-            13: "VaR 95%", 14: "Expected Shortfall", 15: "Max DD Duration", 16: "Calmar Ratio",
-            17: "Sharpe Ratio", 18: "Risk vs Indexes", 19: "Forward Excess", 
-            20: "Portfolio vs Benchmarks (Normal)", 21: "Portfolio vs Benchmarks (Random)", 
-            22: "Sector Performance", 23: "Regime Analysis", 24: "Sector Rotation"
-        }
+        # Chart groups and names: shared read-only class constants
+        self.chart_groups = ChartControlPanel.CHART_GROUPS
+        self.chart_names = ChartControlPanel.CHART_NAMES
         
         # UI state
         self.ticker_rows = []
@@ -84,6 +97,36 @@ class ChartControlPanel:
         self.currency_var = None
         self.capital_display = None
         
+        # Last rendered weight total (text, color) and summary pairs, to skip no-op redraws
+        self._last_total_display = None
+        self._last_summary_pairs = None
+        
+        # Summary panels ("ticker"/"bench") whose refresh was skipped while not viewable
+        self._hidden_summaries = set()
+        
+        # _batched_ui nesting depth and deferred summary refresh flag
+        self._batch_depth = 0
+        self._summary_pending = False
+        
+        # Entry widget path -> (kind, row index, placeholder) for the shared event handlers
+        self._entry_index = {}
+        
+        # (kind, row index) -> (entry, browse button) last bound by _rebind_symbol_callbacks
+        self._bound_rows = {}
+        
+        # (kind, row index) -> normalized symbol, invalidated on edit/validation/clear
+        self._symbol_cache = {}
+        
+        # Untouched entries show one of these ("Ticker 1", "Benchmark 2", ...)
+        self._placeholder_set = frozenset()
+        
+        # Pending debounced updates (callback name -> after id)
+        self._pending_updates = {}
+        
+        # Parsed capital and currency symbol, refreshed by StringVar traces (not per read)
+        self._capital_float = 10000.0
+        self._currency_symbol = None
+        
         # Local hints for autocomplete fallback
         self.local_ticker_hints = [
             "NVDA", "AAPL", "MSFT", "GOOG", "AMZN", "TSLA", "META", "PLTR",
@@ -93,9 +136,13 @@ class ChartControlPanel:
             "^GSPC", "^NDX", "^DJI", "^GDAXI", "^FCHI", "^STOXX50E", "^IBEX", "^N225", "FTSEMIB.MI", "GC=F"
         ]
         
+        # Analysis data phase: one daemon thread per run (see run_analysis)
+        self._analysis_future = None
+        self._status_queue = queue.Queue()  # (message, color) posted by the worker
+        
         # Initialize modules (will be set after UI creation)
         self.symbol_handler = None
-        self.analysis_runner = AnalysisRunner()
+        self.analysis_runner = None  # Created on the first run (see run_analysis)
         self.currency_manager = CurrencyManager(default_currency="USD")
         self.portfolio_manager = None  # Created after ticker_rows exist
         self.market_data_manager = None  # Created after UI panels exist
@@ -118,6 +165,9 @@ class ChartControlPanel:
         # Create left panel (portfolio summary and benchmarks)
         left_panel, self.portfolio_text, self.benchmark_text = UIBuilder.create_left_panel(content_frame, WEIGHTS_RAW, BENCH_DEF)
         
+        # Summaries skipped while hidden are rebuilt once the window/panel is mapped again
+        self.root.bind("<Map>", self._flush_hidden_summaries, add="+")
+        
         # Create right panel
         right_panel = tk.Frame(content_frame, bg=T.MAIN_BG)
         right_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -160,11 +210,18 @@ class ChartControlPanel:
         forex_refresh_btn.config(command=self.market_data_manager.refresh_forex)
         indexes_refresh_btn.config(command=self.market_data_manager.refresh_indexes)
         
+        # Parse capital / resolve currency symbol once per write, before the refreshes read them
+        self._recompute_capital_float()
+        self._recompute_currency_symbol()
+        self.capital_var.trace_add("write", self._recompute_capital_float)
+        self.currency_var.trace_add("write", self._recompute_currency_symbol)
+        
         # Add trace to currency var to update currency symbols when changed
-        self.currency_var.trace_add("write", lambda *args: self._on_currency_change())
+        # (debounced: a burst of writes triggers a single refresh)
+        self.currency_var.trace_add("write", lambda *args: self._schedule_update(self._on_currency_change))
         
         # Add trace to capital var to recalculate amounts when capital changes
-        self.capital_var.trace_add("write", lambda *args: self._on_capital_change())
+        self.capital_var.trace_add("write", lambda *args: self._schedule_update(self._on_capital_change))
         
         # Top cards container
         cards_container = tk.Frame(right_panel, bg=T.MAIN_BG)
@@ -225,50 +282,139 @@ class ChartControlPanel:
         }
         bottom_toolbar = UIBuilder.create_bottom_toolbar(content_wrapper, toolbar_callbacks)
         
-        # Initialize currency symbols and amounts
-        self.root.after(100, self._on_currency_change)
-        
-        # Load forex rates and major indexes in background after UI is ready
-        self.root.after(500, self.market_data_manager.load_all_market_data)
-        
-        # Start auto-refresh timer
+        # Staged startup: currency/amounts once idle, then market data, then auto-refresh
+        self.root.after_idle(self._post_ui_init)
+    
+    def _post_ui_init(self):
+        """First idle pass after setup_ui: initialize currency symbols and amounts"""
+        self._on_currency_change()
+        self.root.after(500, self._post_market_init)
+    
+    def _post_market_init(self):
+        """Load forex rates and major indexes, then arm the auto-refresh timer"""
+        self.market_data_manager.load_all_market_data()
         self.root.after(300000, self.market_data_manager.start_auto_refresh)
     
     def _rebind_symbol_callbacks(self):
         """Rebind entry widgets to use symbol_handler methods"""
-        # Rebind ticker rows
-        for i, row in enumerate(self.ticker_rows):
-            entry = row["entry"]
-            placeholder = row["placeholder"]
-            
-            # Clear and rebind (removed autocomplete bindings: KeyRelease, Down, Escape)
-            for event in ["<FocusIn>", "<FocusOut>", "<Return>"]:
-                entry.unbind(event)
-            
-            entry.bind("<FocusIn>", lambda e, ent=entry, ph=placeholder: self.symbol_handler.on_focus_in(ent, ph))
-            entry.bind("<FocusOut>", lambda e, idx=i: self.symbol_handler.queue_validate("ticker", idx))
-            entry.bind("<Return>", lambda e, idx=i: self.symbol_handler.queue_validate("ticker", idx))
-        
-        # Rebind benchmark rows
-        for i, row in enumerate(self.benchmark_rows):
-            entry = row["entry"]
-            placeholder = row["placeholder"]
-            browse_btn = row.get("browse_btn")
-            
-            # Clear and rebind (removed autocomplete bindings: KeyRelease, Down, Escape)
-            for event in ["<FocusIn>", "<FocusOut>", "<Return>"]:
-                entry.unbind(event)
-            
-            entry.bind("<FocusIn>", lambda e, ent=entry, ph=placeholder, idx=i: self.symbol_handler.on_focus_in(ent, ph, kind="bench", idx=idx))
-            entry.bind("<FocusOut>", lambda e, idx=i: self.symbol_handler.queue_validate("bench", idx))
-            entry.bind("<Return>", lambda e, idx=i: self.symbol_handler.queue_validate("bench", idx))
-            
-            # Bind browse button
-            if browse_btn:
-                browse_btn.config(command=lambda idx=i: self.symbol_handler.show_benchmark_selection("bench", idx))
+        # One shared handler per event; the widget path identifies the row
+        self._entry_index = {}
+        rows = [("ticker", self.ticker_rows), ("bench", self.benchmark_rows)]
+        self._placeholder_set = frozenset(
+            row["placeholder"] for _, kind_rows in rows for row in kind_rows
+        )
+        
+        for kind, kind_rows in rows:
+            for i, row in enumerate(kind_rows):
+                entry = row["entry"]
+                browse_btn = row.get("browse_btn")
+                self._entry_index[str(entry)] = (kind, i, row["placeholder"])
+                
+                # Rows whose widgets were already bound keep their bindings
+                bound = self._bound_rows.get((kind, i))
+                if bound and bound[0] is entry and bound[1] is browse_btn:
+                    continue
+                self._bound_rows[(kind, i)] = (entry, browse_btn)
+                
+                # Clear and rebind (removed autocomplete bindings: Down, Escape)
+                for event in ["<FocusIn>", "<FocusOut>", "<Return>", "<KeyRelease>"]:
+                    entry.unbind(event)
+                
+                entry.bind("<FocusIn>", self._on_entry_focus_in)
+                entry.bind("<FocusOut>", self._on_entry_validate)
+                entry.bind("<Return>", self._on_entry_validate)
+                entry.bind("<KeyRelease>", self._on_entry_edited)
+                
+                # Bind browse button (benchmark rows only)
+                if browse_btn:
+                    browse_btn.config(command=lambda idx=i: self.symbol_handler.show_benchmark_selection("bench", idx))
+    
+    def _on_entry_focus_in(self, event):
+        """Dispatch <FocusIn> from any ticker/benchmark entry to the symbol handler"""
+        row_info = self._entry_index.get(str(event.widget))
+        if row_info:
+            kind, idx, placeholder = row_info
+            self.symbol_handler.on_focus_in(event.widget, placeholder, kind=kind, idx=idx)
+    
+    def _on_entry_edited(self, event):
+        """Typing in an entry invalidates that row's cached symbol"""
+        row_info = self._entry_index.get(str(event.widget))
+        if row_info:
+            self._symbol_cache.pop(row_info[:2], None)
+    
+    def _get_row_symbol(self, kind, idx, row):
+        """
+        Normalized symbol of a row, cached until the entry is edited or revalidated
+        
+        Args:
+            kind: "ticker" or "bench"
+            idx: Row index
+            row: Row dictionary
+        
+        Returns:
+            str: Normalized symbol or empty string
+        """
+        key = (kind, idx)
+        symbol = self._symbol_cache.get(key)
+        if symbol is None:
+            symbol = self._fast_symbol(row)
+            self._symbol_cache[key] = symbol
+        return symbol
+    
+    def _fast_symbol(self, row):
+        """
+        Normalized symbol of a row, skipping normalization for empty/placeholder entries
+        
+        Args:
+            row: Row dictionary
+        
+        Returns:
+            str: Normalized symbol or empty string
+        """
+        text = row["entry"].get().strip()
+        if not text or text in self._placeholder_set:
+            return ""
+        return self.symbol_handler.get_symbol(row["entry"], row.get("placeholder"))
+    
+    def _invalidate_symbol_cache(self, kind=None):
+        """Drop cached symbols for one kind of row (or all rows)"""
+        if kind is None:
+            self._symbol_cache.clear()
+        else:
+            for key in [k for k in self._symbol_cache if k[0] == kind]:
+                del self._symbol_cache[key]
+    
+    def _on_entry_validate(self, event):
+        """Dispatch <FocusOut>/<Return> from any ticker/benchmark entry to validation"""
+        row_info = self._entry_index.get(str(event.widget))
+        if row_info:
+            kind, idx, _ = row_info
+            self.symbol_handler.queue_validate(kind, idx)
     
     # -------------------- Currency & Capital Management --------------------
     
+    def _schedule_update(self, fn, delay=50):
+        """
+        Coalesce bursts of trace callbacks (e.g. typing in the capital field)
+        
+        Each call cancels the pending run of the same callback and reschedules it,
+        so fn runs once, delay ms after the last write.
+        
+        Args:
+            fn: Update method to run
+            delay: Quiet period in milliseconds
+        """
+        key = fn.__name__
+        pending_id = self._pending_updates.pop(key, None)
+        if pending_id:
+            self.root.after_cancel(pending_id)
+        
+        def run():
+            self._pending_updates.pop(key, None)
+            fn()
+        
+        self._pending_updates[key] = self.root.after(delay, run)
+    
     def _on_currency_change(self):
         """Called when currency selection changes - delegates to PortfolioManager"""
         currency_symbol = self.get_currency_symbol()
@@ -290,6 +436,17 @@ class ChartControlPanel:
         # Update total
         self._update_weight_total()
     
+    def _recompute_capital_float(self, *args):
+        """capital_var trace: parse the capital field once per write"""
+        try:
+            self._capital_float = float(self.capital_var.get().replace(",", ""))
+        except (ValueError, AttributeError):
+            self._capital_float = 10000.0
+    
+    def _recompute_currency_symbol(self, *args):
+        """currency_var trace: resolve the currency symbol once per write"""
+        self._currency_symbol = self.currency_manager.get_symbol(self.get_currency())
+    
     # -------------------- Weight Management (Delegates to PortfolioManager) --------------------
     
     def _on_weight_change(self, idx):
@@ -304,21 +461,29 @@ class ChartControlPanel:
     
     def _update_weight_total(self):
         """Calculate and display total weight percentage"""
-        total = self.portfolio_manager.calculate_weight_total()
+        # One scan of the rows feeds both the total and the summary panel
+        pairs, total = self.portfolio_manager.snapshot_validated(
+            lambda idx, row: self._get_row_symbol("ticker", idx, row)
+        )
         
         # Color-code based on total
         if abs(total - 100.0) < 0.01:
             color = T.PANEL_HEADER  # Green if 100%
-            self.weight_total_label.config(text=f"{total:.1f}%", fg=color)
+            text = f"{total:.1f}%"
         elif total > 100.0:
             color = T.ERROR  # Red if over 100%
-            self.weight_total_label.config(text=f"{total:.1f}% (over)", fg=color)
+            text = f"{total:.1f}% (over)"
         else:
             color = T.WARNING  # Orange if under 100%
-            self.weight_total_label.config(text=f"{total:.1f}%", fg=color)
+            text = f"{total:.1f}%"
         
-        # Update portfolio summary when weights change
-        self._update_portfolio_summary()
+        # Only touch the label when the displayed total or color changes
+        if (text, color) != self._last_total_display:
+            self.weight_total_label.config(text=text, fg=color)
+            self._last_total_display = (text, color)
+        
+        # Update portfolio summary when weights change (no-op if its content is unchanged)
+        self._update_portfolio_summary(pairs)
     
     def _normalize_weights(self):
         """Normalize all weights to sum to 100% - delegates to PortfolioManager"""
@@ -345,7 +510,7 @@ class ChartControlPanel:
     
     def _clear_weights(self):
         """Clear all weight and amount values - delegates to PortfolioManager"""
-        result = messagebox.askyesno(
+        result = self._confirm(
             "Clear Weights",
             "This will reset all weights and amounts to 0. Continue?"
         )
@@ -353,12 +518,13 @@ class ChartControlPanel:
         if not result:
             return
         
-        self.portfolio_manager.clear_all_weights()
-        self._update_weight_total()
+        with self._batched_ui():
+            self.portfolio_manager.clear_all_weights()
+            self._update_weight_total()
     
     def _clear_portfolio(self):
         """Clear all tickers and weights"""
-        result = messagebox.askyesno(
+        result = self._confirm(
             "Clear Portfolio",
             "This will remove all tickers and weights. This action cannot be undone. Continue?"
         )
@@ -366,32 +532,110 @@ class ChartControlPanel:
         if not result:
             return
         
-        for idx, row in enumerate(self.ticker_rows):
-            # Clear ticker entry
-            entry = row.get("entry")
-            placeholder = row.get("placeholder")
-            if entry and placeholder:
-                entry.delete(0, tk.END)
-                entry.insert(0, placeholder)
-                entry.config(fg=T.TEXT_MUTED, bg=T.INPUT_BG)
+        with self._batched_ui():
+            for idx, row in enumerate(self.ticker_rows):
+                # Clear ticker entry (untouched rows already hold their placeholder)
+                entry = row.get("entry")
+                placeholder = row.get("placeholder")
+                if entry and placeholder:
+                    if entry.get() != placeholder:
+                        entry.delete(0, tk.END)
+                        entry.insert(0, placeholder)
+                    entry.config(fg=T.TEXT_MUTED, bg=T.INPUT_BG)
+                
+                # Reset status
+                status_lbl = row.get("status")
+                if status_lbl:
+                    status_lbl.config(text="•", fg=T.TEXT_MUTED)
+                
+                # Clear name label
+                name_label = row.get("name_label")
+                if name_label:
+                    name_label.config(text="")
             
-            # Reset status
-            status_lbl = row.get("status")
-            if status_lbl:
-                status_lbl.config(text="•", fg=T.TEXT_MUTED)
+            self._invalidate_symbol_cache("ticker")
             
-            # Clear name label
-            name_label = row.get("name_label")
-            if name_label:
-                name_label.config(text="")
-        
-        # Clear weights using manager
-        self.portfolio_manager.clear_all_weights()
-        self._update_weight_total()
-        self._update_portfolio_summary()
+            # Clear weights using manager (summary refreshed once when the batch ends)
+            self.portfolio_manager.clear_all_weights()
+            self._update_weight_total()
     
     # -------------------- Helper Methods --------------------
     
+    def _confirm(self, title, message):
+        """
+        Modal Yes/No dialog built from a Toplevel
+        
+        Unlike messagebox.askyesno, wait_window keeps the Tk event loop
+        running, so pending after() callbacks (market refresh, debounced updates)
+        still fire while the dialog is open.
+        
+        Args:
+            title: Dialog title
+            message: Question to display
+        
+        Returns:
+            bool: True if the user confirmed
+        """
+        answer = tk.BooleanVar(value=False)
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        dialog.configure(bg=T.CARD_BG)
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        tk.Label(
+            dialog, text=message, wraplength=360, justify=tk.LEFT,
+            font=("Arial", 10), bg=T.CARD_BG, fg=T.TEXT_PRIMARY
+        ).pack(padx=20, pady=(20, 15))
+        
+        def close(result):
+            answer.set(result)
+            dialog.destroy()
+        
+        button_frame = tk.Frame(dialog, bg=T.CARD_BG)
+        button_frame.pack(fill=tk.X, padx=20, pady=(0, 20))
+        
+        tk.Button(
+            button_frame, text="No", command=lambda: close(False),
+            font=("Arial", 10), bg=T.BORDER, fg=T.TEXT_PRIMARY,
+            padx=20, pady=6, relief=tk.FLAT, cursor="hand2"
+        ).pack(side=tk.RIGHT)
+        
+        tk.Button(
+            button_frame, text="Yes", command=lambda: close(True),
+            font=("Arial", 10, "bold"), bg=T.ERROR, fg=T.TEXT_ON_DARK,
+            padx=20, pady=6, relief=tk.FLAT, cursor="hand2"
+        ).pack(side=tk.RIGHT, padx=(0, 10))
+        
+        dialog.protocol("WM_DELETE_WINDOW", lambda: close(False))
+        dialog.bind("<Escape>", lambda e: close(False))
+        
+        # Center over the main window
+        dialog.update_idletasks()
+        x = self.root.winfo_rootx() + (self.root.winfo_width() - dialog.winfo_width()) // 2
+        y = self.root.winfo_rooty() + (self.root.winfo_height() - dialog.winfo_height()) // 2
+        dialog.geometry(f"+{x}+{y}")
+        
+        dialog.wait_window()
+        return answer.get()
+    
+    @contextmanager
+    def _batched_ui(self):
+        """
+        Group several widget mutations; summary refreshes requested inside the
+        block are deferred and run once when the outermost block exits (reentrant)
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._summary_pending:
+                self._summary_pending = False
+                self._update_portfolio_summary()
+    
     def _on_closing(self):
         """Handle window closing - cleanup timers and resources"""
         # Cleanup market data manager
@@ -408,23 +652,34 @@ class ChartControlPanel:
         Args:
             kind: "ticker" or "bench"
         """
+        # Validation may have rewritten the entries (ISIN conversion, suffix resolution)
+        self._invalidate_symbol_cache(kind)
+        
         if kind == "ticker":
             self._update_portfolio_summary()
         elif kind == "bench":
-            self._update_benchmark_summary()
+            # Idle: the validation callback sets the instrument name right after this call
+            self.root.after_idle(self._refresh_bench_display_names)
+    
+    def _refresh_bench_display_names(self):
+        """Cache each benchmark's shortened name on its row, then refresh the summary"""
+        for row in self.benchmark_rows:
+            name_label = row.get("name_label")
+            name = name_label.cget("text").strip() if name_label else ""
+            if len(name) > 15:
+                name = name[:12] + "..."
+            row["display_name"] = name
+        
+        self._update_benchmark_summary()
     
     def get_capital_amount(self):
         """
         Get the capital amount entered by user
         
         Returns:
-            float: Capital amount, or 10000 if invalid
+            float: Capital amount, or 10000 if invalid (parsed by the capital_var trace)
         """
-        try:
-            capital_str = self.capital_var.get().replace(",", "")
-            return float(capital_str)
-        except (ValueError, AttributeError):
-            return 10000.0
+        return self._capital_float
     
     def get_currency(self):
         """
@@ -445,51 +700,67 @@ class ChartControlPanel:
         Returns:
             str: Currency symbol ($ € £ ¥ CHF)
         """
-        return self.currency_manager.get_symbol(self.get_currency())
+        if self._currency_symbol is None:
+            self._recompute_currency_symbol()
+        return self._currency_symbol
     
     # -------------------- Summary Panel Updates --------------------
     
-    def _update_portfolio_summary(self):
-        """Update the Portfolio Composition panel with current validated tickers"""
+    def _flush_hidden_summaries(self, event=None):
+        """<Map> handler: rebuild the summaries whose refresh was skipped while hidden"""
+        if not self._hidden_summaries:
+            return
+        pending, self._hidden_summaries = self._hidden_summaries, set()
+        if "ticker" in pending:
+            self._update_portfolio_summary()
+        if "bench" in pending:
+            self._update_benchmark_summary()
+    
+    def _update_portfolio_summary(self, ticker_weights=None):
+        """
+        Update the Portfolio Composition panel with current validated tickers
+        
+        Args:
+            ticker_weights: Precomputed (symbol, weight) pairs from snapshot_validated (optional)
+        """
         if not self.portfolio_text:
             return
         
-        # Collect validated tickers with weights
-        ticker_weights = []
-        for row in self.ticker_rows:
-            entry = row.get("entry")
-            placeholder = row.get("placeholder")
-            status_lbl = row.get("status")
-            weight_entry = row.get("weight_entry")
-            
-            if not entry or not status_lbl:
-                continue
-            
-            symbol = self.symbol_handler.get_symbol(entry, placeholder)
-            status = status_lbl.cget("text")
-            
-            if symbol and status == "✓":
-                try:
-                    weight = float(weight_entry.get().strip()) if weight_entry else 0.0
-                except ValueError:
-                    weight = 0.0
-                ticker_weights.append((symbol, weight))
+        # Inside _batched_ui: refresh once at the end of the batch
+        if self._batch_depth:
+            self._summary_pending = True
+            return
         
-        # Update the text widget
-        self.portfolio_text.config(state=tk.NORMAL)
-        self.portfolio_text.delete("1.0", tk.END)
-        self.portfolio_text.insert("1.0", "Ticker    Weight\n")
-        self.portfolio_text.insert("end", "-" * 25 + "\n")
+        # Hidden panel (window minimized, panel unmapped): rebuild when shown again
+        if not self.portfolio_text.winfo_viewable():
+            self._hidden_summaries.add("ticker")
+            return
+        
+        # Collect validated tickers with weights (unless the caller already scanned the rows)
+        if ticker_weights is None:
+            ticker_weights, _ = self.portfolio_manager.snapshot_validated(
+                lambda idx, row: self._get_row_symbol("ticker", idx, row)
+            )
+        
+        # Skip the widget rewrite when the validated (symbol, weight) pairs are unchanged
+        ticker_weights = tuple(ticker_weights)
+        if ticker_weights == self._last_summary_pairs:
+            return
+        self._last_summary_pairs = ticker_weights
         
+        # Build the full text first, then update the widget with a single insert
+        lines = [self._PORT_HEADER, self._SEP25]
         if ticker_weights:
             total_weight = sum(w for _, w in ticker_weights)
-            for ticker, weight in ticker_weights:
-                self.portfolio_text.insert("end", f"{ticker:<10}{weight:>6.1f}%\n")
-            self.portfolio_text.insert("end", "-" * 25 + "\n")
-            self.portfolio_text.insert("end", f"{'TOTAL':<10}{total_weight:>6.1f}%\n")
+            lines.extend(f"{ticker:<10}{weight:>6.1f}%" for ticker, weight in ticker_weights)
+            lines.append(self._SEP25)
+            lines.append(f"{'TOTAL':<10}{total_weight:>6.1f}%")
         else:
-            self.portfolio_text.insert("end", "No tickers selected\n")
+            lines.append("No tickers selected")
         
+        self.portfolio_text.config(state=tk.NORMAL)
+        self.portfolio_text.delete("1.0", tk.END)
+        self.portfolio_text.insert("1.0", "\n".join(lines) + "\n")
         self.portfolio_text.config(state=tk.DISABLED)
     
     def _update_benchmark_summary(self):
@@ -497,47 +768,37 @@ class ChartControlPanel:
         if not self.benchmark_text:
             return
         
+        # Hidden panel (window minimized, panel unmapped): rebuild when shown again
+        if not self.benchmark_text.winfo_viewable():
+            self._hidden_summaries.add("bench")
+            return
+        
         # Collect validated benchmarks
         benchmarks = []
-        for row in self.benchmark_rows:
+        for idx, row in enumerate(self.benchmark_rows):
             entry = row.get("entry")
-            placeholder = row.get("placeholder")
             status_lbl = row.get("status")
-            name_label = row.get("name_label")
             
             if not entry or not status_lbl:
                 continue
             
-            symbol = self.symbol_handler.get_symbol(entry, placeholder)
+            symbol = self._get_row_symbol("bench", idx, row)
             status = status_lbl.cget("text")
             
             if symbol and status == "✓":
-                # Try to get name from label, otherwise use symbol
-                name = ""
-                if name_label:
-                    name_text = name_label.cget("text")
-                    # Clean the text
-                    name = name_text.strip()
-                    if name and len(name) > 15:
-                        name = name[:12] + "..."
-                
-                if not name:
-                    name = symbol
-                
-                benchmarks.append((name, symbol))
-        
-        # Update the text widget
-        self.benchmark_text.config(state=tk.NORMAL)
-        self.benchmark_text.delete("1.0", tk.END)
-        self.benchmark_text.insert("1.0", "Index          Ticker\n")
-        self.benchmark_text.insert("end", "-" * 25 + "\n")
+                # Name cached at validation time, otherwise use symbol
+                benchmarks.append((row.get("display_name") or symbol, symbol))
         
+        # Build the full text first, then update the widget with a single insert
+        lines = [self._BENCH_HEADER, self._SEP25]
         if benchmarks:
-            for name, ticker in benchmarks:
-                self.benchmark_text.insert("end", f"{name:<15}{ticker}\n")
+            lines.extend(f"{name:<15}{ticker}" for name, ticker in benchmarks)
         else:
-            self.benchmark_text.insert("end", "No benchmarks selected\n")
+            lines.append("No benchmarks selected")
         
+        self.benchmark_text.config(state=tk.NORMAL)
+        self.benchmark_text.delete("1.0", tk.END)
+        self.benchmark_text.insert("1.0", "\n".join(lines) + "\n")
         self.benchmark_text.config(state=tk.DISABLED)
     
     # -------------------- Chart Selection --------------------
@@ -558,32 +819,37 @@ class ChartControlPanel:
     
     def run_analysis(self):
         """Run complete portfolio analysis by delegating to AnalysisRunner"""
+        if self._analysis_future is not None and not self._analysis_future.done():
+            self.status_label.config(text="Analysis already running...", fg=T.WARNING)
+            return
+        
         selected = [num for num, var in self.chart_vars.items() if var.get()]
         if not selected:
             messagebox.showwarning("No Selection", "Please select at least one chart!")
             return
         
-        self.root.update()
-        
-        # Collect validated tickers with weights and benchmarks
+        # Collect validated tickers with weights and benchmarks (Tk thread: reads widgets)
         ticker_weights = self.symbol_handler.collect_valid_symbols("ticker")
         benches = self.symbol_handler.collect_valid_symbols("bench")
         
         # Get capital and currency from UI
-        try:
-            capital = float(self.capital_var.get())
-        except (ValueError, AttributeError):
-            capital = None  # Will use default START_CAPITAL
+        capital = self.get_capital_amount()
         
         currency = self.currency_var.get() if hasattr(self, 'currency_var') else "USD"
         
-        # Status callback for real-time updates
+        # Deferred import: the analysis stack is not needed to show the window
+        if self.analysis_runner is None:
+            from core.analysis_runner import AnalysisRunner
+            self.analysis_runner = AnalysisRunner()
+        
+        # Status callback for the worker thread: no Tk calls, the poller applies the messages
         def status_callback(msg, color):
-            self.status_label.config(text=msg, fg=color)
-            self.root.update()
+            self._status_queue.put((msg, color))
         
-        # Run analysis using AnalysisRunner
-        result = self.analysis_runner.run_analysis(
+        # Data phase (download, metrics, Monte Carlo) runs off the Tk thread, on a
+        # daemon thread so that closing the window does not wait for it
+        future = Future()
+        prepare_kwargs = dict(
             ticker_weights=ticker_weights,
             benches=benches,
             selected_charts=selected,
@@ -593,6 +859,65 @@ class ChartControlPanel:
             currency=currency
         )
         
+        def worker():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(self.analysis_runner.prepare_analysis(**prepare_kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+        
+        self._analysis_future = future
+        threading.Thread(target=worker, name="analysis-data", daemon=True).start()
+        self.root.after(50, self._poll_analysis, selected)
+    
+    def _poll_analysis(self, selected):
+        """
+        Tk-thread poller: show the latest queued status, then hand over to the
+        chart phase once the worker is done
+        
+        Args:
+            selected: list of chart numbers to generate
+        """
+        # Read done() before draining: every status the worker posted before
+        # returning is then already queued and shown, including a final error
+        done = self._analysis_future.done()
+        
+        latest = None
+        while True:
+            try:
+                latest = self._status_queue.get_nowait()
+            except queue.Empty:
+                break
+        if latest:
+            msg, color = latest
+            self.status_label.config(text=msg, fg=color)
+        
+        if done:
+            self._on_analysis_prepared(self._analysis_future, selected)
+        else:
+            self.root.after(50, self._poll_analysis, selected)
+    
+    def _on_analysis_prepared(self, future, selected):
+        """
+        Called on the Tk thread once the data phase is done: draw charts and report
+        
+        Args:
+            future: Future of AnalysisRunner.prepare_analysis
+            selected: list of chart numbers to generate
+        """
+        result = future.result()
+        
+        # Chart phase stays on the Tk thread (matplotlib figures are Tk windows)
+        if result["success"]:
+            self.analysis_runner.show_warnings(result)
+            
+            def status_callback(msg, color):
+                self.status_label.config(text=msg, fg=color)
+                self.root.update_idletasks()
+            
+            result = self.analysis_runner.finish_analysis(selected, result, status_callback=status_callback)
+        
         # Show result
         if result["success"]:
             messagebox.showinfo(
@@ -602,7 +927,6 @@ class ChartControlPanel:
         else:
             messagebox.showerror("Error", result["message"])
 
-
 def main():
     """Application entry point"""
     root = tk.Tk()
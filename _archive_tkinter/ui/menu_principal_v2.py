@@ -1,8 +1,11 @@
 # menu_principal_v2.py - Portfolio Analysis Control Panel (Split-View Improved)
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 import sys
 import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -21,6 +24,29 @@ from managers.portfolio_manager import PortfolioManager
 from managers.market_data_manager import MarketDataManager
 from utils.utils_data import get_current_forex_rates, get_major_indexes_prices
 
+log = logging.getLogger(__name__)
+
+# Shared pool for market data requests, reused across Refresh clicks
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+FETCH_TIMEOUT = 15  # seconds per market data request
+
+
+def _build_chart_layout(groups, names):
+    """
+    Flatten chart groups into an immutable layout descriptor
+    
+    Args:
+        groups: Dict of category name -> list of chart numbers
+        names: Dict of chart number -> chart name
+    
+    Returns:
+        tuple: ((category_name, ((chart_id, iid, label), ...)), ...)
+    """
+    return tuple(
+        (category, tuple((cid, str(cid), f"{cid}. {names[cid]}") for cid in chart_ids))
+        for category, chart_ids in groups.items()
+    )
+
 
 class ChartControlPanel:
     """
@@ -58,19 +84,77 @@ class ChartControlPanel:
         22: "Sector Performance", 23: "Regime Analysis", 24: "Sector Rotation"
     }
     
+    # Right panel layout, resolved once at class creation
+    CHART_LAYOUT = _build_chart_layout(CHART_GROUPS, CHART_NAMES)
+    
+    # Table layouts: (column id, heading, width, editable)
+    PORTFOLIO_COLUMNS = (
+        ("num", "#", 30, False),
+        ("ticker", "Ticker/ISIN", 140, True),
+        ("weight", "Weight %", 90, True),
+        ("amount", "Amount", 90, True),
+    )
+    
+    BENCHMARK_COLUMNS = (
+        ("num", "#", 30, False),
+        ("benchmark", "Benchmark", 280, True),
+    )
+    
+    # Status dot colors (the dot is drawn as an image in the tree column, see _make_dot_image)
+    STATUS_COLORS = {"muted": T.TEXT_MUTED, "ok": T.SUCCESS, "err": T.ERROR}
+    
+    EDITABLE_COLUMNS = frozenset(
+        col for col, _, _, editable in PORTFOLIO_COLUMNS + BENCHMARK_COLUMNS if editable
+    )
+    
+    # Shared fonts: name -> (size, weight); built once as tkfont.Font objects in __init__
+    FONT_SPECS = {
+        "title": (16, "bold"),
+        "header": (12, "bold"),
+        "section": (11, "bold"),
+        "body": (10, "normal"),
+        "body_bold": (10, "bold"),
+        "small": (9, "normal"),
+        "small_bold": (9, "bold"),
+    }
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Portfolio Architect")
         self.root.geometry("1600x900")
         self.root.configure(bg=T.MAIN_BG)
         
+        # Font registry shared by reference across all widgets
+        self.F = {
+            name: tkfont.Font(root=self.root, family="Segoe UI", size=size, weight=weight)
+            for name, (size, weight) in self.FONT_SPECS.items()
+        }
+        
+        # Status dot images, shared by every table row
+        self._dot_images = {state: self._make_dot_image(color) for state, color in self.STATUS_COLORS.items()}
+        
         # Bind window close event
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
         
-        # State
-        self.ticker_rows = []
-        self.benchmark_rows = []
-        self.chart_vars = {}
+        # State (portfolio_tree / benchmark_tree are created in setup_ui)
+        self.portfolio_tree = None
+        self.benchmark_tree = None
+        self.chart_vars = {}  # chart number -> selected (bool)
+        
+        # Debounced scrollregion of the left panel canvas (after id, last bbox)
+        self._scrollregion_after = None
+        self._last_scrollregion = None
+        
+        # Market data label -> (text, color) last displayed
+        self._last_market_values = {}
+        
+        # Single reusable worker for Refresh; clicks during a fetch are ignored
+        self._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="market")
+        self._refresh_inflight = False
+        
+        # Sections built after the first paint (see setup_ui)
+        self._deferred_sections = []
+        self._left_scroll_frame = None
         
         # Initialize managers
         self.currency_manager = CurrencyManager(default_currency="USD")
@@ -94,6 +178,12 @@ class ChartControlPanel:
     def setup_ui(self):
         """Setup split-view UI"""
         
+        # Shared style for the portfolio/benchmark tables
+        style = ttk.Style(self.root)
+        style.configure("Portfolio.Treeview", font=self.F["body"], rowheight=24, background=T.CARD_BG, fieldbackground=T.CARD_BG)
+        style.configure("Portfolio.Treeview.Heading", font=self.F["small_bold"], foreground=T.TEXT_SECONDARY)
+        style.configure("Charts.Treeview", font=self.F["small"], rowheight=22, background=T.CARD_BG, fieldbackground=T.CARD_BG, borderwidth=0)
+        
         # Top toolbar
         self._create_toolbar()
         
@@ -109,12 +199,16 @@ class ChartControlPanel:
         right_panel = tk.Frame(main_container, bg=T.CARD_BG, relief=tk.RIDGE, bd=1)
         right_panel.place(relx=0.55, rely=0, relwidth=0.45, relheight=1)
         
-        # Populate panels
+        # First frame: toolbar, market data and portfolio positions
         self._create_left_panel(left_panel)
-        self._create_right_panel(right_panel)
         
-        # Bottom toolbar
-        self._create_bottom_toolbar()
+        # Sections below the fold are built one per idle pass, after the first paint
+        self._deferred_sections = [
+            lambda: self._create_benchmarks_section(self._left_scroll_frame),
+            lambda: self._create_right_panel(right_panel),
+            self._create_bottom_toolbar,
+        ]
+        self.root.after_idle(self._build_next_section)
         
         # Initialize data
         self.root.after(100, self._initialize_data)
@@ -132,7 +226,7 @@ class ChartControlPanel:
         tk.Label(
             title_frame,
             text="Portfolio Architect",
-            font=("Segoe UI", 16, "bold"),
+            font=self.F["title"],
             bg=T.HEADER,
             fg=T.TEXT_ON_DARK
         ).pack(anchor="w")
@@ -140,7 +234,7 @@ class ChartControlPanel:
         tk.Label(
             title_frame,
             text="Configure your portfolio and select analysis charts",
-            font=("Segoe UI", 9),
+            font=self.F["small"],
             bg=T.HEADER,
             fg=T.TEXT_SECONDARY
         ).pack(anchor="w")
@@ -152,7 +246,7 @@ class ChartControlPanel:
         tk.Label(
             capital_frame,
             text="Capital:",
-            font=("Segoe UI", 10),
+            font=self.F["body"],
             bg=T.HEADER,
             fg=T.TEXT_ON_DARK
         ).pack(side=tk.LEFT, padx=(0, 5))
@@ -162,7 +256,7 @@ class ChartControlPanel:
             capital_frame,
             textvariable=self.capital_var,
             width=12,
-            font=("Segoe UI", 10),
+            font=self.F["body"],
             bg=T.INPUT_BG,
             relief=tk.FLAT,
             bd=2
@@ -176,7 +270,7 @@ class ChartControlPanel:
             values=["USD", "EUR", "GBP", "JPY", "CHF"],
             width=8,
             state="readonly",
-            font=("Segoe UI", 10)
+            font=self.F["body"]
         )
         currency_menu.pack(side=tk.LEFT)
         
@@ -184,7 +278,7 @@ class ChartControlPanel:
         self.status_label = tk.Label(
             capital_frame,
             text="● Ready",
-            font=("Segoe UI", 10, "bold"),
+            font=self.F["body_bold"],
             bg=T.HEADER,
             fg="#4CAF50"
         )
@@ -201,10 +295,7 @@ class ChartControlPanel:
         scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, bg=T.MAIN_BG)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        scrollable_frame.bind("<Configure>", lambda e: self._schedule_scrollregion(canvas))
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -212,11 +303,29 @@ class ChartControlPanel:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Portfolio section
+        # Portfolio section (benchmarks are added later, see setup_ui)
         self._create_portfolio_section(scrollable_frame)
-        
-        # Benchmarks section
-        self._create_benchmarks_section(scrollable_frame)
+        self._left_scroll_frame = scrollable_frame
+    
+    def _build_next_section(self):
+        """Build one deferred section, then yield to the event loop before the next"""
+        self._deferred_sections.pop(0)()
+        if self._deferred_sections:
+            self.root.after_idle(self._build_next_section)
+    
+    def _schedule_scrollregion(self, canvas):
+        """Coalesce a burst of <Configure> events into one scrollregion update 30 ms later"""
+        if self._scrollregion_after:
+            self.root.after_cancel(self._scrollregion_after)
+        self._scrollregion_after = self.root.after(30, self._update_scrollregion, canvas)
+    
+    def _update_scrollregion(self, canvas):
+        """Walk the canvas items once and reconfigure only if the bbox changed"""
+        self._scrollregion_after = None
+        bbox = canvas.bbox("all")
+        if bbox != self._last_scrollregion:
+            self._last_scrollregion = bbox
+            canvas.configure(scrollregion=bbox)
     
     def _create_portfolio_section(self, parent):
         """Create portfolio positions section"""
@@ -231,7 +340,7 @@ class ChartControlPanel:
         tk.Label(
             header,
             text="📊 Portfolio Positions",
-            font=("Segoe UI", 12, "bold"),
+            font=self.F["header"],
             bg=T.PANEL_HEADER,
             fg=T.TEXT_ON_DARK
         ).pack(side=tk.LEFT, padx=5, pady=10)
@@ -244,7 +353,7 @@ class ChartControlPanel:
             btn = tk.Button(
                 action_frame,
                 text=text,
-                font=("Segoe UI", 9),
+                font=self.F["small"],
                 bg=T.SECONDARY_BG,
                 fg=T.TEXT_PRIMARY,
                 relief=tk.FLAT,
@@ -258,19 +367,8 @@ class ChartControlPanel:
         content = tk.Frame(section, bg=T.CARD_BG)
         content.pack(fill=tk.BOTH, expand=True, padx=5, pady=10)
         
-        # Table header
-        header_frame = tk.Frame(content, bg=T.CARD_BG)
-        header_frame.pack(fill=tk.X, pady=(0, 5))
-        
-        tk.Label(header_frame, text="#", font=("Segoe UI", 8, "bold"), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, width=2).pack(side=tk.LEFT, padx=1)
-        tk.Label(header_frame, text="Ticker/ISIN", font=("Segoe UI", 9, "bold"), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, anchor="w").pack(side=tk.LEFT, fill=tk.X, expand=True, padx=2)
-        tk.Label(header_frame, text="Weight %", font=("Segoe UI", 9, "bold"), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, anchor="w").pack(side=tk.LEFT, fill=tk.X, expand=True, padx=2)
-        tk.Label(header_frame, text="Amount", font=("Segoe UI", 9, "bold"), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, anchor="w").pack(side=tk.LEFT, fill=tk.X, expand=True, padx=2)
-        tk.Label(header_frame, text="", font=("Segoe UI", 9, "bold"), bg=T.CARD_BG, width=2).pack(side=tk.LEFT, padx=0)
-        
-        # Rows
-        for i in range(15):
-            self._create_portfolio_row(content, i)
+        # Single Treeview table (double-click a cell to edit)
+        self.portfolio_tree = self._create_table(content, self.PORTFOLIO_COLUMNS, 15)
         
         # Summary
         summary = tk.Frame(section, bg=T.HIGHLIGHT, height=40)
@@ -280,88 +378,12 @@ class ChartControlPanel:
         self.weight_total_label = tk.Label(
             summary,
             text="Total: 0%",
-            font=("Segoe UI", 10, "bold"),
+            font=self.F["body_bold"],
             bg=T.HIGHLIGHT,
             fg=T.TEXT_PRIMARY
         )
         self.weight_total_label.pack(side=tk.LEFT, padx=5)
     
-    def _create_portfolio_row(self, parent, idx):
-        """Create portfolio row - full width"""
-        row_frame = tk.Frame(parent, bg=T.CARD_BG)
-        row_frame.pack(fill=tk.BOTH, expand=True, pady=1, padx=0)
-        
-        # Row number (fixed width)
-        tk.Label(
-            row_frame,
-            text=f"{idx+1}.",
-            font=("Segoe UI", 9),
-            bg=T.CARD_BG,
-            fg=T.TEXT_MUTED,
-            width=2
-        ).pack(side=tk.LEFT, padx=(0, 1))
-        
-        # Ticker (50% of remaining space)
-        ticker_frame = tk.Frame(row_frame, bg=T.CARD_BG)
-        ticker_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=1)
-        
-        ticker_entry = tk.Entry(
-            ticker_frame,
-            font=("Segoe UI", 10),
-            bg=T.INPUT_BG,
-            fg=T.TEXT_PRIMARY,
-            relief=tk.FLAT,
-            bd=1
-        )
-        ticker_entry.pack(fill=tk.BOTH, expand=True)
-        
-        # Weight (expand to take more space)
-        weight_frame = tk.Frame(row_frame, bg=T.CARD_BG)
-        weight_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=1)
-        
-        weight_entry = tk.Entry(
-            weight_frame,
-            font=("Segoe UI", 10),
-            bg=T.INPUT_BG,
-            fg=T.TEXT_PRIMARY,
-            relief=tk.FLAT,
-            bd=1
-        )
-        weight_entry.pack(fill=tk.BOTH, expand=True)
-        
-        # Amount (expand to take more space)
-        amount_frame = tk.Frame(row_frame, bg=T.CARD_BG)
-        amount_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=1)
-        
-        amount_entry = tk.Entry(
-            amount_frame,
-            font=("Segoe UI", 10),
-            bg=T.INPUT_BG,
-            fg=T.TEXT_PRIMARY,
-            relief=tk.FLAT,
-            bd=1
-        )
-        amount_entry.pack(fill=tk.BOTH, expand=True)
-        
-        # Status (fixed width)
-        status_label = tk.Label(
-            row_frame,
-            text="•",
-            font=("Segoe UI", 12),
-            bg=T.CARD_BG,
-            fg=T.TEXT_MUTED,
-            width=2
-        )
-        status_label.pack(side=tk.LEFT, padx=(1, 0))
-        
-        self.ticker_rows.append({
-            "entry": ticker_entry,
-            "weight_entry": weight_entry,
-            "amount_entry": amount_entry,
-            "status": status_label,
-            "placeholder": f"Ticker {idx+1}"
-        })
-    
     def _create_benchmarks_section(self, parent):
         """Create benchmarks section"""
         section = tk.Frame(parent, bg=T.CARD_BG, relief=tk.FLAT, bd=0)
@@ -375,7 +397,7 @@ class ChartControlPanel:
         tk.Label(
             header,
             text="📈 Benchmark Indexes",
-            font=("Segoe UI", 11, "bold"),
+            font=self.F["section"],
             bg=T.PANEL_HEADER,
             fg=T.TEXT_ON_DARK
         ).pack(side=tk.LEFT, padx=5, pady=8)
@@ -384,51 +406,129 @@ class ChartControlPanel:
         content = tk.Frame(section, bg=T.CARD_BG)
         content.pack(fill=tk.BOTH, expand=True, padx=5, pady=10)
         
-        for i in range(10):
-            self._create_benchmark_row(content, i)
+        self.benchmark_tree = self._create_table(content, self.BENCHMARK_COLUMNS, 10)
     
-    def _create_benchmark_row(self, parent, idx):
-        """Create benchmark row - full width"""
-        row_frame = tk.Frame(parent, bg=T.CARD_BG)
-        row_frame.pack(fill=tk.BOTH, expand=True, pady=1, padx=0)
-        
-        # Row number (fixed width)
-        tk.Label(
-            row_frame,
-            text=f"{idx+1}.",
-            font=("Segoe UI", 9),
-            bg=T.CARD_BG,
-            fg=T.TEXT_MUTED,
-            width=2
-        ).pack(side=tk.LEFT, padx=(0, 1))
-        
-        # Benchmark entry (takes ALL remaining space)
-        bench_entry = tk.Entry(
-            row_frame,
-            font=("Segoe UI", 10),
-            bg=T.INPUT_BG,
-            fg=T.TEXT_PRIMARY,
-            relief=tk.FLAT,
-            bd=1
+    # -------------------- Editable Tables --------------------
+    
+    def _create_table(self, parent, columns, row_count):
+        """
+        Create a Treeview used as an editable grid
+        
+        Args:
+            parent: Parent widget
+            columns: Tuple of (column id, heading, width, editable)
+            row_count: Number of rows to pre-insert
+        
+        Returns:
+            ttk.Treeview: The table (row iids are "0".."row_count-1"; the tree
+            column #0 shows the status dot image)
+        """
+        tree = ttk.Treeview(
+            parent,
+            columns=tuple(col for col, _, _, _ in columns),
+            show=("tree", "headings"),
+            height=row_count,
+            selectmode="browse",
+            style="Portfolio.Treeview"
         )
-        bench_entry.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=1)
+        for col, heading, width, editable in columns:
+            tree.heading(col, text=heading, anchor="w")
+            tree.column(col, width=width, stretch=editable, anchor="w" if editable else "center")
+        tree.column("#0", width=28, stretch=False)
+        
+        blank = tuple("" for _ in columns[1:])
+        muted = self._dot_images["muted"]
+        for i in range(row_count):
+            tree.insert("", "end", iid=str(i), image=muted, values=(f"{i+1}.",) + blank)
+        
+        tree.bind("<Double-1>", self._begin_cell_edit)
+        tree.pack(fill=tk.BOTH, expand=True)
+        return tree
+    
+    def _begin_cell_edit(self, event):
+        """Overlay a transient Entry on the double-clicked cell; writes back on Return/FocusOut"""
+        tree = event.widget
+        iid = tree.identify_row(event.y)
+        column = tree.identify_column(event.x)
+        if not iid or column in ("", "#0"):  # #0 is the status dot column
+            return
+        
+        col = tree["columns"][int(column[1:]) - 1]
+        if col not in self.EDITABLE_COLUMNS:
+            return
+        
+        bbox = tree.bbox(iid, column)
+        if not bbox:
+            return
+        x, y, width, height = bbox
+        
+        editor = tk.Entry(tree, font=self.F["body"], bg=T.INPUT_BG, fg=T.TEXT_PRIMARY, relief=tk.FLAT, bd=1)
+        editor.insert(0, tree.set(iid, col))
+        editor.select_range(0, tk.END)
+        editor.place(x=x, y=y, width=width, height=height)
+        editor.focus_set()
+        
+        def close(save):
+            if not editor.winfo_exists():
+                return
+            if save:
+                tree.set(iid, col, editor.get().strip())
+            editor.destroy()
+        
+        editor.bind("<Return>", lambda e: close(True))
+        editor.bind("<FocusOut>", lambda e: close(True))
+        editor.bind("<Escape>", lambda e: close(False))
+    
+    def get_ticker(self, idx):
+        """
+        Get the ticker typed in a portfolio row
         
-        # Status (fixed width)
-        status_label = tk.Label(
-            row_frame,
-            text="•",
-            font=("Segoe UI", 12),
-            bg=T.CARD_BG,
-            fg=T.TEXT_MUTED,
-            width=2
-        )
-        status_label.pack(side=tk.LEFT, padx=(1, 0))
+        Args:
+            idx: Row index
+        
+        Returns:
+            str: Ticker text (empty if the row is unused)
+        """
+        return self.portfolio_tree.set(str(idx), "ticker")
+    
+    def get_benchmark(self, idx):
+        """
+        Get the symbol typed in a benchmark row
         
-        self.benchmark_rows.append({
-            "entry": bench_entry,
-            "status": status_label,
-            "placeholder": f"Benchmark {idx+1}"
-        })
+        Args:
+            idx: Row index
+        
+        Returns:
+            str: Benchmark text (empty if the row is unused)
+        """
+        return self.benchmark_tree.set(str(idx), "benchmark")
+    
+    def set_status(self, idx, state, tree=None):
+        """
+        Set a row's status dot
+        
+        Args:
+            idx: Row index
+            state: "muted", "ok" or "err" (see STATUS_COLORS)
+            tree: Table to update (defaults to the portfolio table)
+        """
+        tree = tree or self.portfolio_tree
+        tree.item(str(idx), image=self._dot_images[state])
+    
+    def _make_dot_image(self, color):
+        """
+        Draw an 8x8 filled dot
+        
+        Args:
+            color: Dot color
+        
+        Returns:
+            tk.PhotoImage: Icon with a transparent background
+        """
+        img = tk.PhotoImage(width=8, height=8)
+        for y, (x0, x1) in enumerate(((2, 6), (1, 7), (0, 8), (0, 8), (0, 8), (0, 8), (1, 7), (2, 6))):
+            img.put(color, to=(x0, y, x1, y + 1))
+        return img
     
     def _create_market_data_section(self, parent):
         """Create market data section with forex rates and major indexes"""
@@ -443,7 +543,7 @@ class ChartControlPanel:
         tk.Label(
             header,
             text="💱 Market Data - Real-time Prices",
-            font=("Segoe UI", 11, "bold"),
+            font=self.F["section"],
             bg=T.PANEL_HEADER,
             fg=T.TEXT_ON_DARK
         ).pack(side=tk.LEFT, padx=5, pady=8)
@@ -452,7 +552,7 @@ class ChartControlPanel:
         self.market_refresh_btn = tk.Button(
             header,
             text="Refresh",
-            font=("Segoe UI", 9),
+            font=self.F["small"],
             bg=T.PRIMARY,
             fg=T.TEXT_ON_DARK,
             relief=tk.FLAT,
@@ -474,7 +574,7 @@ class ChartControlPanel:
         tk.Label(
             forex_frame,
             text="Forex Rates (vs USD)",
-            font=("Segoe UI", 9, "bold"),
+            font=self.F["small_bold"],
             bg=T.CARD_BG,
             fg=T.TEXT_PRIMARY,
             anchor="w"
@@ -488,7 +588,7 @@ class ChartControlPanel:
             tk.Label(
                 row,
                 text=f"{currency}/USD:",
-                font=("Segoe UI", 9),
+                font=self.F["small"],
                 bg=T.CARD_BG,
                 fg=T.TEXT_SECONDARY,
                 width=10,
@@ -498,7 +598,7 @@ class ChartControlPanel:
             value_label = tk.Label(
                 row,
                 text="Loading...",
-                font=("Segoe UI", 9),
+                font=self.F["small"],
                 bg=T.CARD_BG,
                 fg=T.TEXT_PRIMARY,
                 anchor="e"
@@ -513,7 +613,7 @@ class ChartControlPanel:
         tk.Label(
             indexes_frame,
             text="Major Indexes",
-            font=("Segoe UI", 9, "bold"),
+            font=self.F["small_bold"],
             bg=T.CARD_BG,
             fg=T.TEXT_PRIMARY,
             anchor="w"
@@ -537,7 +637,7 @@ class ChartControlPanel:
             tk.Label(
                 row,
                 text=f"{name}:",
-                font=("Segoe UI", 9),
+                font=self.F["small"],
                 bg=T.CARD_BG,
                 fg=T.TEXT_SECONDARY,
                 width=12,
@@ -547,7 +647,7 @@ class ChartControlPanel:
             value_label = tk.Label(
                 row,
                 text="Loading...",
-                font=("Segoe UI", 9),
+                font=self.F["small"],
                 bg=T.CARD_BG,
                 fg=T.TEXT_PRIMARY,
                 anchor="e"
@@ -566,7 +666,7 @@ class ChartControlPanel:
         tk.Label(
             header,
             text="📊 Analysis Charts Selection",
-            font=("Segoe UI", 12, "bold"),
+            font=self.F["header"],
             bg=T.PANEL_HEADER,
             fg=T.TEXT_ON_DARK
         ).pack(side=tk.LEFT, padx=15, pady=10)
@@ -578,7 +678,7 @@ class ChartControlPanel:
         tk.Button(
             actions_frame,
             text="All",
-            font=("Segoe UI", 9),
+            font=self.F["small"],
             bg=T.SECONDARY_BG,
             fg=T.TEXT_PRIMARY,
             relief=tk.FLAT,
@@ -591,7 +691,7 @@ class ChartControlPanel:
         tk.Button(
             actions_frame,
             text="None",
-            font=("Segoe UI", 9),
+            font=self.F["small"],
             bg=T.SECONDARY_BG,
             fg=T.TEXT_PRIMARY,
             relief=tk.FLAT,
@@ -601,92 +701,62 @@ class ChartControlPanel:
             command=self._deselect_all_charts
         ).pack(side=tk.LEFT, padx=2)
         
-        # Scrollable content
-        canvas = tk.Canvas(parent, bg=T.CARD_BG, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg=T.CARD_BG)
+        # Chart list: one Treeview (category nodes, checkable chart items)
+        self._check_images = {True: self._make_check_image(True), False: self._make_check_image(False)}
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self.chart_tree = ttk.Treeview(parent, show="tree", selectmode="none", style="Charts.Treeview")
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.chart_tree.yview)
+        self.chart_tree.configure(yscrollcommand=scrollbar.set)
+        self.chart_tree.tag_configure("category", font=self.F["small_bold"], background=T.SECONDARY_BG)
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Fill before packing so the tree is laid out once
+        for category_name, items in self.CHART_LAYOUT:
+            self._create_chart_category(self.chart_tree, category_name, items)
         
-        canvas.pack(side="left", fill="both", expand=True, padx=0, pady=10)
+        self.chart_tree.pack(side="left", fill="both", expand=True, padx=0, pady=10)
         scrollbar.pack(side="right", fill="y")
         
-        # Create categories with charts in 2 columns
-        for category_name, chart_ids in self.CHART_GROUPS.items():
-            self._create_chart_category(scrollable_frame, category_name, chart_ids)
+        self.chart_tree.bind("<Button-1>", self._on_chart_click)
     
-    def _create_chart_category(self, parent, category_name, chart_ids):
-        """Create a chart category with charts in 2 columns"""
-        # Category header
-        category_header = tk.Frame(parent, bg=T.SECONDARY_BG, height=25)
-        category_header.pack(fill=tk.X, pady=(5, 2), padx=0)
-        category_header.pack_propagate(False)
-        
-        tk.Label(
-            category_header,
-            text=category_name,
-            font=("Segoe UI", 9, "bold"),
-            bg=T.SECONDARY_BG,
-            fg=T.TEXT_PRIMARY,
-            anchor="w"
-        ).pack(side=tk.LEFT, padx=1, fill=tk.BOTH, expand=True)
-        
-        # Container for 2 columns
-        charts_container = tk.Frame(parent, bg=T.CARD_BG)
-        charts_container.pack(fill=tk.X, padx=0, pady=0)
-        
-        # Split charts into 2 columns
-        mid = (len(chart_ids) + 1) // 2  # Split in half (round up)
-        
-        # Left column - MAXIMUM width
-        left_col = tk.Frame(charts_container, bg=T.CARD_BG)
-        left_col.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(1, 1))
-        
-        for chart_id in chart_ids[:mid]:
-            self._create_chart_item(left_col, chart_id)
-        
-        # Right column - MAXIMUM width  
-        right_col = tk.Frame(charts_container, bg=T.CARD_BG)
-        right_col.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(1, 1))
-        
-        for chart_id in chart_ids[mid:]:
-            self._create_chart_item(right_col, chart_id)
+    def _make_check_image(self, checked):
+        """
+        Draw a 12x12 checkbox icon
+        
+        Args:
+            checked: True for a filled box, False for an empty one
+        
+        Returns:
+            tk.PhotoImage: Icon (keep a reference, Tk does not)
+        """
+        img = tk.PhotoImage(width=12, height=12)
+        img.put(T.BORDER, to=(0, 0, 12, 12))
+        img.put(T.PRIMARY if checked else T.CARD_BG, to=(1, 1, 11, 11))
+        if checked:
+            img.put(T.TEXT_ON_DARK, to=(4, 4, 8, 8))
+        return img
     
-    def _create_chart_item(self, parent, chart_id):
-        """Create a single chart checkbox - full width"""
-        item_frame = tk.Frame(parent, bg=T.CARD_BG)
-        item_frame.pack(fill=tk.BOTH, expand=True, pady=1, padx=0)
-        
-        # Initialize variable
-        if chart_id not in self.chart_vars:
-            self.chart_vars[chart_id] = tk.BooleanVar(value=True)
-        
-        # Checkbox (fixed width on left)
-        cb = tk.Checkbutton(
-            item_frame,
-            variable=self.chart_vars[chart_id],
-            bg=T.CARD_BG,
-            activebackground=T.CARD_BG,
-            font=("Segoe UI", 9)
-        )
-        cb.pack(side=tk.LEFT, padx=(1, 0))
-        
-        # Chart number and name (takes ALL remaining space to the edge)
-        chart_text = f"{chart_id}. {self.CHART_NAMES[chart_id]}"
-        tk.Label(
-            item_frame,
-            text=chart_text,
-            font=("Segoe UI", 9),
-            bg=T.CARD_BG,
-            fg=T.TEXT_PRIMARY,
-            anchor="w"
-        ).pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(1, 0))
+    def _create_chart_category(self, tree, category_name, items):
+        """Create a category node with its charts (CHART_LAYOUT items) as children"""
+        group = tree.insert("", "end", text=category_name, open=True, tags=("category",))
+        for chart_id, iid, label in items:
+            self._create_chart_item(tree, group, chart_id, iid, label)
+    
+    def _create_chart_item(self, tree, group, chart_id, iid, label):
+        """Create a single checkable chart item (iid is the chart number)"""
+        selected = self.chart_vars.setdefault(chart_id, True)
+        tree.insert(group, "end", iid=iid, text=label, image=self._check_images[selected])
+    
+    def _on_chart_click(self, event):
+        """Toggle the chart under the pointer (category rows use generated iids)"""
+        iid = self.chart_tree.identify_row(event.y)
+        if iid.isdigit():
+            chart_id = int(iid)
+            self._set_chart(chart_id, not self.chart_vars[chart_id])
+    
+    def _set_chart(self, chart_id, selected):
+        """Update the selection dict and the item's checkbox icon"""
+        self.chart_vars[chart_id] = selected
+        self.chart_tree.item(str(chart_id), image=self._check_images[selected])
     
     def _create_bottom_toolbar(self):
         """Create bottom toolbar"""
@@ -705,7 +775,7 @@ class ChartControlPanel:
         tk.Button(
             btn_frame,
             text="📊 Run Portfolio Analysis",
-            font=("Segoe UI", 12, "bold"),
+            font=self.F["header"],
             bg=T.PRIMARY,
             fg=T.TEXT_ON_DARK,
             relief=tk.FLAT,
@@ -717,13 +787,20 @@ class ChartControlPanel:
     
     def _select_all_charts(self):
         """Select all charts"""
-        for var in self.chart_vars.values():
-            var.set(True)
+        self._set_all_charts(True)
     
     def _deselect_all_charts(self):
         """Deselect all charts"""
-        for var in self.chart_vars.values():
-            var.set(False)
+        self._set_all_charts(False)
+    
+    def _set_all_charts(self, selected):
+        """Set every chart at once; only items whose state changes get a new icon"""
+        changed = [chart_id for chart_id, state in self.chart_vars.items() if state != selected]
+        self.chart_vars = dict.fromkeys(self.chart_vars, selected)
+        
+        image = self._check_images[selected]
+        for chart_id in changed:
+            self.chart_tree.item(str(chart_id), image=image)
     
     def _initialize_data(self):
         """Initialize data and managers"""
@@ -731,67 +808,73 @@ class ChartControlPanel:
         self._refresh_market_data()
     
     def _refresh_market_data(self):
-        """Refresh forex rates and major indexes"""
+        """Refresh forex rates and major indexes (ignored while a refresh is in flight)"""
+        if self._refresh_inflight:
+            return
+        self._refresh_inflight = True
         self.market_refresh_btn.config(text="Loading...", state=tk.DISABLED, bg=T.TEXT_SECONDARY)
         
         def fetch_data():
-            try:
-                print("Fetching market data...")
-                # Fetch forex rates
-                forex_rates = get_current_forex_rates()
-                print(f"Forex rates: {forex_rates}")
-                
-                # Fetch major indexes
-                indexes_prices = get_major_indexes_prices()
-                print(f"Indexes prices: {indexes_prices}")
-                
-                # Update UI
-                self.root.after(0, lambda: self._update_market_data(forex_rates, indexes_prices))
-            except Exception as e:
-                print(f"ERROR fetching market data: {e}")
-                import traceback
-                traceback.print_exc()
-                self.root.after(0, lambda: self.market_refresh_btn.config(text="Error", state=tk.NORMAL, bg=T.ERROR))
-        
-        import threading
-        thread = threading.Thread(target=fetch_data, daemon=True)
-        thread.start()
+            log.debug("Fetching market data...")
+            # Forex rates and major indexes are independent: fetch both at once
+            fx_future = _EXECUTOR.submit(get_current_forex_rates)
+            ix_future = _EXECUTOR.submit(get_major_indexes_prices)
+            forex_rates = fx_future.result(timeout=FETCH_TIMEOUT)
+            indexes_prices = ix_future.result(timeout=FETCH_TIMEOUT)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Forex rates: %s", forex_rates)
+                log.debug("Indexes prices: %s", indexes_prices)
+            return forex_rates, indexes_prices
+        
+        future = self._refresh_executor.submit(fetch_data)
+        future.add_done_callback(lambda f: self.root.after(0, self._on_market_data_fetched, f))
+    
+    def _on_market_data_fetched(self, future):
+        """Tk thread: apply a finished refresh and allow the next one"""
+        self._refresh_inflight = False
+        if future.cancelled():
+            return
+        
+        error = future.exception()
+        if error is not None:
+            log.error("Market data fetch failed", exc_info=error)
+            self.market_refresh_btn.config(text="Error", state=tk.NORMAL, bg=T.ERROR)
+            return
+        
+        self._update_market_data(*future.result())
     
     def _update_market_data(self, forex_rates, indexes_prices):
         """Update market data in UI"""
-        print("Updating UI with market data...")
-        
-        # Update forex rates
+        # Format every value first: label -> (text, color)
+        updates = {}
         if isinstance(forex_rates, dict):
-            # Handle forex data
-            for key, value in forex_rates.items():
-                if key == 'EURUSD' and 'EUR' in self.forex_labels:
-                    self.forex_labels['EUR'].config(text=f"{value:.4f}", fg=T.TEXT_PRIMARY)
-                    print(f"Updated EUR: {value:.4f}")
-                elif key == 'GBPUSD' and 'GBP' in self.forex_labels:
-                    self.forex_labels['GBP'].config(text=f"{value:.4f}", fg=T.TEXT_PRIMARY)
-                    print(f"Updated GBP: {value:.4f}")
-        
-        # Update indexes - handle the 'indexes' list format
+            for key, currency in (("EURUSD", "EUR"), ("GBPUSD", "GBP")):
+                value = forex_rates.get(key)
+                if value is not None and currency in self.forex_labels:
+                    updates[self.forex_labels[currency]] = (f"{value:.4f}", T.TEXT_PRIMARY)
+        
+        # Indexes - handle the 'indexes' list format
         if isinstance(indexes_prices, dict) and 'indexes' in indexes_prices:
             for index_data in indexes_prices['indexes']:
-                symbol = index_data.get('symbol')
-                if symbol in self.index_labels:
-                    price = index_data.get('price')
-                    if price and price > 0:
-                        change = index_data.get('change', 0)
-                        color = "#4CAF50" if change >= 0 else "#f44336"
-                        self.index_labels[symbol].config(
-                            text=f"{price:,.0f}",
-                            fg=color
-                        )
-                        print(f"Updated {symbol}: {price:,.0f}")
-                    else:
-                        self.index_labels[symbol].config(text="N/A", fg=T.ERROR)
+                label = self.index_labels.get(index_data.get('symbol'))
+                if label is None:
+                    continue
+                price = index_data.get('price')
+                if price and price > 0:
+                    color = "#4CAF50" if index_data.get('change', 0) >= 0 else "#f44336"
+                    updates[label] = (f"{price:,.0f}", color)
+                else:
+                    updates[label] = ("N/A", T.ERROR)
+        
+        # Touch only labels whose displayed value changed since the last refresh
+        for label, shown in updates.items():
+            if self._last_market_values.get(label) != shown:
+                self._last_market_values[label] = shown
+                label.config(text=shown[0], fg=shown[1])
         
         # Re-enable button
         self.market_refresh_btn.config(text="Refresh", state=tk.NORMAL, bg=T.PRIMARY)
-        print("Market data update complete")
+        log.debug("Market data update complete")
     
     def run_analysis(self):
         """Run portfolio analysis"""
@@ -799,6 +882,7 @@ class ChartControlPanel:
     
     def _on_closing(self):
         """Handle window closing"""
+        self._refresh_executor.shutdown(wait=False, cancel_futures=True)
         if self.market_data_manager:
             self.market_data_manager.cleanup()
         self.root.destroy()
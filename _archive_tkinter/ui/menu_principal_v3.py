@@ -19,7 +19,7 @@ from ui.theme_colors import LightPremiumTheme as T
 from managers.currency_manager import CurrencyManager
 from managers.portfolio_manager import PortfolioManager
 from managers.market_data_manager import MarketDataManager
-from utils.utils_data import get_current_forex_rates, get_major_indexes_prices
+from utils.utils_data import FOREX_SYMBOLS, get_market_snapshot
 import threading
 
 
@@ -124,6 +124,11 @@ class CompactPortfolioPanel:
         # Setup UI
         self.setup_ui()
         
+        # Every market data symbol, fetched together on each refresh
+        self._forex_symbols = {FOREX_SYMBOLS[c]: c for c in self.forex_labels}
+        self._all_market_symbols = (list(self._forex_symbols) + list(self.commodity_labels)
+                                    + list(self.bond_labels) + list(self.index_labels))
+        
         # Initialize symbol handler after UI is created
         self._init_symbol_handler()
         
@@ -445,22 +450,16 @@ class CompactPortfolioPanel:
         tk.Label(top_row, text=str(idx+1), font=("Segoe UI", 8), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, width=2).pack(side=tk.LEFT, padx=1)
         
         # Ticker
-        ticker_frame = tk.Frame(top_row, bg=T.CARD_BG)
-        ticker_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=2)
-        ticker_entry = tk.Entry(ticker_frame, font=("Segoe UI", 10), bg=T.INPUT_BG, fg=T.TEXT_PRIMARY, relief=tk.FLAT, bd=1)
-        ticker_entry.pack(fill=tk.BOTH, expand=True)
+        ticker_entry = tk.Entry(top_row, font=("Segoe UI", 10), bg=T.INPUT_BG, fg=T.TEXT_PRIMARY, relief=tk.FLAT, bd=1)
+        ticker_entry.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=2)
         
         # Weight %
-        weight_frame = tk.Frame(top_row, bg=T.CARD_BG)
-        weight_frame.pack(side=tk.LEFT, padx=2)
-        weight_entry = tk.Entry(weight_frame, font=("Segoe UI", 10), bg=T.INPUT_BG, fg=T.TEXT_PRIMARY, relief=tk.FLAT, bd=1, width=10)
-        weight_entry.pack(fill=tk.BOTH, expand=True)
+        weight_entry = tk.Entry(top_row, font=("Segoe UI", 10), bg=T.INPUT_BG, fg=T.TEXT_PRIMARY, relief=tk.FLAT, bd=1, width=10)
+        weight_entry.pack(side=tk.LEFT, padx=2)
         
         # Amount
-        amount_frame = tk.Frame(top_row, bg=T.CARD_BG)
-        amount_frame.pack(side=tk.LEFT, padx=2)
-        amount_entry = tk.Entry(amount_frame, font=("Segoe UI", 10), bg=T.INPUT_BG, fg=T.TEXT_PRIMARY, relief=tk.FLAT, bd=1, width=10)
-        amount_entry.pack(fill=tk.BOTH, expand=True)
+        amount_entry = tk.Entry(top_row, font=("Segoe UI", 10), bg=T.INPUT_BG, fg=T.TEXT_PRIMARY, relief=tk.FLAT, bd=1, width=10)
+        amount_entry.pack(side=tk.LEFT, padx=2)
         
         # Status
         status_label = tk.Label(top_row, text="●", font=("Segoe UI", 10), bg=T.CARD_BG, fg=T.BORDER, width=2)
@@ -1056,14 +1055,52 @@ class CompactPortfolioPanel:
         """Refresh market data in background"""
         def fetch():
             print("Fetching market data...")
-            forex_rates = get_current_forex_rates()
-            indexes_prices = get_major_indexes_prices()
+            quotes = get_market_snapshot(self._all_market_symbols)
+            forex_rates, indexes_prices = self._split_market_snapshot(quotes)
             print(f"Forex rates: {forex_rates}")
             print(f"Indexes prices: {indexes_prices}")
             self.root.after(0, lambda: self._update_market_data(forex_rates, indexes_prices))
         
         threading.Thread(target=fetch, daemon=True).start()
     
+    def _split_market_snapshot(self, quotes):
+        """
+        Reshape one batched quote download into the forex/indexes results used by _update_market_data
+        
+        Args:
+            quotes: {yahoo_symbol: (price, change_pts, change_pct)} from get_market_snapshot
+        
+        Returns:
+            tuple: (forex_rates, indexes_prices) shaped like get_current_forex_rates
+                   and get_major_indexes_prices
+        """
+        forex_rates = {'success': False}
+        for yahoo_symbol, currency in self._forex_symbols.items():
+            if yahoo_symbol not in quotes:
+                continue
+            rate, change_pts, change_pct = quotes[yahoo_symbol]
+            key = f"{currency}USD"
+            forex_rates[key] = round(rate, 4)
+            forex_rates[f"{key}_change_pct"] = round(change_pct, 2)
+            forex_rates[f"{key}_change_pts"] = round(change_pts, 4)
+            forex_rates['success'] = True
+        
+        indexes = []
+        for symbol in self._all_market_symbols:
+            if symbol in self._forex_symbols or symbol not in quotes:
+                continue
+            price, change_pts, change_pct = quotes[symbol]
+            indexes.append({
+                'symbol': symbol,
+                'price': round(price, 2),
+                'change_pct': round(change_pct, 2),
+                'change_pts': round(change_pts, 2),
+                'success': True
+            })
+        indexes_prices = {'indexes': indexes, 'success': bool(indexes)}
+        
+        return forex_rates, indexes_prices
+    
     def _update_market_data(self, forex_rates, indexes_prices):
         """Update UI with market data including % change with colors"""
         print("Updating UI with market data...")
@@ -1072,6 +1109,8 @@ class CompactPortfolioPanel:
             if forex_rates and forex_rates.get('success'):
                 for currency in ["EUR", "GBP", "JPY", "CHF"]:
                     key = f"{currency}USD"
+                    if forex_rates.get(key) is None:
+                        continue
                     value = forex_rates.get(key, 0)
                     change_pct = forex_rates.get(f"{key}_change_pct", 0)
                     change_pts = forex_rates.get(f"{key}_change_pts", 0)
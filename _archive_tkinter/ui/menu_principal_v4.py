@@ -9,6 +9,7 @@ from tkinter import ttk, messagebox
 import sys
 import os
 import threading
+import queue
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -25,12 +26,71 @@ from ui.theme_colors import LightPremiumTheme as T
 from managers.currency_manager import CurrencyManager
 from managers.portfolio_manager import PortfolioManager
 from managers.market_data_manager import MarketDataManager
-from utils.utils_data import get_current_forex_rates, get_major_indexes_prices
+from utils.utils_data import FOREX_SYMBOLS, get_market_snapshot
+
+
+# Chart names/descriptions indexed by chart number (index 0 unused)
+_CHART_NAMES = (
+    None,
+    "Allocation", "Correlation", "Risk Contrib", "vs Benchmarks", "Sector Decomp", "Sector Risk",
+    "MC Normal", "MC Random", "Vol Normal", "Vol Random", "DD Normal", "DD Random",
+    "VaR 95%", "ES", "DD Duration", "Calmar", "Sharpe Ratio", "Risk vs Idx",
+    "Fwd Excess", "Port vs B. (N)", "Port vs B. (R)", "Sector Perf", "Regime", "Rotation",
+)
+
+_CHART_DESCRIPTIONS = (
+    None,
+    "Shows weight distribution across portfolio assets",
+    "Correlation matrix between all assets",
+    "Individual asset contribution to total risk",
+    "Compare portfolio performance vs benchmarks",
+    "Portfolio breakdown by market sectors",
+    "Risk distribution across different sectors",
+    "Monte Carlo simulation with normal distribution",
+    "Monte Carlo simulation with random walk",
+    "Volatility forecast using normal distribution",
+    "Volatility forecast using random scenarios",
+    "Maximum drawdown paths (normal dist.)",
+    "Maximum drawdown paths (random dist.)",
+    "Value at Risk at 95% confidence",
+    "Expected Shortfall beyond VaR threshold",
+    "Duration of maximum drawdown periods",
+    "Calmar ratio (return/max drawdown)",
+    "Sharpe Ratio (risk-adjusted return efficiency)",
+    "Risk-return comparison with major indexes",
+    "Forward looking excess return analysis",
+    "Portfolio vs benchmark (normal scenario)",
+    "Portfolio vs benchmark (random scenario)",
+    "Individual sector performance analysis",
+    "Market regime detection and analysis",
+    "Sector rotation patterns over time",
+)
+
+
+def _build_chart_items(groups, names, descriptions):
+    """
+    Precompute the chart selector rows for each category
+    
+    Args:
+        groups: Dict of category name -> list of chart numbers
+        names: Chart names indexed by chart number
+        descriptions: Chart descriptions indexed by chart number
+    
+    Returns:
+        dict: category -> ((chart_num, label, description), ...)
+    """
+    return {
+        category: tuple((num, f"{num}. {names[num]}", descriptions[num]) for num in nums)
+        for category, nums in groups.items()
+    }
 
 
 class TwoPagePortfolioArchitect:
     """Two-page Portfolio Architect with Tabs"""
     
+    # Market data auto-refresh period
+    MARKET_REFRESH_SECONDS = 5
+    
     # Chart groups
     CHART_GROUPS = {
         "Portfolio & Sector": [1, 2, 3, 4, 5, 6],
@@ -40,43 +100,7 @@ class TwoPagePortfolioArchitect:
         "Sector & Regime": [22, 23, 24],
     }
     
-    CHART_NAMES = {
-        1: "Allocation", 2: "Correlation", 3: "Risk Contrib",
-        4: "vs Benchmarks", 5: "Sector Decomp", 6: "Sector Risk",
-        7: "MC Normal", 8: "MC Random", 9: "Vol Normal",
-        10: "Vol Random", 11: "DD Normal", 12: "DD Random",
-        13: "VaR 95%", 14: "ES", 15: "DD Duration", 16: "Calmar",
-        17: "Sharpe Ratio", 18: "Risk vs Idx", 19: "Fwd Excess", 
-        20: "Port vs B. (N)", 21: "Port vs B. (R)", 22: "Sector Perf", 
-        23: "Regime", 24: "Rotation"
-    }
-    
-    CHART_DESCRIPTIONS = {
-        1: "Shows weight distribution across portfolio assets", 
-        2: "Correlation matrix between all assets", 
-        3: "Individual asset contribution to total risk",
-        4: "Compare portfolio performance vs benchmarks", 
-        5: "Portfolio breakdown by market sectors", 
-        6: "Risk distribution across different sectors",
-        7: "Monte Carlo simulation with normal distribution", 
-        8: "Monte Carlo simulation with random walk", 
-        9: "Volatility forecast using normal distribution",
-        10: "Volatility forecast using random scenarios", 
-        11: "Maximum drawdown paths (normal dist.)", 
-        12: "Maximum drawdown paths (random dist.)",
-        13: "Value at Risk at 95% confidence", 
-        14: "Expected Shortfall beyond VaR threshold", 
-        15: "Duration of maximum drawdown periods", 
-        16: "Calmar ratio (return/max drawdown)",
-        17: "Sharpe Ratio (risk-adjusted return efficiency)",
-        18: "Risk-return comparison with major indexes", 
-        19: "Forward looking excess return analysis", 
-        20: "Portfolio vs benchmark (normal scenario)",
-        21: "Portfolio vs benchmark (random scenario)", 
-        22: "Individual sector performance analysis", 
-        23: "Market regime detection and analysis",
-        24: "Sector rotation patterns over time"
-    }
+    CHART_ITEMS = _build_chart_items(CHART_GROUPS, _CHART_NAMES, _CHART_DESCRIPTIONS)
     
     def __init__(self, root):
         self.root = root
@@ -109,6 +133,12 @@ class TwoPagePortfolioArchitect:
         self.benchmark_rows = []
         self.chart_vars = {}
         
+        # Pending weight/amount recomputes (one after() job per event class)
+        self._pending_weight_job = None
+        self._pending_weight_rows = set()
+        self._pending_amount_job = None
+        self._pending_amount_rows = set()
+        
         # Local hints for autocomplete
         self.local_ticker_hints = [
             "NVDA", "AAPL", "MSFT", "GOOG", "AMZN", "TSLA", "META", "PLTR",
@@ -130,15 +160,26 @@ class TwoPagePortfolioArchitect:
         self.index_labels = {}
         self.commodity_labels = {}
         self.bond_labels = {}
+        self._market_snapshot = {}
+        self._refresh_q = queue.Queue()
+        
+        # Secondary panels built after the first paint (see _build_next_section)
+        self._deferred_sections = []
         
         # Setup UI
         self.setup_ui()
         
+        # Every market data symbol, fetched together on each refresh
+        self._forex_symbols = {FOREX_SYMBOLS[c]: c for c in self.forex_labels}
+        self._all_market_symbols = (list(self._forex_symbols) + list(self.commodity_labels)
+                                    + list(self.bond_labels) + list(self.index_labels))
+        
         # Initialize symbol handler after UI is created
         self._init_symbol_handler()
         
-        # Start automatic refresh
-        self._start_auto_refresh()
+        # Benchmarks, chart selector, then automatic refresh stream in once idle
+        self._deferred_sections.append(self._start_auto_refresh)
+        self.root.after_idle(self._build_next_section)
     
     def setup_ui(self):
         """Create the two-page tabbed interface"""
@@ -169,7 +210,7 @@ class TwoPagePortfolioArchitect:
         # PAGE 2: Charts Selection
         page2 = tk.Frame(self.notebook, bg=T.MAIN_BG)
         self.notebook.add(page2, text='  📈 Analysis Charts  ')
-        self._create_page2_charts_selection(page2)
+        self._deferred_sections.append(lambda: self._create_page2_charts_selection(page2))
         
         # Bottom button (always visible)
         self._create_run_button()
@@ -238,7 +279,19 @@ class TwoPagePortfolioArchitect:
         # Right: Benchmarks
         benchmark_frame = tk.Frame(positions_container, bg=T.MAIN_BG)
         benchmark_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
-        self._create_benchmarks(benchmark_frame)
+        self._deferred_sections.append(lambda: self._create_deferred_benchmarks(benchmark_frame))
+    
+    def _create_deferred_benchmarks(self, parent):
+        """Build the benchmark rows after first paint and hook them to the symbol handler"""
+        self._create_benchmarks(parent)
+        if self.symbol_handler:
+            self._rebind_symbol_callbacks()
+    
+    def _build_next_section(self):
+        """Build one deferred section, then yield to the event loop before the next"""
+        self._deferred_sections.pop(0)()
+        if self._deferred_sections:
+            self.root.after_idle(self._build_next_section)
     
     def _create_page2_charts_selection(self, parent):
         """PAGE 2: Analysis Charts Selection (full screen)"""
@@ -271,148 +324,73 @@ class TwoPagePortfolioArchitect:
         tk.Label(header, text="💱 Market Data - Real-time Prices", font=("Segoe UI", 11, "bold"), 
                 bg=T.PANEL_HEADER, fg=T.TEXT_ON_DARK).pack(side=tk.LEFT, padx=5, pady=8)
         
+        tk.Button(header, text="⟳ Refresh", font=("Segoe UI", 8), bg=T.PANEL_HEADER, fg=T.TEXT_ON_DARK,
+                 relief=tk.FLAT, cursor="hand2", command=self._refresh_market_data).pack(side=tk.RIGHT, padx=5)
+        
         # Content - Split in THREE columns
         content = tk.Frame(section, bg=T.CARD_BG)
         content.pack(fill=tk.BOTH, expand=True, padx=5, pady=10)
         
-        # LEFT COLUMN: Forex + Commodities
+        # LEFT COLUMN: Forex + Commodities + Bonds
         left_column = tk.Frame(content, bg=T.CARD_BG)
         left_column.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
-        # Forex Rates subsection
-        tk.Label(left_column, text="Forex Rates (vs USD)", font=("Segoe UI", 9, "bold"), 
-                bg=T.CARD_BG, fg=T.TEXT_PRIMARY, anchor="w").pack(fill=tk.X, pady=(0, 3))
-        
-        for currency in ["EUR", "GBP", "JPY", "CHF"]:
-            row = tk.Frame(left_column, bg=T.CARD_BG)
-            row.pack(fill=tk.X, pady=1)
-            
-            tk.Label(row, text=f"{currency}/USD:", font=("Segoe UI", 8), bg=T.CARD_BG, 
-                    fg=T.TEXT_SECONDARY, width=10, anchor="w").pack(side=tk.LEFT)
-            
-            value_container = tk.Frame(row, bg=T.CARD_BG)
-            value_container.pack(side=tk.RIGHT)
-            
-            change_label = tk.Label(value_container, text="", font=("Segoe UI", 7), bg=T.CARD_BG, 
-                                   fg=T.TEXT_SECONDARY, anchor="e", width=20)
-            change_label.pack(side=tk.LEFT, padx=(0, 3))
-            
-            value_label = tk.Label(value_container, text="Loading...", font=("Segoe UI", 8), bg=T.CARD_BG, 
-                                  fg=T.TEXT_PRIMARY, anchor="e", width=8)
-            value_label.pack(side=tk.LEFT)
-            
-            self.forex_labels[currency] = {
-                'price': value_label,
-                'change': change_label,
-                'container': value_container
-            }
-        
-        tk.Frame(left_column, bg=T.CARD_BG, height=8).pack()
-        
-        # Commodities subsection
-        tk.Label(left_column, text="Commodities", font=("Segoe UI", 9, "bold"), 
-                bg=T.CARD_BG, fg=T.TEXT_PRIMARY, anchor="w").pack(fill=tk.X, pady=(0, 3))
-        
-        commodities = [
-            ("GC=F", "Gold"),
-            ("SI=F", "Silver"),
-            ("CL=F", "Oil (WTI)")
-        ]
-        for symbol, name in commodities:
-            row = tk.Frame(left_column, bg=T.CARD_BG)
-            row.pack(fill=tk.X, pady=1)
-            
-            tk.Label(row, text=f"{name}:", font=("Segoe UI", 8), bg=T.CARD_BG, 
-                    fg=T.TEXT_SECONDARY, width=10, anchor="w").pack(side=tk.LEFT)
-            
-            value_container = tk.Frame(row, bg=T.CARD_BG)
-            value_container.pack(side=tk.RIGHT)
-            
-            change_label = tk.Label(value_container, text="", font=("Segoe UI", 7), bg=T.CARD_BG, 
-                                   fg=T.TEXT_SECONDARY, anchor="e", width=20)
-            change_label.pack(side=tk.LEFT, padx=(0, 3))
-            
-            value_label = tk.Label(value_container, text="Loading...", font=("Segoe UI", 8), bg=T.CARD_BG, 
-                                  fg=T.TEXT_PRIMARY, anchor="e", width=8)
-            value_label.pack(side=tk.LEFT)
-            
-            self.commodity_labels[symbol] = {
-                'price': value_label,
-                'change': change_label,
-                'container': value_container
-            }
-        
-        tk.Frame(left_column, bg=T.CARD_BG, height=8).pack()
-        
-        # Bonds subsection
-        tk.Label(left_column, text="Bonds", font=("Segoe UI", 9, "bold"), 
-                bg=T.CARD_BG, fg=T.TEXT_PRIMARY, anchor="w").pack(fill=tk.X, pady=(0, 3))
-        
-        bonds = [("^TNX", "US 10Y")]
-        for symbol, name in bonds:
-            row = tk.Frame(left_column, bg=T.CARD_BG)
-            row.pack(fill=tk.X, pady=1)
-            
-            tk.Label(row, text=f"{name}:", font=("Segoe UI", 8), bg=T.CARD_BG, 
-                    fg=T.TEXT_SECONDARY, width=10, anchor="w").pack(side=tk.LEFT)
-            
-            value_container = tk.Frame(row, bg=T.CARD_BG)
-            value_container.pack(side=tk.RIGHT)
-            
-            change_label = tk.Label(value_container, text="", font=("Segoe UI", 7), bg=T.CARD_BG, 
-                                   fg=T.TEXT_SECONDARY, anchor="e", width=20)
-            change_label.pack(side=tk.LEFT, padx=(0, 3))
-            
-            value_label = tk.Label(value_container, text="Loading...", font=("Segoe UI", 8), bg=T.CARD_BG, 
-                                  fg=T.TEXT_PRIMARY, anchor="e", width=8)
-            value_label.pack(side=tk.LEFT)
-            
-            self.bond_labels[symbol] = {
-                'price': value_label,
-                'change': change_label,
-                'container': value_container
-            }
-        
         # MIDDLE COLUMN: Major Indexes
         indexes_frame = tk.Frame(content, bg=T.CARD_BG)
         indexes_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0))
         
-        tk.Label(indexes_frame, text="Major Indexes", font=("Segoe UI", 9, "bold"), 
-                bg=T.CARD_BG, fg=T.TEXT_PRIMARY, anchor="w").pack(fill=tk.X, pady=(0, 3))
-        
-        indexes = [
-            ("^GSPC", "S&P 500"), 
-            ("^DJI", "Dow Jones"), 
-            ("^IXIC", "Nasdaq"),
-            ("^GDAXI", "DAX"),
-            ("^FCHI", "CAC 40"),
-            ("^FTSE", "FTSE 100"),
-            ("^N225", "Nikkei 225"),
-            ("^HSI", "Hang Seng")
-        ]
-        for symbol, name in indexes:
-            row = tk.Frame(indexes_frame, bg=T.CARD_BG)
-            row.pack(fill=tk.X, pady=1)
-            
-            tk.Label(row, text=f"{name}:", font=("Segoe UI", 8), bg=T.CARD_BG, 
-                    fg=T.TEXT_SECONDARY, width=12, anchor="w").pack(side=tk.LEFT)
-            
-            value_container = tk.Frame(row, bg=T.CARD_BG)
-            value_container.pack(side=tk.RIGHT)
-            
-            change_label = tk.Label(value_container, text="", font=("Segoe UI", 7), bg=T.CARD_BG, 
-                                   fg=T.TEXT_SECONDARY, anchor="e", width=20)
-            change_label.pack(side=tk.LEFT, padx=(0, 3))
+        sections = (
+            (left_column, "Forex Rates (vs USD)", self.forex_labels, 10,
+             [(c, f"{c}/USD") for c in ["EUR", "GBP", "JPY", "CHF"]]),
+            (left_column, "Commodities", self.commodity_labels, 10,
+             [("GC=F", "Gold"), ("SI=F", "Silver"), ("CL=F", "Oil (WTI)")]),
+            (left_column, "Bonds", self.bond_labels, 10,
+             [("^TNX", "US 10Y")]),
+            (indexes_frame, "Major Indexes", self.index_labels, 12,
+             [("^GSPC", "S&P 500"), ("^DJI", "Dow Jones"), ("^IXIC", "Nasdaq"), ("^GDAXI", "DAX"),
+              ("^FCHI", "CAC 40"), ("^FTSE", "FTSE 100"), ("^N225", "Nikkei 225"), ("^HSI", "Hang Seng")]),
+        )
+        
+        last_column = None
+        for column, title, labels, name_width, quotes in sections:
+            if column is last_column:
+                tk.Frame(column, bg=T.CARD_BG, height=8).pack()
+            last_column = column
             
-            value_label = tk.Label(value_container, text="Loading...", font=("Segoe UI", 8), bg=T.CARD_BG, 
-                                  fg=T.TEXT_PRIMARY, anchor="e", width=8)
-            value_label.pack(side=tk.LEFT)
+            tk.Label(column, text=title, font=("Segoe UI", 9, "bold"), 
+                    bg=T.CARD_BG, fg=T.TEXT_PRIMARY, anchor="w").pack(fill=tk.X, pady=(0, 3))
             
-            self.index_labels[symbol] = {
-                'price': value_label,
-                'change': change_label,
-                'container': value_container
-            }
+            for key, name in quotes:
+                labels[key] = self._make_quote_row(column, name, name_width)
+    
+    def _make_quote_row(self, parent, name, name_width):
+        """
+        Create one market data row: name on the left, change and price on the right
+        
+        Args:
+            parent: Column frame to pack the row into
+            name: Display name
+            name_width: Width of the name label (characters)
+        
+        Returns:
+            dict: {'price': Label, 'change': Label}
+        """
+        row = tk.Frame(parent, bg=T.CARD_BG)
+        row.pack(fill=tk.X, pady=1)
+        row.grid_columnconfigure(0, weight=1)
+        
+        tk.Label(row, text=f"{name}:", font=("Segoe UI", 8), bg=T.CARD_BG, 
+                fg=T.TEXT_SECONDARY, width=name_width, anchor="w").grid(row=0, column=0, sticky="w")
+        
+        change_label = tk.Label(row, text="", font=("Segoe UI", 7), bg=T.CARD_BG, 
+                               fg=T.TEXT_SECONDARY, anchor="e", width=20)
+        change_label.grid(row=0, column=1, padx=(0, 3))
+        
+        value_label = tk.Label(row, text="Loading...", font=("Segoe UI", 8), bg=T.CARD_BG, 
+                              fg=T.TEXT_PRIMARY, anchor="e", width=8)
+        value_label.grid(row=0, column=2, sticky="e")
+        
+        return {'price': value_label, 'change': change_label}
     
     def _create_portfolio(self, parent):
         """Portfolio section - 10 rows"""
@@ -444,14 +422,12 @@ class TwoPagePortfolioArchitect:
         content = tk.Frame(section, bg=T.CARD_BG)
         content.pack(fill=tk.BOTH, expand=True, padx=5, pady=10)
         
-        # Headers
-        hdr = tk.Frame(content, bg=T.CARD_BG)
-        hdr.pack(fill=tk.X, pady=(0, 5))
-        tk.Label(hdr, text="#", font=("Segoe UI", 8, "bold"), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, width=2).pack(side=tk.LEFT, padx=1)
-        tk.Label(hdr, text="Ticker/ISIN", font=("Segoe UI", 9, "bold"), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, anchor="w").pack(side=tk.LEFT, fill=tk.X, expand=True, padx=2)
-        tk.Label(hdr, text="Weight %", font=("Segoe UI", 9, "bold"), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, anchor="w", width=9).pack(side=tk.LEFT, padx=2)
-        tk.Label(hdr, text="Amount", font=("Segoe UI", 9, "bold"), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, anchor="w", width=9).pack(side=tk.LEFT, padx=2)
-        tk.Label(hdr, text="", font=("Segoe UI", 9, "bold"), bg=T.CARD_BG, width=2).pack(side=tk.LEFT, padx=0)
+        # One grid for headers and rows: # | Ticker | Weight | Amount | status, name below
+        content.columnconfigure(1, weight=1)
+        tk.Label(content, text="#", font=("Segoe UI", 8, "bold"), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, width=2).grid(row=0, column=0, padx=1, pady=(0, 5))
+        tk.Label(content, text="Ticker/ISIN", font=("Segoe UI", 9, "bold"), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, anchor="w").grid(row=0, column=1, sticky="ew", padx=2, pady=(0, 5))
+        tk.Label(content, text="Weight %", font=("Segoe UI", 9, "bold"), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, anchor="w", width=9).grid(row=0, column=2, sticky="w", padx=2, pady=(0, 5))
+        tk.Label(content, text="Amount", font=("Segoe UI", 9, "bold"), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, anchor="w", width=9).grid(row=0, column=3, sticky="w", padx=2, pady=(0, 5))
         
         # 10 rows
         for i in range(10):
@@ -466,39 +442,29 @@ class TwoPagePortfolioArchitect:
         self.weight_total_label.pack(side=tk.LEFT, padx=5)
     
     def _create_portfolio_row(self, parent, idx):
-        """Create portfolio row"""
-        row_container = tk.Frame(parent, bg=T.CARD_BG)
-        row_container.pack(fill=tk.BOTH, expand=True, pady=1, padx=0)
-        
-        top_row = tk.Frame(row_container, bg=T.CARD_BG)
-        top_row.pack(fill=tk.X)
+        """Create portfolio row (two rows of the section grid: inputs, then name)"""
+        r = 1 + 2 * idx
         
-        tk.Label(top_row, text=str(idx+1), font=("Segoe UI", 8), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, width=2).pack(side=tk.LEFT, padx=1)
+        tk.Label(parent, text=str(idx+1), font=("Segoe UI", 8), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, width=2).grid(row=r, column=0, padx=1, pady=(1, 0))
         
-        ticker_frame = tk.Frame(top_row, bg=T.CARD_BG)
-        ticker_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=2)
-        ticker_entry = tk.Entry(ticker_frame, font=("Segoe UI", 10), bg=T.INPUT_BG, fg=T.TEXT_PRIMARY, relief=tk.FLAT, bd=1)
-        ticker_entry.pack(fill=tk.BOTH, expand=True)
+        ticker_entry = tk.Entry(parent, font=("Segoe UI", 10), bg=T.INPUT_BG, fg=T.TEXT_PRIMARY, relief=tk.FLAT, bd=1)
+        ticker_entry.grid(row=r, column=1, sticky="nsew", padx=2, pady=(1, 0))
         
-        weight_frame = tk.Frame(top_row, bg=T.CARD_BG)
-        weight_frame.pack(side=tk.LEFT, padx=2)
-        weight_entry = tk.Entry(weight_frame, font=("Segoe UI", 10), bg=T.INPUT_BG, fg=T.TEXT_PRIMARY, relief=tk.FLAT, bd=1, width=10)
-        weight_entry.pack(fill=tk.BOTH, expand=True)
+        weight_entry = tk.Entry(parent, font=("Segoe UI", 10), bg=T.INPUT_BG, fg=T.TEXT_PRIMARY, relief=tk.FLAT, bd=1, width=10)
+        weight_entry.grid(row=r, column=2, padx=2, pady=(1, 0))
         
-        amount_frame = tk.Frame(top_row, bg=T.CARD_BG)
-        amount_frame.pack(side=tk.LEFT, padx=2)
-        amount_entry = tk.Entry(amount_frame, font=("Segoe UI", 10), bg=T.INPUT_BG, fg=T.TEXT_PRIMARY, relief=tk.FLAT, bd=1, width=10)
-        amount_entry.pack(fill=tk.BOTH, expand=True)
+        amount_entry = tk.Entry(parent, font=("Segoe UI", 10), bg=T.INPUT_BG, fg=T.TEXT_PRIMARY, relief=tk.FLAT, bd=1, width=10)
+        amount_entry.grid(row=r, column=3, padx=2, pady=(1, 0))
         
-        status_label = tk.Label(top_row, text="●", font=("Segoe UI", 10), bg=T.CARD_BG, fg=T.BORDER, width=2)
-        status_label.pack(side=tk.LEFT)
+        status_label = tk.Label(parent, text="●", font=("Segoe UI", 10), bg=T.CARD_BG, fg=T.BORDER, width=2)
+        status_label.grid(row=r, column=4, pady=(1, 0))
         
-        name_label = tk.Label(row_container, text="", font=("Segoe UI", 8), bg=T.CARD_BG, 
+        name_label = tk.Label(parent, text="", font=("Segoe UI", 8), bg=T.CARD_BG, 
                              fg=T.TEXT_SECONDARY, anchor="w", wraplength=400)
-        name_label.pack(fill=tk.X, padx=(20, 0))
+        name_label.grid(row=r + 1, column=0, columnspan=5, sticky="ew", padx=(20, 0), pady=(0, 1))
         
-        weight_entry.bind("<KeyRelease>", lambda e, idx=idx: self._on_weight_change(idx))
-        amount_entry.bind("<KeyRelease>", lambda e, idx=idx: self._on_amount_change(idx))
+        weight_entry.bind("<KeyRelease>", lambda e, idx=idx: self._queue_weight_change(idx))
+        amount_entry.bind("<KeyRelease>", lambda e, idx=idx: self._queue_amount_change(idx))
         
         self.ticker_rows.append({
             "entry": ticker_entry,
@@ -526,41 +492,35 @@ class TwoPagePortfolioArchitect:
         content = tk.Frame(section, bg=T.CARD_BG)
         content.pack(fill=tk.BOTH, expand=True, padx=5, pady=10)
         
-        # Headers
-        hdr = tk.Frame(content, bg=T.CARD_BG)
-        hdr.pack(fill=tk.X, pady=(0, 5))
-        tk.Label(hdr, text="#", font=("Segoe UI", 8, "bold"), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, width=2).pack(side=tk.LEFT, padx=1)
-        tk.Label(hdr, text="Benchmark", font=("Segoe UI", 9, "bold"), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, anchor="w").pack(side=tk.LEFT, fill=tk.X, expand=True, padx=2)
-        tk.Label(hdr, text="", font=("Segoe UI", 9), bg=T.CARD_BG, width=2).pack(side=tk.LEFT)
+        # One grid for headers and rows: # | Benchmark | browse | status, name below
+        content.columnconfigure(1, weight=1)
+        tk.Label(content, text="#", font=("Segoe UI", 8, "bold"), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, width=2).grid(row=0, column=0, padx=1, pady=(0, 5))
+        tk.Label(content, text="Benchmark", font=("Segoe UI", 9, "bold"), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, anchor="w").grid(row=0, column=1, sticky="ew", padx=2, pady=(0, 5))
         
         # 6 rows
         for i in range(6):
             self._create_benchmark_row(content, i)
     
     def _create_benchmark_row(self, parent, idx):
-        """Create benchmark row"""
-        row_container = tk.Frame(parent, bg=T.CARD_BG)
-        row_container.pack(fill=tk.BOTH, expand=True, pady=1, padx=0)
+        """Create benchmark row (two rows of the section grid: input, then name)"""
+        r = 1 + 2 * idx
         
-        top_row = tk.Frame(row_container, bg=T.CARD_BG)
-        top_row.pack(fill=tk.X)
+        tk.Label(parent, text=str(idx+1), font=("Segoe UI", 8), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, width=2).grid(row=r, column=0, padx=1, pady=(1, 0))
         
-        tk.Label(top_row, text=str(idx+1), font=("Segoe UI", 8), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, width=2).pack(side=tk.LEFT, padx=1)
+        bench_entry = tk.Entry(parent, font=("Segoe UI", 10), bg=T.INPUT_BG, fg=T.TEXT_PRIMARY, relief=tk.FLAT, bd=1)
+        bench_entry.grid(row=r, column=1, sticky="nsew", padx=2, pady=(1, 0))
         
-        bench_entry = tk.Entry(top_row, font=("Segoe UI", 10), bg=T.INPUT_BG, fg=T.TEXT_PRIMARY, relief=tk.FLAT, bd=1)
-        bench_entry.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=2)
-        
-        browse_btn = tk.Button(top_row, text="📋", font=("Segoe UI", 9), bg=T.PRIMARY, fg=T.TEXT_ON_DARK,
+        browse_btn = tk.Button(parent, text="📋", font=("Segoe UI", 9), bg=T.PRIMARY, fg=T.TEXT_ON_DARK,
                               relief=tk.FLAT, padx=8, pady=2, cursor="hand2",
                               command=lambda: self._open_benchmark_selector(idx))
-        browse_btn.pack(side=tk.LEFT, padx=2)
+        browse_btn.grid(row=r, column=2, padx=2, pady=(1, 0))
         
-        status_label = tk.Label(top_row, text="●", font=("Segoe UI", 10), bg=T.CARD_BG, fg=T.BORDER, width=2)
-        status_label.pack(side=tk.LEFT)
+        status_label = tk.Label(parent, text="●", font=("Segoe UI", 10), bg=T.CARD_BG, fg=T.BORDER, width=2)
+        status_label.grid(row=r, column=3, pady=(1, 0))
         
-        name_label = tk.Label(row_container, text="", font=("Segoe UI", 8), bg=T.CARD_BG, 
+        name_label = tk.Label(parent, text="", font=("Segoe UI", 8), bg=T.CARD_BG, 
                              fg=T.TEXT_SECONDARY, anchor="w", wraplength=400)
-        name_label.pack(fill=tk.X, padx=(20, 0))
+        name_label.grid(row=r + 1, column=0, columnspan=4, sticky="ew", padx=(20, 0), pady=(0, 1))
         
         self.benchmark_rows.append({
             "entry": bench_entry,
@@ -597,15 +557,17 @@ class TwoPagePortfolioArchitect:
         scrollbar = ttk.Scrollbar(section, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, bg=T.CARD_BG)
         
-        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        # The frame is the only canvas item: its size is the scrollregion (no bbox walk)
+        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=(0, 0, e.width, e.height)))
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=0)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._bind_mousewheel(canvas)
         
         # Categories
-        for category, charts in self.CHART_GROUPS.items():
+        for category, items in self.CHART_ITEMS.items():
             cat_header = tk.Frame(scrollable_frame, bg=T.HIGHLIGHT, height=30)
             cat_header.pack(fill=tk.X, pady=(15, 0), padx=0)
             cat_header.pack_propagate(False)
@@ -626,9 +588,9 @@ class TwoPagePortfolioArchitect:
             col3 = tk.Frame(charts_container, bg=T.CARD_BG)
             col3.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(1, 0))
             
-            for i, chart_num in enumerate(charts):
-                col_index = i % 3
-                target_col = [col1, col2, col3][col_index]
+            cols = (col1, col2, col3)
+            for i, (chart_num, chart_name, chart_desc) in enumerate(items):
+                target_col = cols[i % 3]
                 
                 var = tk.BooleanVar(value=False)
                 self.chart_vars[chart_num] = var
@@ -640,9 +602,6 @@ class TwoPagePortfolioArchitect:
                                    relief=tk.FLAT, bd=0, highlightthickness=0)
                 cb.pack(side=tk.LEFT, padx=(1, 4))
                 
-                chart_name = f"{chart_num}. {self.CHART_NAMES[chart_num]}"
-                chart_desc = self.CHART_DESCRIPTIONS[chart_num]
-                
                 name_frame = tk.Frame(item_frame, bg=T.CARD_BG)
                 name_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=0)
                 
@@ -651,6 +610,24 @@ class TwoPagePortfolioArchitect:
                 tk.Label(name_frame, text=chart_desc, font=("Segoe UI", 7), bg=T.CARD_BG, fg=T.TEXT_SECONDARY, 
                         anchor="w", wraplength=260).pack(fill=tk.X)
     
+    def _bind_mousewheel(self, canvas):
+        """Scroll canvas with the mouse wheel while the pointer is over it"""
+        def on_wheel(event):
+            canvas.yview_scroll(int(-event.delta / 120), "units")
+        
+        def on_enter(event):
+            canvas.bind_all("<MouseWheel>", on_wheel)
+            canvas.bind_all("<Button-4>", lambda e: canvas.yview_scroll(-1, "units"))
+            canvas.bind_all("<Button-5>", lambda e: canvas.yview_scroll(1, "units"))
+        
+        def on_leave(event):
+            canvas.unbind_all("<MouseWheel>")
+            canvas.unbind_all("<Button-4>")
+            canvas.unbind_all("<Button-5>")
+        
+        canvas.bind("<Enter>", on_enter)
+        canvas.bind("<Leave>", on_leave)
+    
     def _create_run_button(self):
         """Large run analysis button"""
         btn_frame = tk.Frame(self.root, bg=T.MAIN_BG, height=60)
@@ -676,92 +653,132 @@ class TwoPagePortfolioArchitect:
         messagebox.showinfo("Benchmark Selector", "Feature coming soon - use v3 implementation")
     
     def _start_auto_refresh(self):
-        """Start automatic market data refresh"""
-        def auto_refresh_loop():
-            self._refresh_market_data()
-            self.root.after(5000, auto_refresh_loop)
-        auto_refresh_loop()
+        """Start the persistent market data worker (first fetch runs immediately)"""
+        threading.Thread(target=self._refresh_worker, daemon=True).start()
+        self._refresh_market_data()
     
     def _refresh_market_data(self):
-        """Refresh market data in background"""
-        def fetch():
-            forex_rates = get_current_forex_rates()
-            indexes_prices = get_major_indexes_prices()
-            self.root.after(0, lambda: self._update_market_data(forex_rates, indexes_prices))
-        threading.Thread(target=fetch, daemon=True).start()
+        """Wake the refresh worker for an immediate fetch"""
+        self._refresh_q.put("refresh")
     
-    def _update_market_data(self, forex_rates, indexes_prices):
-        """Update UI with market data (same logic as v3)"""
+    def _refresh_worker(self):
+        """Fetch market data every MARKET_REFRESH_SECONDS, or when woken early"""
+        while True:
+            try:
+                if self._refresh_q.get(timeout=self.MARKET_REFRESH_SECONDS) is None:
+                    return
+            except queue.Empty:
+                pass
+            
+            # Collapse refresh requests queued during the previous fetch
+            try:
+                while True:
+                    if self._refresh_q.get_nowait() is None:
+                        return
+            except queue.Empty:
+                pass
+            
+            snapshot = self._fetch_all()
+            try:
+                self.root.after(0, self._apply_market_snapshot, snapshot)
+            except (RuntimeError, tk.TclError):
+                # Window closed while fetching
+                return
+    
+    def _fetch_all(self):
+        """Fetch every market data symbol in one batched download"""
+        quotes = get_market_snapshot(self._all_market_symbols)
+        return self._build_market_snapshot(quotes)
+    
+    def _build_market_snapshot(self, quotes):
+        """
+        Format fetched quotes into label values (runs off the Tk thread)
+        
+        Args:
+            quotes: {yahoo_symbol: (price, change_pts, change_pct)}
+        
+        Returns:
+            dict: (group, key) -> (price_text, change_text, change_pct)
+        """
+        snapshot = {}
         try:
-            # Update forex
-            if forex_rates and forex_rates.get('success'):
-                for currency in ["EUR", "GBP", "JPY", "CHF"]:
-                    key = f"{currency}USD"
-                    value = forex_rates.get(key, 0)
-                    change_pct = forex_rates.get(f"{key}_change_pct", 0)
-                    change_pts = forex_rates.get(f"{key}_change_pts", 0)
-                    
-                    if currency in self.forex_labels:
-                        labels = self.forex_labels[currency]
-                        if currency == "JPY":
-                            labels['price'].config(text=f"{value:.2f}")
-                        else:
-                            labels['price'].config(text=f"{value:.4f}")
-                        
-                        if change_pct is not None and change_pct != 0:
-                            if currency == "JPY":
-                                change_text = f"{change_pts:+.2f} ({change_pct:+.2f}%)"
-                            else:
-                                change_text = f"{change_pts:+.4f} ({change_pct:+.2f}%)"
-                            
-                            if change_pct > 0:
-                                labels['change'].config(text=change_text, bg="#d4edda", fg="#155724")
-                                self.root.after(1000, lambda l=labels['change']: l.config(bg=T.CARD_BG, fg=T.TEXT_SECONDARY))
-                            else:
-                                labels['change'].config(text=change_text, bg="#f8d7da", fg="#721c24")
-                                self.root.after(1000, lambda l=labels['change']: l.config(bg=T.CARD_BG, fg=T.TEXT_SECONDARY))
-                        else:
-                            labels['change'].config(text="0.00 (0.00%)", bg=T.CARD_BG, fg=T.TEXT_SECONDARY)
+            # Forex
+            for yahoo_symbol, currency in self._forex_symbols.items():
+                if yahoo_symbol not in quotes:
+                    continue
+                value, change_pts, change_pct = quotes[yahoo_symbol]
+                
+                if currency == "JPY":
+                    price_text = f"{value:.2f}"
+                    change_text = f"{change_pts:+.2f} ({change_pct:+.2f}%)"
+                else:
+                    price_text = f"{value:.4f}"
+                    change_text = f"{change_pts:+.4f} ({change_pct:+.2f}%)"
+                
+                if not round(change_pct, 2):
+                    change_pct = 0
+                    change_text = "0.00 (0.00%)"
+                snapshot[("forex", currency)] = (price_text, change_text, change_pct)
             
-            # Update indexes, commodities, bonds
-            if indexes_prices and indexes_prices.get('success'):
-                for idx_data in indexes_prices.get('indexes', []):
-                    symbol = idx_data.get('symbol')
-                    price = idx_data.get('price', 0)
-                    change_pct = idx_data.get('change_pct', 0)
-                    change_pts = idx_data.get('change_pts', 0)
-                    
-                    if not idx_data.get('success'):
+            # Indexes, commodities, bonds
+            for group, labels, price_fmt, change_fmt in (
+                ("index", self.index_labels, "{:,.0f}", "{:+.1f} ({:+.2f}%)"),
+                ("commodity", self.commodity_labels, "${:,.2f}", "${:+.2f} ({:+.2f}%)"),
+                ("bond", self.bond_labels, "{:.2f}%", "{:+.2f} ({:+.2f}%)"),
+            ):
+                for symbol in labels:
+                    if symbol not in quotes:
                         continue
+                    price, change_pts, change_pct = quotes[symbol]
                     
-                    labels = None
-                    if symbol in self.index_labels:
-                        labels = self.index_labels[symbol]
-                        price_format = f"{price:,.0f}"
-                        change_format = f"{change_pts:+.1f} ({change_pct:+.2f}%)"
-                    elif symbol in self.commodity_labels:
-                        labels = self.commodity_labels[symbol]
-                        price_format = f"${price:,.2f}"
-                        change_format = f"${change_pts:+.2f} ({change_pct:+.2f}%)"
-                    elif symbol in self.bond_labels:
-                        labels = self.bond_labels[symbol]
-                        price_format = f"{price:.2f}%"
-                        change_format = f"{change_pts:+.2f} ({change_pct:+.2f}%)"
-                    
-                    if labels:
-                        labels['price'].config(text=price_format)
-                        
-                        if change_pct is not None and change_pct != 0:
-                            if change_pct > 0:
-                                labels['change'].config(text=change_format, bg="#d4edda", fg="#155724")
-                                self.root.after(1000, lambda l=labels['change']: l.config(bg=T.CARD_BG, fg=T.TEXT_SECONDARY))
-                            else:
-                                labels['change'].config(text=change_format, bg="#f8d7da", fg="#721c24")
-                                self.root.after(1000, lambda l=labels['change']: l.config(bg=T.CARD_BG, fg=T.TEXT_SECONDARY))
-                        else:
-                            labels['change'].config(text="0.0 (0.00%)", bg=T.CARD_BG, fg=T.TEXT_SECONDARY)
+                    change_text = change_fmt.format(change_pts, change_pct)
+                    if not round(change_pct, 2):
+                        change_pct = 0
+                        change_text = "0.0 (0.00%)"
+                    snapshot[(group, symbol)] = (price_fmt.format(price), change_text, change_pct)
         except Exception as e:
-            print(f"Error updating market data: {e}")
+            print(f"Error formatting market data: {e}")
+        return snapshot
+    
+    def _apply_market_snapshot(self, snapshot):
+        """Write a market snapshot to the labels in one pass, then lay out once"""
+        groups = {
+            "forex": self.forex_labels,
+            "index": self.index_labels,
+            "commodity": self.commodity_labels,
+            "bond": self.bond_labels,
+        }
+        flashed = []
+        for key, values in snapshot.items():
+            if self._market_snapshot.get(key) == values:
+                continue
+            group, name = key
+            labels = groups[group].get(name)
+            if not labels:
+                continue
+            
+            price_text, change_text, change_pct = values
+            if change_pct > 0:
+                bg, fg = "#d4edda", "#155724"
+                flashed.append(labels['change'])
+            elif change_pct < 0:
+                bg, fg = "#f8d7da", "#721c24"
+                flashed.append(labels['change'])
+            else:
+                bg, fg = T.CARD_BG, T.TEXT_SECONDARY
+            
+            labels['price'].configure(text=price_text)
+            labels['change'].configure(text=change_text, bg=bg, fg=fg)
+        
+        self._market_snapshot.update(snapshot)
+        if flashed:
+            self.root.after(1000, self._clear_market_flash, flashed)
+        self.root.update_idletasks()
+    
+    def _clear_market_flash(self, change_labels):
+        """Return flashed change labels to their resting colors"""
+        for label in change_labels:
+            label.configure(bg=T.CARD_BG, fg=T.TEXT_SECONDARY)
     
     def _select_all_charts(self):
         for var in self.chart_vars.values():
@@ -908,6 +925,34 @@ class TwoPagePortfolioArchitect:
         """Callback when symbol validation completes"""
         pass
     
+    def _queue_weight_change(self, idx):
+        """Coalesce weight keystrokes into one recompute per 50 ms"""
+        self._pending_weight_rows.add(idx)
+        if self._pending_weight_job:
+            return
+        self._pending_weight_job = self.root.after(50, self._flush_weight_change)
+    
+    def _flush_weight_change(self):
+        """Run the pending weight recomputes"""
+        self._pending_weight_job = None
+        rows, self._pending_weight_rows = self._pending_weight_rows, set()
+        for idx in sorted(rows):
+            self._on_weight_change(idx)
+    
+    def _queue_amount_change(self, idx):
+        """Coalesce amount keystrokes into one recompute per 50 ms"""
+        self._pending_amount_rows.add(idx)
+        if self._pending_amount_job:
+            return
+        self._pending_amount_job = self.root.after(50, self._flush_amount_change)
+    
+    def _flush_amount_change(self):
+        """Run the pending amount recomputes"""
+        self._pending_amount_job = None
+        rows, self._pending_amount_rows = self._pending_amount_rows, set()
+        for idx in sorted(rows):
+            self._on_amount_change(idx)
+    
     def _on_weight_change(self, idx):
         """Auto-calculate amount when weight changes"""
         try:
@@ -951,6 +996,7 @@ class TwoPagePortfolioArchitect:
     
     def _on_closing(self):
         """Handle window close"""
+        self._refresh_q.put(None)
         self.root.destroy()
     
     def _equal_weights(self):
@@ -94,6 +94,10 @@ class ProChartSelector:
         ]
     }
     
+    # Bind tags shared by every chart item widget (see _create_chart_item)
+    HOVER_TAG = "ProChartHover"
+    TOGGLE_TAG = "ProChartToggle"
+    
     def __init__(self, parent, chart_vars):
         """
         Initialize professional chart selector
@@ -249,8 +253,15 @@ class ProChartSelector:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Create categories
+        # One binding per event for all chart items, dispatched by widget path
         self.chart_widgets = {}
+        self._item_of_widget = {}
+        self._item_hover_widgets = {}
+        self.dialog.bind_class(self.HOVER_TAG, "<Enter>", lambda e: self._on_item_hover(e, T.HOVER_BG))
+        self.dialog.bind_class(self.HOVER_TAG, "<Leave>", lambda e: self._on_item_hover(e, T.CARD_BG))
+        self.dialog.bind_class(self.TOGGLE_TAG, "<Button-1>", self._on_item_click)
+        
+        # Create categories
         for category, charts in self.CHARTS.items():
             self._create_category(self.scrollable_frame, category, charts)
     
@@ -281,27 +292,11 @@ class ProChartSelector:
             self.chart_widgets[chart["id"]] = chart_widget
     
     def _create_chart_item(self, parent, chart):
-        """Create a single chart item"""
+        """Create a single chart item (events handled by the class-level bindings)"""
         item_frame = tk.Frame(parent, bg=T.CARD_BG, relief=tk.FLAT, bd=1)
         item_frame.pack(fill=tk.X, pady=5)
         
-        # Hover effect
-        def on_enter(e):
-            item_frame.config(bg=T.HOVER_BG)
-            icon_label.config(bg=T.HOVER_BG)
-            name_label.config(bg=T.HOVER_BG)
-            desc_label.config(bg=T.HOVER_BG)
-            
-        def on_leave(e):
-            item_frame.config(bg=T.CARD_BG)
-            icon_label.config(bg=T.CARD_BG)
-            name_label.config(bg=T.CARD_BG)
-            desc_label.config(bg=T.CARD_BG)
-        
-        item_frame.bind("<Enter>", on_enter)
-        item_frame.bind("<Leave>", on_leave)
-        
-        # Checkbox
+        # Checkbox (toggles its own variable; only joins the hover tag)
         cb = tk.Checkbutton(
             item_frame,
             variable=self.chart_vars[chart["id"]],
@@ -310,8 +305,6 @@ class ProChartSelector:
             command=self._update_selection_count
         )
         cb.pack(side=tk.LEFT, padx=10)
-        cb.bind("<Enter>", on_enter)
-        cb.bind("<Leave>", on_leave)
         
         # Icon
         icon_label = tk.Label(
@@ -321,14 +314,10 @@ class ProChartSelector:
             bg=T.CARD_BG
         )
         icon_label.pack(side=tk.LEFT, padx=(0, 10))
-        icon_label.bind("<Enter>", on_enter)
-        icon_label.bind("<Leave>", on_leave)
         
         # Text content
         text_frame = tk.Frame(item_frame, bg=T.CARD_BG)
         text_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=8)
-        text_frame.bind("<Enter>", on_enter)
-        text_frame.bind("<Leave>", on_leave)
         
         name_label = tk.Label(
             text_frame,
@@ -339,8 +328,6 @@ class ProChartSelector:
             anchor="w"
         )
         name_label.pack(anchor="w")
-        name_label.bind("<Enter>", on_enter)
-        name_label.bind("<Leave>", on_leave)
         
         desc_label = tk.Label(
             text_frame,
@@ -351,20 +338,31 @@ class ProChartSelector:
             anchor="w"
         )
         desc_label.pack(anchor="w")
-        desc_label.bind("<Enter>", on_enter)
-        desc_label.bind("<Leave>", on_leave)
         
-        # Make entire frame clickable
-        def toggle_chart(e):
-            current = self.chart_vars[chart["id"]].get()
-            self.chart_vars[chart["id"]].set(not current)
-            self._update_selection_count()
-        
-        for widget in [item_frame, icon_label, text_frame, name_label, desc_label]:
-            widget.bind("<Button-1>", toggle_chart)
+        # Route hover and clicks through the shared bind tags (entire item is clickable)
+        self._item_hover_widgets[chart["id"]] = (item_frame, icon_label, name_label, desc_label)
+        for widget in (cb, item_frame, icon_label, text_frame, name_label, desc_label):
+            self._item_of_widget[str(widget)] = chart["id"]
+            tags = (self.HOVER_TAG,) if widget is cb else (self.HOVER_TAG, self.TOGGLE_TAG)
+            widget.bindtags(tags + widget.bindtags())
         
         return item_frame
     
+    def _on_item_hover(self, event, bg):
+        """Recolor the chart item under the pointer (<Enter>/<Leave> on HOVER_TAG)"""
+        chart_id = self._item_of_widget.get(str(event.widget))
+        if chart_id is not None:
+            for widget in self._item_hover_widgets[chart_id]:
+                widget.config(bg=bg)
+    
+    def _on_item_click(self, event):
+        """Toggle the chart whose item was clicked (<Button-1> on TOGGLE_TAG)"""
+        chart_id = self._item_of_widget.get(str(event.widget))
+        if chart_id is not None:
+            var = self.chart_vars[chart_id]
+            var.set(not var.get())
+            self._update_selection_count()
+    
     def _create_footer(self):
         """Create dialog footer with action buttons"""
         footer = tk.Frame(self.dialog, bg=T.MAIN_BG, height=70)
@@ -433,12 +433,12 @@ class UIBuilder:
             yscrollcommand=portfolio_scroll.set, relief=tk.FLAT
         )
         portfolio_scroll.config(command=portfolio_text.yview)
-        portfolio_text.insert("1.0", "Ticker    Weight\n")
-        portfolio_text.insert("end", "-" * 25 + "\n")
-        for ticker, weight in weights_raw.items():
-            portfolio_text.insert("end", f"{ticker:<10}{weight*100:>6.1f}%\n")
-        portfolio_text.insert("end", "-" * 25 + "\n")
-        portfolio_text.insert("end", f"{'TOTAL':<10}{sum(weights_raw.values())*100:>6.1f}%\n")
+        # Build the text first, then fill the widget with a single insert
+        parts = ["Ticker    Weight\n", "-" * 25 + "\n"]
+        parts.extend(f"{ticker:<10}{weight*100:>6.1f}%\n" for ticker, weight in weights_raw.items())
+        parts.append("-" * 25 + "\n")
+        parts.append(f"{'TOTAL':<10}{sum(weights_raw.values())*100:>6.1f}%\n")
+        portfolio_text.insert("1.0", "".join(parts))
         portfolio_text.config(state=tk.DISABLED)
         portfolio_text.pack(padx=5, pady=5)
         
@@ -449,10 +449,9 @@ class UIBuilder:
         )
         benchmark_frame.pack(fill=tk.BOTH, expand=True)
         benchmark_text = tk.Text(benchmark_frame, height=8, width=30, font=("Courier", 9), bg=T.CARD_BG, relief=tk.FLAT)
-        benchmark_text.insert("1.0", "Index          Ticker\n")
-        benchmark_text.insert("end", "-" * 25 + "\n")
-        for label, ticker in bench_def:
-            benchmark_text.insert("end", f"{label:<15}{ticker}\n")
+        parts = ["Index          Ticker\n", "-" * 25 + "\n"]
+        parts.extend(f"{label:<15}{ticker}\n" for label, ticker in bench_def)
+        benchmark_text.insert("1.0", "".join(parts))
         benchmark_text.config(state=tk.DISABLED)
         benchmark_text.pack(padx=5, pady=5)
         
@@ -690,19 +689,32 @@ class UIBuilder:
         selection_frame = tk.Frame(parent, bg=T.CARD_BG, relief=tk.RIDGE, bd=2)
         selection_frame.pack(fill=tk.BOTH, expand=True)
         
-        canvas = tk.Canvas(selection_frame, bg=T.CARD_BG, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(selection_frame, orient="vertical", command=canvas.yview)
-        scrollable = tk.Frame(canvas, bg=T.CARD_BG)
-        scrollable.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=scrollable, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Charts go in a plain frame; a scrolling Canvas is only added if they do not fit
+        scrollable = tk.Frame(selection_frame, bg=T.CARD_BG)
+        scrollable.pack(fill="both", expand=True)
         
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        def _enable_scrolling():
+            canvas = tk.Canvas(selection_frame, bg=T.CARD_BG, highlightthickness=0)
+            scrollbar = ttk.Scrollbar(selection_frame, orient="vertical", command=canvas.yview)
+            canvas.configure(yscrollcommand=scrollbar.set)
+            
+            scrollable.pack_forget()
+            canvas.pack(side="left", fill="both", expand=True)
+            scrollbar.pack(side="right", fill="y")
+            canvas.create_window((0, 0), window=scrollable, anchor="nw")
+            scrollable.lift(canvas)
+            scrollable.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+            
+            def _on_mousewheel(event):
+                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        
+        def _on_resize(event):
+            # One-time switch to the Canvas once the list is clipped (rebinds <Configure>)
+            if scrollable.winfo_reqheight() > event.height:
+                _enable_scrolling()
         
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        scrollable.bind("<Configure>", _on_resize)
         
         chart_vars = {}
         
@@ -1531,6 +1531,90 @@ _load_currency_cache()
 
 
 # ===================== FOREX RATES (Current) =====================
+# Yahoo symbols for the forex pairs shown in the market data panels
+FOREX_SYMBOLS = {
+    'EUR': 'EURUSD=X',
+    'GBP': 'GBPUSD=X',
+    'JPY': 'JPY=X',
+    'CHF': 'CHF=X'
+}
+
+# Major indexes, commodities, and bonds shown in the market data panels
+MAJOR_INDEXES = [
+    # Major Indexes
+    {'name': 'S&P 500', 'symbol': '^GSPC'},
+    {'name': 'Nasdaq', 'symbol': '^IXIC'},
+    {'name': 'Dow Jones', 'symbol': '^DJI'},
+    {'name': 'DAX', 'symbol': '^GDAXI'},
+    {'name': 'CAC 40', 'symbol': '^FCHI'},
+    {'name': 'FTSE 100', 'symbol': '^FTSE'},
+    {'name': 'Nikkei 225', 'symbol': '^N225'},
+    {'name': 'Hang Seng', 'symbol': '^HSI'},
+    # Commodities
+    {'name': 'Gold', 'symbol': 'GC=F'},
+    {'name': 'Silver', 'symbol': 'SI=F'},
+    {'name': 'Oil (WTI)', 'symbol': 'CL=F'},
+    # Bonds
+    {'name': 'US 10Y Treasury', 'symbol': '^TNX'},
+]
+
+
+def get_market_snapshot(symbols):
+    """
+    Get latest price and daily change for many Yahoo symbols in one batched download.
+    
+    Forex pairs, indexes, commodities and bonds trade on different calendars,
+    so each symbol uses its own last two valid closes.
+    
+    Args:
+        symbols: Iterable of Yahoo Finance symbols
+    
+    Returns:
+        dict: {symbol: (price, change_pts, change_pct)}; symbols without data are omitted
+    """
+    symbols = list(dict.fromkeys(symbols))
+    if not symbols:
+        return {}
+    
+    try:
+        yf = _import_yfinance()
+        data = yf.download(tickers=symbols, period="5d", group_by='ticker',
+                           threads=True, progress=False, auto_adjust=False)
+    except Exception as e:
+        print(f"Warning: Failed to fetch market snapshot: {e}")
+        return {}
+    
+    if data is None or data.empty:
+        return {}
+    
+    snapshot = {}
+    multi = isinstance(data.columns, pd.MultiIndex)
+    for symbol in symbols:
+        try:
+            if multi:
+                if symbol not in data.columns.get_level_values(0):
+                    continue
+                closes = data[symbol]['Close'].dropna()
+            else:
+                closes = data['Close'].dropna()
+        except KeyError:
+            continue
+        
+        if closes.empty:
+            continue
+        
+        price = float(closes.iloc[-1])
+        change_pts = 0.0
+        change_pct = 0.0
+        if len(closes) >= 2:
+            prev = float(closes.iloc[-2])
+            change_pts = price - prev
+            change_pct = (change_pts / prev) * 100 if prev else 0.0
+        snapshot[symbol] = (price, change_pts, change_pct)
+    
+    return snapshot
+
+
 def get_current_forex_rates():
     """
     Get current forex rates for EUR/USD, GBP/USD, JPY/USD, CHF/USD from Yahoo Finance with % change.
@@ -1554,13 +1638,7 @@ def get_current_forex_rates():
         import yfinance as yf
         from datetime import datetime
         
-        # Define currency pairs
-        currencies = {
-            'EUR': 'EURUSD=X',
-            'GBP': 'GBPUSD=X',
-            'JPY': 'JPY=X',
-            'CHF': 'CHF=X'
-        }
+        currencies = FOREX_SYMBOLS
         
         result = {'success': True}
         latest_timestamp = None
@@ -1643,24 +1721,7 @@ def get_major_indexes_prices():
             'success': bool
         }
     """
-    # Define major indexes, commodities, and bonds
-    indexes = [
-        # Major Indexes
-        {'name': 'S&P 500', 'symbol': '^GSPC'},
-        {'name': 'Nasdaq', 'symbol': '^IXIC'},
-        {'name': 'Dow Jones', 'symbol': '^DJI'},
-        {'name': 'DAX', 'symbol': '^GDAXI'},
-        {'name': 'CAC 40', 'symbol': '^FCHI'},
-        {'name': 'FTSE 100', 'symbol': '^FTSE'},
-        {'name': 'Nikkei 225', 'symbol': '^N225'},
-        {'name': 'Hang Seng', 'symbol': '^HSI'},
-        # Commodities
-        {'name': 'Gold', 'symbol': 'GC=F'},
-        {'name': 'Silver', 'symbol': 'SI=F'},
-        {'name': 'Oil (WTI)', 'symbol': 'CL=F'},
-        # Bonds
-        {'name': 'US 10Y Treasury', 'symbol': '^TNX'},
-    ]
+    indexes = MAJOR_INDEXES
     
     try:
         import yfinance as yf
@@ -9,9 +9,15 @@ Contient tous les calculs sophistiqués :
 - Calculs de beta vs benchmark
 """
 
+import os
+import threading
+import multiprocessing
 import numpy as np
 import pandas as pd
 import streamlit as st
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from .config import MC_PARALLEL_MIN_PATHS, MC_CHUNKS, MC_CACHE_TTL, MC_CACHE_MAX_ENTRIES, METRICS_CACHE_TTL
 
 # ===================== COVARIANCE ESTIMATION =====================
 
@@ -38,6 +44,28 @@ def ledoit_cov(X: np.ndarray):
     except Exception:
         return np.cov(X, rowvar=False, ddof=1)
 
+# ===================== CORRELATION =====================
+
+def correlation_matrix(rets: pd.DataFrame):
+    """
+    Matrice de corrélation via un seul produit matriciel (BLAS SGEMM)
+    
+    Les retours sont centrés-réduits en float32 contigu, puis
+    C = Rᵀ R / T. Équivalent à rets.corr() pour des données sans NaN.
+    
+    Args:
+        rets (pd.DataFrame): Retours sans NaN (observations x assets)
+    
+    Returns:
+        pd.DataFrame: Matrice de corrélation (assets x assets)
+    """
+    R = np.ascontiguousarray(rets.values, dtype=np.float32)
+    R -= R.mean(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        R /= R.std(axis=0)
+    C = np.clip((R.T @ R) / R.shape[0], -1.0, 1.0)
+    return pd.DataFrame(C, index=rets.columns, columns=rets.columns)
+
 # ===================== PORTFOLIO METRICS =====================
 
 def compute_portfolio_metrics(prices: pd.DataFrame, weights_raw: dict, 
@@ -60,6 +88,7 @@ def compute_portfolio_metrics(prices: pd.DataFrame, weights_raw: dict,
             - mu_a: Retours annualisés moyens
             - cov_a: Matrice de covariance annualisée
             - port_ret_d: Series des retours du portfolio
+            - port_cum_d: Series de la valeur cumulée du portfolio (base 1)
             - corr: Matrice de corrélation
             - cr_pct: Contributions au risque (%)
             - vol_a: Volatilité annualisée du portfolio
@@ -99,6 +128,7 @@ def compute_portfolio_metrics(prices: pd.DataFrame, weights_raw: dict,
     
     # Retours du portfolio
     port_ret_d = pd.Series(rets.values @ w, index=rets.index, name="Portfolio")
+    port_cum_d = (1 + port_ret_d).cumprod()
     
     # Contributions au risque (Risk Contributions)
     vol_a = float(np.sqrt(w @ cov_a @ w))
@@ -114,11 +144,42 @@ def compute_portfolio_metrics(prices: pd.DataFrame, weights_raw: dict,
         "mu_a": mu_a,
         "cov_a": cov_a,
         "port_ret_d": port_ret_d,
-        "corr": rets.corr(),
+        "port_cum_d": port_cum_d,
+        "corr": correlation_matrix(rets),
         "cr_pct": cr_pct,
         "vol_a": vol_a
     }
 
+def _prices_fingerprint(df: pd.DataFrame):
+    """
+    Empreinte du contenu complet d'un DataFrame de prix
+    
+    Les prix sont ajustés (auto_adjust) : un dividende ou un split réécrit tout
+    l'historique sans changer la forme ni la dernière ligne, on hache donc
+    toutes les valeurs (et l'index) plutôt qu'un résumé.
+    """
+    return (tuple(df.columns), pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+
+@st.cache_data(ttl=METRICS_CACHE_TTL, show_spinner=False,
+               hash_funcs={pd.DataFrame: _prices_fingerprint})
+def compute_portfolio_metrics_cached(prices: pd.DataFrame, weights_items: tuple,
+                                     cov_method="ledoit", annualization=252):
+    """
+    Version mémoïsée de compute_portfolio_metrics
+    
+    Relancer l'analyse après un simple changement de graphiques ou de capital
+    réutilise les métriques (et la covariance Ledoit-Wolf) déjà calculées.
+    
+    Args:
+        prices (pd.DataFrame): Prix historiques, hachés via _prices_fingerprint
+        weights_items (tuple): Paires (ticker, weight) triées
+    
+    Returns:
+        dict: Voir compute_portfolio_metrics
+    """
+    return compute_portfolio_metrics(prices, dict(weights_items),
+                                     cov_method=cov_method, annualization=annualization)
+
 # ===================== BENCHMARK METRICS =====================
 
 def compute_benchmark_params(bench_prices: pd.DataFrame, bench_def: list, 
@@ -325,7 +386,7 @@ def mc_gaussian(mu_a, cov_a, w, start_value, steps, paths, month_factor=12):
     return out
 
 def mc_gaussian_with_randomness(mu_a, cov_a, w, start_value, steps, paths, 
-                                randomness_factor=0.30, month_factor=12):
+                                randomness_factor=0.30, month_factor=12, seed=None):
     """
     Simulation Monte Carlo avec sauts aléatoires et volatilité stochastique
     
@@ -343,10 +404,12 @@ def mc_gaussian_with_randomness(mu_a, cov_a, w, start_value, steps, paths,
         paths (int): Nombre de simulations
         randomness_factor (float): Facteur de randomness (0.3 = 30%)
         month_factor (int): Conversion annuel → mensuel
+        seed (int): Graine du générateur (None = aléatoire)
     
     Returns:
         np.ndarray: Matrice (steps+1, paths) des valeurs simulées
     """
+    rng = np.random.default_rng(seed)
     w = w.reshape(-1, 1)
     mu_m = (mu_a / month_factor).reshape(-1, 1)
     cov_m = cov_a / month_factor
@@ -362,16 +425,16 @@ def mc_gaussian_with_randomness(mu_a, cov_a, w, start_value, steps, paths,
     
     for t in range(1, steps + 1):
         # Simulation normale de base
-        Z = np.random.randn(cov_m.shape[0], paths)
+        Z = rng.standard_normal((cov_m.shape[0], paths))
         r_normal = mu_m + L @ Z
         
         # Sauts aléatoires (jump process)
         jump_prob = 0.05  # 5% de chance de saut par mois
-        jump_size = np.random.normal(0, randomness_factor, (cov_m.shape[0], paths))
-        jump_mask = np.random.random((cov_m.shape[0], paths)) < jump_prob
+        jump_size = rng.normal(0, randomness_factor, (cov_m.shape[0], paths))
+        jump_mask = rng.random((cov_m.shape[0], paths)) < jump_prob
         
         # Volatilité stochastique (varie dans le temps)
-        vol_multiplier = 1 + np.random.normal(0, randomness_factor / 2, (cov_m.shape[0], paths))
+        vol_multiplier = 1 + rng.normal(0, randomness_factor / 2, (cov_m.shape[0], paths))
         vol_multiplier = np.clip(vol_multiplier, 0.5, 2.0)  # Entre 0.5x et 2x
         
         # Application des effets
@@ -389,6 +452,83 @@ def mc_gaussian_with_randomness(mu_a, cov_a, w, start_value, steps, paths,
     
     return out
 
+@st.cache_data(ttl=MC_CACHE_TTL, max_entries=MC_CACHE_MAX_ENTRIES, show_spinner=False)
+def run_monte_carlo_cached(mu_a, cov_a, w, start_value, steps, paths,
+                           randomness_factor=0.30, seed=42):
+    """
+    Version mémoïsée de mc_gaussian_with_randomness
+    
+    Graine fixe : mêmes entrées (mu, cov, poids, capital, paths) → mêmes
+    chemins, donc relancer l'analyse sans changement de portfolio ne
+    refait pas la simulation. Les tableaux numpy font partie de la clé
+    (st.cache_data les hache sur leurs octets) ; ttl et max_entries bornent
+    la mémoire occupée par les matrices en cache. Stockées en float32 (assez
+    pour l'affichage) : moitié moins de mémoire en cache et en session.
+    
+    Returns:
+        np.ndarray: Matrice float32 (steps+1, paths) des valeurs simulées
+    """
+    return mc_parallel(
+        mu_a=mu_a, cov_a=cov_a, w=w, start_value=start_value,
+        steps=steps, paths=paths, randomness_factor=randomness_factor, seed=seed
+    ).astype(np.float32, copy=False)
+
+_MC_POOL = None
+_MC_POOL_LOCK = threading.Lock()
+
+def _mc_pool(workers):
+    """
+    Pool de processus partagé, créé au premier calcul parallèle
+    
+    Démarrage en "spawn" : un fork du serveur Streamlit (multithreadé) risque
+    de bloquer les processus enfants. Le pool est gardé d'un run à l'autre
+    pour ne payer le lancement des processus qu'une fois.
+    """
+    global _MC_POOL
+    with _MC_POOL_LOCK:
+        if _MC_POOL is None:
+            _MC_POOL = ProcessPoolExecutor(max_workers=workers,
+                                           mp_context=multiprocessing.get_context("spawn"))
+        return _MC_POOL
+
+def _reset_mc_pool():
+    """Abandonne un pool cassé : le prochain calcul parallèle en recrée un"""
+    global _MC_POOL
+    with _MC_POOL_LOCK:
+        pool, _MC_POOL = _MC_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def mc_parallel(mu_a, cov_a, w, start_value, steps, paths, randomness_factor=0.30, seed=None):
+    """
+    mc_gaussian_with_randomness réparti sur plusieurs processus
+    
+    Les paths sont découpés en MC_CHUNKS blocs, chacun avec son propre flux
+    aléatoire (SeedSequence.spawn : flux indépendants et reproductibles), puis
+    concaténés. Le découpage ne dépend pas du nombre de coeurs, donc une même
+    graine donne les mêmes chemins sur toutes les machines.
+    
+    Returns:
+        np.ndarray: Matrice (steps+1, paths) des valeurs simulées
+    """
+    workers = min(os.cpu_count() or 1, MC_CHUNKS)
+    chunk_sizes = [len(c) for c in np.array_split(np.arange(paths), MC_CHUNKS) if len(c)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    n = len(chunk_sizes)
+    args = ([mu_a] * n, [cov_a] * n, [w] * n, [start_value] * n, [steps] * n,
+            chunk_sizes, [randomness_factor] * n, [12] * n, seeds)
+    
+    if paths < MC_PARALLEL_MIN_PATHS or workers < 2:
+        return np.concatenate(list(map(mc_gaussian_with_randomness, *args)), axis=1)
+    
+    try:
+        arrays = list(_mc_pool(workers).map(mc_gaussian_with_randomness, *args))
+    except (OSError, BrokenProcessPool):
+        # Environnement sans processus enfants : repli séquentiel, mêmes flux
+        _reset_mc_pool()
+        arrays = list(map(mc_gaussian_with_randomness, *args))
+    return np.concatenate(arrays, axis=1)
+
 def mc_single_asset(mu_ann, vol_ann, start_value, steps, paths, month_factor=12):
     """
     Simulation Monte Carlo pour un actif unique (benchmark)
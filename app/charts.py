@@ -103,7 +103,7 @@ def create_chart_2_value_distribution(weights_series, capital):
     
     return fig
 
-def create_chart_3_cumulative_returns(portfolio_returns, prices=None, tickers=None):
+def create_chart_3_cumulative_returns(portfolio_returns, prices=None, tickers=None, cumulative=None):
     """
     Chart 3: Cumulative Returns Over Time
     
@@ -111,9 +111,10 @@ def create_chart_3_cumulative_returns(portfolio_returns, prices=None, tickers=No
         portfolio_returns (pd.Series): Daily portfolio returns
         prices (pd.DataFrame): Optional individual asset prices
         tickers (list): Optional list of tickers to display
+        cumulative (pd.Series): Optional precomputed cumulative returns
     """
     # Calculate cumulative returns
-    cumulative_portfolio = (1 + portfolio_returns).cumprod()
+    cumulative_portfolio = cumulative if cumulative is not None else (1 + portfolio_returns).cumprod()
     
     fig = go.Figure()
     
@@ -128,18 +129,19 @@ def create_chart_3_cumulative_returns(portfolio_returns, prices=None, tickers=No
     
     # Individual assets if provided
     if prices is not None and tickers is not None:
-        for i, ticker in enumerate(tickers):
-            if ticker in prices.columns:
-                asset_returns = prices[ticker].pct_change().dropna()
-                cumulative_asset = (1 + asset_returns).cumprod()
-                fig.add_trace(go.Scatter(
-                    x=cumulative_asset.index,
-                    y=cumulative_asset.values,
-                    mode='lines',
-                    name=ticker,
-                    line=dict(width=1.5, dash='dot'),
-                    opacity=0.6
-                ))
+        # Cumulative returns for all assets in one pass (cumprod skips the leading NaNs)
+        asset_cols = [t for t in tickers if t in prices.columns]
+        cumulative_assets = (1 + prices[asset_cols].pct_change()).cumprod()
+        for ticker in asset_cols:
+            cumulative_asset = cumulative_assets[ticker].dropna()
+            fig.add_trace(go.Scatter(
+                x=cumulative_asset.index,
+                y=cumulative_asset.values,
+                mode='lines',
+                name=ticker,
+                line=dict(width=1.5, dash='dot'),
+                opacity=0.6
+            ))
     
     fig.update_layout(
         title="Cumulative Returns",
@@ -269,8 +271,37 @@ def create_chart_6_rolling_volatility(portfolio_returns, window=252):
     return fig
 
 # ===================== MONTE CARLO CHARTS (7-12) =====================
+# Simulations are (steps+1, paths) in C order: the last row (final values)
+# is one contiguous block, read without an intermediate copy
+
+def mc_final_returns(simulations):
+    """
+    Final simple return of every simulated path
+    
+    Args:
+        simulations (np.ndarray): Shape (steps+1, paths), row 0 = start value
+    
+    Returns:
+        np.ndarray: Shape (paths,)
+    """
+    return simulations[-1] / simulations[0, 0] - 1
+
+MC_ENVELOPE_PERCENTILES = (5, 10, 25, 50, 75, 90, 95)
+
+def mc_percentile_envelope(simulations):
+    """
+    Per-step percentile bands shared by charts 7 and 10 (one sort for both)
+    
+    Args:
+        simulations (np.ndarray): Shape (steps+1, paths)
+    
+    Returns:
+        dict: {percentile: np.ndarray of shape (steps+1,)} for MC_ENVELOPE_PERCENTILES
+    """
+    bands = np.percentile(simulations, MC_ENVELOPE_PERCENTILES, axis=1)
+    return dict(zip(MC_ENVELOPE_PERCENTILES, bands))
 
-def create_chart_7_mc_price_paths(simulations, capital, n_display=1000):
+def create_chart_7_mc_price_paths(simulations, capital, n_display=1000, envelope=None):
     """
     Chart 7: Monte Carlo Price Projections
     
@@ -278,11 +309,12 @@ def create_chart_7_mc_price_paths(simulations, capital, n_display=1000):
         simulations (np.ndarray): Shape (steps+1, paths)
         capital (float): Starting capital
         n_display (int): Number of paths to display
+        envelope (dict, optional): Precomputed mc_percentile_envelope(simulations)
     """
     steps, paths = simulations.shape
     
-    # Sample paths to display
-    display_indices = np.random.choice(paths, min(n_display, paths), replace=False)
+    # Sample paths to display (fixed seed: the same paths on every rerun)
+    display_indices = np.random.default_rng(0).choice(paths, min(n_display, paths), replace=False)
     
     fig = go.Figure()
     
@@ -298,9 +330,9 @@ def create_chart_7_mc_price_paths(simulations, capital, n_display=1000):
         ))
     
     # Statistical paths
-    median_path = np.median(simulations, axis=1)
-    p10_path = np.percentile(simulations, 10, axis=1)
-    p90_path = np.percentile(simulations, 90, axis=1)
+    if envelope is None:
+        envelope = mc_percentile_envelope(simulations)
+    median_path, p10_path, p90_path = envelope[50], envelope[10], envelope[90]
     
     fig.add_trace(go.Scatter(
         x=list(range(steps)),
@@ -348,7 +380,7 @@ def create_chart_8_mc_returns_distribution(simulations):
     """
     Chart 8: Monte Carlo Returns Distribution
     """
-    final_returns = (simulations[-1, :] / simulations[0, :] - 1) * 100
+    final_returns = mc_final_returns(simulations) * 100
     
     fig = go.Figure()
     
@@ -387,7 +419,7 @@ def create_chart_9_var_analysis(simulations, confidence_levels=[0.95, 0.99]):
     """
     from app.calculations import calculate_var
     
-    final_returns = (simulations[-1, :] / simulations[0, :] - 1)
+    final_returns = mc_final_returns(simulations)
     
     fig = go.Figure()
     
@@ -420,18 +452,16 @@ def create_chart_9_var_analysis(simulations, confidence_levels=[0.95, 0.99]):
     
     return fig
 
-def create_chart_10_confidence_intervals(simulations):
+def create_chart_10_confidence_intervals(simulations, envelope=None):
     """
     Chart 10: Confidence Intervals Over Time
     """
     steps = simulations.shape[0]
     
-    # Calculate percentiles over time
-    p5 = np.percentile(simulations, 5, axis=1)
-    p25 = np.percentile(simulations, 25, axis=1)
-    p50 = np.percentile(simulations, 50, axis=1)
-    p75 = np.percentile(simulations, 75, axis=1)
-    p95 = np.percentile(simulations, 95, axis=1)
+    # Percentiles over time: precomputed envelope, or one call for all levels
+    if envelope is None:
+        envelope = mc_percentile_envelope(simulations)
+    p5, p25, p50, p75, p95 = (envelope[q] for q in (5, 25, 50, 75, 95))
     
     fig = go.Figure()
     
@@ -487,7 +517,7 @@ def create_chart_11_risk_adjusted_performance(simulations, risk_free_rate=0.02):
     from app.calculations import calculate_sharpe_ratio
     
     # Calculate final returns for each path
-    final_returns = (simulations[-1, :] / simulations[0, :] - 1)
+    final_returns = mc_final_returns(simulations)
     
     # Calculate metrics
     mean_return = final_returns.mean()
@@ -533,12 +563,10 @@ def create_chart_12_scenario_analysis(simulations, capital):
     """
     Chart 12: Scenario Analysis (Best/Expected/Worst)
     """
-    final_values = simulations[-1, :]
+    final_values = simulations[-1]
     
-    # Calculate scenarios
-    best_case = np.percentile(final_values, 95)
-    expected = np.median(final_values)
-    worst_case = np.percentile(final_values, 5)
+    # Calculate scenarios (single partition pass for the three percentiles)
+    worst_case, expected, best_case = np.percentile(final_values, [5, 50, 95])
     
     scenarios = {
         'Best Case (95th)': best_case,
@@ -610,14 +638,15 @@ def create_chart_13_sharpe_evolution(portfolio_returns, window=252, risk_free_ra
     
     return fig
 
-def create_chart_14_max_drawdown(portfolio_returns):
+def create_chart_14_max_drawdown(portfolio_returns, cumulative=None):
     """
     Chart 14: Maximum Drawdown Analysis
     """
     from app.calculations import calculate_max_drawdown
     
     # Calculate cumulative returns
-    cumulative = (1 + portfolio_returns).cumprod()
+    if cumulative is None:
+        cumulative = (1 + portfolio_returns).cumprod()
     running_max = cumulative.cummax()
     drawdown = (cumulative - running_max) / running_max * 100
     
@@ -986,7 +1015,7 @@ def create_chart_22_geographic_exposure(weights_series, country_mapping):
     
     return fig
 
-def create_chart_23_market_regime(portfolio_returns, window=60):
+def create_chart_23_market_regime(portfolio_returns, window=60, cumulative=None):
     """
     Chart 23: Market Regime Analysis (Bull/Bear/Neutral)
     """
@@ -1014,7 +1043,8 @@ def create_chart_23_market_regime(portfolio_returns, window=60):
     fig = go.Figure()
     
     # Plot cumulative returns colored by regime
-    cumulative = (1 + portfolio_returns).cumprod()
+    if cumulative is None:
+        cumulative = (1 + portfolio_returns).cumprod()
     
     fig.add_trace(go.Scatter(
         x=cumulative.index,
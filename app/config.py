@@ -108,6 +108,11 @@ DEFAULT_CAPITAL = 10000.0
 DEFAULT_CURRENCY = "USD"
 DEFAULT_PERIOD = "1y"
 DEFAULT_MONTE_CARLO_SIMULATIONS = 1000
+MC_PARALLEL_MIN_PATHS = 2000  # En dessous, le coût de lancement des processus dépasse le gain
+MC_CHUNKS = 8  # Découpage fixe des paths : résultat identique quel que soit le nombre de coeurs
+MC_CACHE_TTL = 1800  # 30 minutes : une matrice 100K paths pèse ~50 Mo, on ne la garde pas indéfiniment
+MC_CACHE_MAX_ENTRIES = 8
+METRICS_CACHE_TTL = 1800  # Métriques (Ledoit-Wolf) réutilisées tant que prix et poids ne changent pas
 DEFAULT_VAR_CONFIDENCE = 0.95
 
 # ===================== API SETTINGS =====================
@@ -115,6 +120,18 @@ DEFAULT_VAR_CONFIDENCE = 0.95
 YAHOO_FINANCE_TIMEOUT = 5
 MAX_SEARCH_RESULTS = 10
 CACHE_TTL_SECONDS = 120  # 2 minutes pour les données générales
+TICKER_INFO_CACHE_TTL = 900  # 15 minutes pour la validation (métadonnées quasi statiques)
+PRICE_CACHE_TTL = 60  # 1 minute pour le prix courant d'un ticker
+HISTORY_CACHE_TTL = 3600  # 1 heure pour l'historique utilisé par Run Analysis
+HISTORY_CACHE_MAX_ENTRIES = 32  # Jeux (tickers, période) d'historique gardés en mémoire
+HTTP_CACHE_PATH = ".cache/yahoo_http"  # Cache HTTP SQLite (persiste entre redémarrages)
+HTTP_CACHE_EXPIRE = 3600  # 1 heure pour les réponses de recherche Yahoo
+SEARCH_CACHE_TTL = 3600  # 1 heure pour les résultats de recherche (par requête normalisée)
+SEARCH_CACHE_MAX_ENTRIES = 1024  # Préfixes déjà tapés gardés en mémoire
+SEARCH_MIN_QUERY_LENGTH = 2  # Pas de recherche sur une seule lettre
 MARKET_DATA_CACHE_TTL = 5  # 5 secondes pour live market data
+INDEXES_CACHE_TTL = 30  # 30 secondes pour les indices (bougent le plus en séance)
+FOREX_CACHE_TTL = 60  # 1 minute pour les paires de devises
+COMMODITIES_CACHE_TTL = 120  # 2 minutes pour les matières premières
 MARKET_DATA_REFRESH_INTERVAL = 5  # Auto-refresh toutes les 5 secondes
 
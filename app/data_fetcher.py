@@ -8,11 +8,38 @@ import pandas as pd
 import requests
 import streamlit as st
 from datetime import datetime
-from .config import POPULAR_TICKERS, YAHOO_FINANCE_TIMEOUT, MAX_SEARCH_RESULTS, CACHE_TTL_SECONDS, MARKET_DATA_CACHE_TTL
+from .config import (
+    POPULAR_TICKERS, YAHOO_FINANCE_TIMEOUT, MAX_SEARCH_RESULTS, CACHE_TTL_SECONDS,
+    MARKET_DATA_CACHE_TTL, TICKER_INFO_CACHE_TTL, PRICE_CACHE_TTL,
+    HISTORY_CACHE_TTL, HISTORY_CACHE_MAX_ENTRIES,
+    HTTP_CACHE_PATH, HTTP_CACHE_EXPIRE
+)
+
+# ===================== HTTP SESSION =====================
+
+def _create_http_session():
+    """
+    Session HTTP pour les appels directs à Yahoo (hors yfinance)
+    
+    Utilise requests_cache (SQLite sur disque) si disponible : les réponses
+    survivent aux reruns et redémarrages du conteneur. yfinance refuse les
+    sessions avec cache, il garde donc sa propre session.
+    """
+    try:
+        import requests_cache
+        return requests_cache.CachedSession(
+            HTTP_CACHE_PATH, backend="sqlite",
+            expire_after=HTTP_CACHE_EXPIRE, allowable_methods=("GET",)
+        )
+    except ImportError:
+        # Fallback : session simple (keep-alive uniquement)
+        return requests.Session()
+
+HTTP_SESSION = _create_http_session()
 
 # ===================== TICKER VALIDATION =====================
 
-@st.cache_data(ttl=CACHE_TTL_SECONDS)
+@st.cache_data(ttl=TICKER_INFO_CACHE_TTL)
 def validate_and_get_ticker_info(symbol):
     """
     Valide un ticker et récupère ses informations
@@ -100,7 +127,7 @@ def search_tickers(query):
             url = "https://query2.finance.yahoo.com/v1/finance/search"
             params = {"q": query, "quotesCount": MAX_SEARCH_RESULTS, "lang": "en-US"}
             headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-            resp = requests.get(url, params=params, headers=headers, timeout=YAHOO_FINANCE_TIMEOUT)
+            resp = HTTP_SESSION.get(url, params=params, headers=headers, timeout=YAHOO_FINANCE_TIMEOUT)
             
             if resp.status_code == 200:
                 data = resp.json()
@@ -121,7 +148,7 @@ def search_tickers(query):
 
 # ===================== PRICE DATA =====================
 
-@st.cache_data(ttl=CACHE_TTL_SECONDS)
+@st.cache_data(ttl=HISTORY_CACHE_TTL, max_entries=HISTORY_CACHE_MAX_ENTRIES, show_spinner=False)
 def fetch_historical_prices(tickers, period="1y"):
     """
     Récupère les prix historiques pour une liste de tickers
@@ -159,7 +186,7 @@ def fetch_historical_prices(tickers, period="1y"):
         st.code(traceback.format_exc())
         return None
 
-@st.cache_data(ttl=CACHE_TTL_SECONDS)
+@st.cache_data(ttl=PRICE_CACHE_TTL)
 def get_current_price(symbol):
     """
     Récupère le prix actuel d'un ticker
@@ -177,6 +204,42 @@ def get_current_price(symbol):
     except:
         return None
 
+@st.cache_data(ttl=PRICE_CACHE_TTL)
+def get_current_prices(symbols):
+    """
+    Récupère le dernier cours de plusieurs tickers en un seul appel yf.download
+    
+    Args:
+        symbols (tuple): Symboles des tickers (tuple trié pour une clé de cache stable)
+    
+    Returns:
+        dict: {symbole: prix} pour les tickers disponibles
+    """
+    if not symbols:
+        return {}
+    
+    try:
+        # period='5d' : garantit au moins une clôture hors séance / week-end
+        hist = yf.download(list(symbols), period="5d", group_by='ticker', threads=True,
+                           progress=False, auto_adjust=False)
+    except Exception:
+        return {}
+    
+    if hist is None or hist.empty:
+        return {}
+    
+    # Les anciennes versions de yfinance renvoient des colonnes plates pour un seul ticker
+    multi = isinstance(hist.columns, pd.MultiIndex)
+    prices = {}
+    for symbol in symbols:
+        try:
+            closes = (hist[symbol]['Close'] if multi else hist['Close']).dropna()
+        except KeyError:
+            continue
+        if not closes.empty:
+            prices[symbol] = float(closes.iloc[-1])
+    return prices
+
 # ===================== MARKET DATA =====================
 
 @st.cache_data(ttl=MARKET_DATA_CACHE_TTL)
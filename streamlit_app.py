@@ -10,23 +10,31 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import yfinance as yf
-from datetime import datetime, timedelta
-import plotly.express as px
+from datetime import datetime
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import requests
+import plotly.io as pio
+import csv
+import re
+import io
+import math
+import threading
+import hashlib
+import pickle
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Import modules personnalisés
 from app.config import (
-    CHART_COLORS, CHART_DESCRIPTIONS, POPULAR_TICKERS, 
-    QUICK_SELECT_OPTIONS, MARKET_DATA_REFRESH_INTERVAL
+    QUICK_SELECT_OPTIONS, MARKET_DATA_REFRESH_INTERVAL, YAHOO_FINANCE_TIMEOUT,
+    SEARCH_CACHE_TTL, SEARCH_CACHE_MAX_ENTRIES, SEARCH_MIN_QUERY_LENGTH,
+    FOREX_CACHE_TTL, INDEXES_CACHE_TTL, COMMODITIES_CACHE_TTL
 )
 from app.data_fetcher import (
     validate_and_get_ticker_info as validate_ticker_new,
     search_tickers as search_tickers_new,
     fetch_historical_prices as fetch_prices_new,
-    get_current_price,
-    fetch_market_data,
+    get_current_prices,
     fetch_market_news,
     fetch_ohlc_data,
     fetch_sparkline_data,
@@ -34,15 +42,14 @@ from app.data_fetcher import (
     fetch_regional_markets
 )
 from app.calculations import (
-    compute_portfolio_metrics,
-    mc_gaussian_with_randomness,
+    compute_portfolio_metrics_cached,
+    run_monte_carlo_cached,
     calculate_sharpe_ratio,
     calculate_var,
     calculate_expected_shortfall,
-    calculate_max_drawdown,
-    calculate_calmar_ratio
+    calculate_max_drawdown
 )
-from app.charts import get_chart_function, CHART_FUNCTIONS
+from app.charts import get_chart_function, CHART_FUNCTIONS, mc_percentile_envelope
 
 # ===================== PAGE CONFIGURATION =====================
 st.set_page_config(
@@ -52,6 +59,15 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+# ===================== APP SECTIONS =====================
+APP_SECTIONS = ["MARKET DATA", "PORTFOLIO", "ANALYTICS", "RESULTS"]
+
+BENCHMARK_OPTIONS = {
+    '^GSPC': 'S&P 500', '^NDX': 'Nasdaq 100', '^DJI': 'Dow Jones',
+    '^GDAXI': 'DAX', '^FCHI': 'CAC 40', '^STOXX50E': 'Euro Stoxx 50',
+    '^FTSE': 'FTSE 100', '^N225': 'Nikkei 225', 'GC=F': 'Gold',
+}
+
 # ===================== CHART DEFINITIONS (24 Charts) =====================
 CHART_GROUPS = {
     "PORTFOLIO & SECTOR": [1, 2, 3, 4, 5, 6],
@@ -61,6 +77,15 @@ CHART_GROUPS = {
     "SECTOR & REGIME": [22, 23, 24],
 }
 
+# Quick-select presets: button key -> (label, charts selected)
+CHART_PRESETS = {
+    "btn_all": ("Select All", list(range(1, 25))),
+    "btn_none": ("Clear All", []),
+    "btn_portfolio": ("Portfolio", CHART_GROUPS["PORTFOLIO & SECTOR"]),
+    "btn_mc": ("Monte Carlo", CHART_GROUPS["MONTE CARLO SIMULATION"]),
+    "btn_risk": ("Risk Metrics", CHART_GROUPS["RISK METRICS"]),
+}
+
 CHART_NAMES = {
     1: "Allocation", 2: "Correlation", 3: "Risk Contrib",
     4: "vs Benchmarks", 5: "Sector Decomp", 6: "Sector Risk",
@@ -99,8 +124,23 @@ CHART_DESCRIPTIONS = {
     24: "Sector rotation analysis showing momentum shifts between sectors. Identify trending sectors."
 }
 
+# Lignes du résumé exporté en CSV (onglet Results)
+SUMMARY_METRIC_NAMES = ['Total Return', 'Annual Return', 'Volatility', 'Sharpe Ratio', 'Max Drawdown', 'VaR 95%', 'CVaR 95%']
+
+# Graphiques lourds (volatilité rolling, paths MC) affichés repliés dans un expander
+COLLAPSED_CHARTS = {6, 7}
+
+# Graphiques qui consomment les simulations Monte Carlo (7-12)
+MC_CHARTS = frozenset(CHART_GROUPS["MONTE CARLO SIMULATION"])
+
+# Classification simple des tickers (graphiques 21 et 22), calculée une fois par analyse
+TECH_TICKERS = frozenset({"AAPL", "MSFT", "GOOGL", "GOOG", "NVDA", "AMD", "INTC", "META", "NFLX"})
+FINANCE_TICKERS = frozenset({"JPM", "V", "MA", "BAC", "GS", "MS", "BLK"})
+ETF_MARKERS = ("SPY", "QQQ", "VOO")
+COUNTRY_SUFFIXES = {".PA": "France", ".DE": "Germany", ".AS": "Netherlands"}
+
 # ===================== CUSTOM CSS - LIGHT INSTITUTIONAL =====================
-st.markdown("""
+APP_CSS = """
 <style>
     /* Light Institutional Theme - Interactive Brokers / Fidelity Style */
     
@@ -293,7 +333,13 @@ st.markdown("""
         font-weight: 600;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Minifié une fois à l'import : le bloc est renvoyé au navigateur à chaque rerun
+# (un st.markdown non ré-émis disparaît de la page, on ne peut pas l'injecter une seule fois)
+APP_CSS = "".join(line.strip() for line in re.sub(r"/\*.*?\*/", "", APP_CSS, flags=re.S).splitlines())
+
+st.markdown(APP_CSS, unsafe_allow_html=True)
 
 # ===================== POPULAR TICKERS DATABASE =====================
 # POPULAR_TICKERS maintenant importé depuis app.config
@@ -303,63 +349,101 @@ if 'analysis_results' not in st.session_state:
     st.session_state.analysis_results = None
 
 if 'selected_charts' not in st.session_state:
-    st.session_state.selected_charts = list(range(1, 25))  # All selected by default
+    st.session_state.selected_charts = tuple(range(1, 25))  # All selected by default
+
+if 'chart_mask' not in st.session_state:
+    st.session_state.chart_mask = np.ones(24, dtype=bool)  # Sélection des 24 graphiques (index = numéro - 1)
+
+if 'positions' not in st.session_state:
+    # Grille de saisie du portefeuille (10 lignes : Ticker / Type / Value)
+    st.session_state.positions = pd.DataFrame({
+        'Ticker': [''] * 10,
+        'Type': ['%'] * 10,
+        'Value': [0.0] * 10,
+    })
+
+if 'custom_tickers' not in st.session_state:
+    st.session_state.custom_tickers = {}  # symbol -> libellé, ajoutés via la recherche
+
+if 'selected_benchmarks' not in st.session_state:
+    st.session_state.selected_benchmarks = ['^GSPC', '^NDX']
+# Une seule section est rendue par rerun : Streamlit purge l'état des widgets non
+# affichés, on ré-ancre donc leurs valeurs pour les retrouver en changeant de section
+# (la sélection de graphiques est, elle, reconstruite depuis chart_mask)
+st.session_state.selected_benchmarks = st.session_state.selected_benchmarks
 
 # ===================== HELPER FUNCTIONS =====================
 
-@st.cache_data(ttl=300)
+MARKET_FOREX_PAIRS = {'EUR/USD': 'EURUSD=X', 'GBP/USD': 'GBPUSD=X', 'USD/JPY': 'JPY=X', 'USD/CHF': 'CHF=X'}
+MARKET_INDEXES = {'S&P 500': '^GSPC', 'Nasdaq': '^IXIC', 'Dow Jones': '^DJI', 'DAX': '^GDAXI', 'CAC 40': '^FCHI', 'FTSE 100': '^FTSE'}
+MARKET_COMMODITIES = {'Gold': 'GC=F', 'Silver': 'SI=F', 'Oil (WTI)': 'CL=F'}
+
+def _market_group(name_to_symbol):
+    """Last price and daily change (%) for each symbol of a group, in one batched download"""
+    hist = yf.download(list(name_to_symbol.values()), period="2d", group_by='ticker',
+                       threads=True, progress=False, auto_adjust=False)
+    out = {}
+    for name, symbol in name_to_symbol.items():
+        try:
+            closes = hist[symbol]['Close'].dropna()
+        except KeyError:
+            continue
+        if not closes.empty:
+            current = float(closes.iloc[-1])
+            prev = float(closes.iloc[-2]) if len(closes) >= 2 else current
+            out[name] = {'price': current, 'change': ((current - prev) / prev) * 100}
+    return out
+
+# Un cache par catégorie : chaque groupe expire à son rythme sans invalider les autres
+@st.cache_data(ttl=FOREX_CACHE_TTL, show_spinner=False)
+def _fetch_forex():
+    """Forex pairs quotes"""
+    return _market_group(MARKET_FOREX_PAIRS)
+
+@st.cache_data(ttl=INDEXES_CACHE_TTL, show_spinner=False)
+def _fetch_indexes():
+    """Major indices quotes"""
+    return _market_group(MARKET_INDEXES)
+
+@st.cache_data(ttl=COMMODITIES_CACHE_TTL, show_spinner=False)
+def _fetch_commodities():
+    """Commodities quotes"""
+    return _market_group(MARKET_COMMODITIES)
+
 def fetch_market_data():
     """Fetch current market data for display"""
-    data = {'forex': {}, 'indexes': {}, 'commodities': {}}
-    
-    forex_pairs = {'EUR/USD': 'EURUSD=X', 'GBP/USD': 'GBPUSD=X', 'USD/JPY': 'JPY=X', 'USD/CHF': 'CHF=X'}
-    for name, symbol in forex_pairs.items():
-        try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period="2d")
-            if not hist.empty:
-                current = hist['Close'].iloc[-1]
-                prev = hist['Close'].iloc[-2] if len(hist) >= 2 else current
-                change_pct = ((current - prev) / prev) * 100
-                data['forex'][name] = {'price': current, 'change': change_pct}
-        except:
-            pass
-    
-    indexes = {'S&P 500': '^GSPC', 'Nasdaq': '^IXIC', 'Dow Jones': '^DJI', 'DAX': '^GDAXI', 'CAC 40': '^FCHI', 'FTSE 100': '^FTSE'}
-    for name, symbol in indexes.items():
-        try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period="2d")
-            if not hist.empty:
-                current = hist['Close'].iloc[-1]
-                prev = hist['Close'].iloc[-2] if len(hist) >= 2 else current
-                change_pct = ((current - prev) / prev) * 100
-                data['indexes'][name] = {'price': current, 'change': change_pct}
-        except:
-            pass
-    
-    commodities = {'Gold': 'GC=F', 'Silver': 'SI=F', 'Oil (WTI)': 'CL=F'}
-    for name, symbol in commodities.items():
-        try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period="2d")
-            if not hist.empty:
-                current = hist['Close'].iloc[-1]
-                prev = hist['Close'].iloc[-2] if len(hist) >= 2 else current
-                change_pct = ((current - prev) / prev) * 100
-                data['commodities'][name] = {'price': current, 'change': change_pct}
-        except:
-            pass
-    
-    return data
+    # Les trois groupes expirés sont téléchargés en parallèle
+    with ThreadPoolExecutor(max_workers=3, initializer=add_script_run_ctx,
+                            initargs=(None, get_script_run_ctx())) as executor:
+        forex = executor.submit(_fetch_forex)
+        indexes = executor.submit(_fetch_indexes)
+        commodities = executor.submit(_fetch_commodities)
+        return {
+            'forex': forex.result(),
+            'indexes': indexes.result(),
+            'commodities': commodities.result(),
+        }
 
 # ===================== WRAPPERS FOR COMPATIBILITY =====================
 # Ces fonctions appellent les nouvelles fonctions de app.data_fetcher
 
 def search_tickers(query):
-    """Wrapper for search_tickers_new"""
+    """Wrapper for search_tickers_new (normalized query, cached per prefix)"""
+    query = (query or "").upper().strip()
+    if len(query) < SEARCH_MIN_QUERY_LENGTH:
+        return []
+    return _search_tickers_cached(query)
+
+@st.cache_data(ttl=SEARCH_CACHE_TTL, max_entries=SEARCH_CACHE_MAX_ENTRIES, show_spinner=False)
+def _search_tickers_cached(query):
+    """Cached search_tickers_new lookup, keyed on the normalized query"""
     return search_tickers_new(query)
 
+@st.cache_data(show_spinner=False)
+def quick_select_labels(options):
+    """Ticker -> display label for the quick-select list, built once"""
+    return {t[0]: (f"{t[0]} - {t[1]}" if t[0] else t[1]) for t in options}
+
 def validate_and_get_ticker_info(symbol):
     """Wrapper for validate_ticker_new"""
     return validate_ticker_new(symbol)
@@ -372,41 +456,93 @@ def fetch_historical_prices(tickers, years="max"):
         period = f"{years}y"
     return fetch_prices_new(tickers, period=period)
 
+def fetch_prices_cached(tickers, period="max"):
+    """Historical closes for Run Analysis; sorted so reordering positions keeps fetch_prices_new's cache hit"""
+    return fetch_prices_new(sorted(set(tickers)), period=period)
+
+# ===================== SESSION STATE SERIALIZATION =====================
+# Les gros résultats (prix, simulations MC) sont stockés en bytes dans
+# st.session_state et décodés uniquement dans l'onglet Results
+
+def pack_prices(prices):
+    """Serialize a price DataFrame to parquet bytes"""
+    buf = io.BytesIO()
+    prices.to_parquet(buf)
+    return buf.getvalue()
+
+def unpack_prices(blob):
+    """Deserialize parquet bytes back to a price DataFrame"""
+    return pd.read_parquet(io.BytesIO(blob))
+
+def pack_array(arr):
+    """Serialize a NumPy array to .npy bytes (None passes through)"""
+    if arr is None:
+        return None
+    buf = io.BytesIO()
+    np.save(buf, arr, allow_pickle=False)
+    return buf.getvalue()
+
+def unpack_array(blob):
+    """Deserialize .npy bytes back to a NumPy array (None passes through)"""
+    if blob is None:
+        return None
+    return np.load(io.BytesIO(blob), allow_pickle=False)
+
 # ===================== FX RATES & CURRENCY HELPERS =====================
 
 # Currency symbols for display
 CURRENCY_SYMBOLS = {"EUR": "€", "USD": "$", "GBP": "£", "CHF": "CHF", "JPY": "¥"}
 
+def _fetch_fx_rate(symbol):
+    """Last close of one FX pair (None if Yahoo returns nothing)"""
+    hist = yf.Ticker(symbol).history(period="1d")
+    return hist['Close'].iloc[-1] if not hist.empty else None
+
+FX_PAIRS = {
+    "EUR": {"USD": "EURUSD=X", "GBP": "EURGBP=X", "CHF": "EURCHF=X", "JPY": "EURJPY=X"},
+    "USD": {"EUR": "USDEUR=X", "GBP": "USDGBP=X", "CHF": "USDCHF=X", "JPY": "USDJPY=X"},
+    "GBP": {"EUR": "GBPEUR=X", "USD": "GBPUSD=X", "CHF": "GBPCHF=X", "JPY": "GBPJPY=X"},
+    "CHF": {"EUR": "CHFEUR=X", "USD": "CHFUSD=X", "GBP": "CHFGBP=X", "JPY": "CHFJPY=X"},
+    "JPY": {"EUR": "JPYEUR=X", "USD": "JPYUSD=X", "GBP": "JPYGBP=X", "CHF": "JPYCHF=X"},
+}
+
+# Taux approximatifs (vs EUR) pour les paires échouées ou hors délai
+FX_FALLBACK_RATES = {"EUR": 1.0, "USD": 1.08, "GBP": 0.86, "CHF": 0.94, "JPY": 160.0}
+
 @st.cache_data(ttl=300)
+def _fetch_live_fx_rates(base_currency):
+    """Real quotes only, {currency: rate} vs base; failed pairs are left out (never cached as fallbacks)"""
+    rates = {}
+    pairs = FX_PAIRS.get(base_currency, {})
+    if not pairs:
+        return rates
+    
+    # Requêtes en parallèle : une paire lente ne bloque plus les autres
+    executor = ThreadPoolExecutor(max_workers=len(pairs))
+    futures = {executor.submit(_fetch_fx_rate, symbol): target for target, symbol in pairs.items()}
+    try:
+        for future in as_completed(futures, timeout=YAHOO_FINANCE_TIMEOUT):
+            if future.exception() is None and future.result() is not None:
+                rates[futures[future]] = future.result()
+    except FuturesTimeoutError:
+        pass  # Paires trop lentes : complétées hors cache par get_fx_rates
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return rates
+
 def get_fx_rates(base_currency="EUR"):
     """
     Get FX rates relative to base currency
-    Returns dict: {'USD': 1.08, 'GBP': 0.86, ...}
+    Returns (rates, approximated): rates = {'USD': 1.08, 'GBP': 0.86, ...};
+    approximated = currencies filled from FX_FALLBACK_RATES because no live quote came back
     """
-    rates = {base_currency: 1.0}
-    
-    fx_pairs = {
-        "EUR": {"USD": "EURUSD=X", "GBP": "EURGBP=X", "CHF": "EURCHF=X", "JPY": "EURJPY=X"},
-        "USD": {"EUR": "USDEUR=X", "GBP": "USDGBP=X", "CHF": "USDCHF=X", "JPY": "USDJPY=X"},
-        "GBP": {"EUR": "GBPEUR=X", "USD": "GBPUSD=X", "CHF": "GBPCHF=X", "JPY": "GBPJPY=X"},
-        "CHF": {"EUR": "CHFEUR=X", "USD": "CHFUSD=X", "GBP": "CHFGBP=X", "JPY": "CHFJPY=X"},
-        "JPY": {"EUR": "JPYEUR=X", "USD": "JPYUSD=X", "GBP": "JPYGBP=X", "CHF": "JPYCHF=X"},
-    }
-    
-    if base_currency in fx_pairs:
-        for target_currency, symbol in fx_pairs[base_currency].items():
-            try:
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(period="1d")
-                if not hist.empty:
-                    rates[target_currency] = hist['Close'].iloc[-1]
-            except:
-                # Fallback rates (approximate)
-                fallback = {"EUR": 1.0, "USD": 1.08, "GBP": 0.86, "CHF": 0.94, "JPY": 160.0}
-                if target_currency in fallback and base_currency in fallback:
-                    rates[target_currency] = fallback[target_currency] / fallback[base_currency]
-    
-    return rates
+    rates = {base_currency: 1.0, **_fetch_live_fx_rates(base_currency)}
+    approximated = set()
+    for target_currency in FX_PAIRS.get(base_currency, {}):
+        if target_currency not in rates:
+            rates[target_currency] = FX_FALLBACK_RATES[target_currency] / FX_FALLBACK_RATES[base_currency]
+            approximated.add(target_currency)
+    return rates, approximated
 
 def get_ticker_currency(ticker_symbol):
     """
@@ -483,6 +619,7 @@ def create_candlestick_chart(ohlc_data, symbol, show_volume=True):
     
     # Create subplots with volume
     if show_volume:
+        from plotly.subplots import make_subplots  # Import local : seul usage dans l'app
         fig = make_subplots(
             rows=2, cols=1,
             shared_xaxes=True,
@@ -588,31 +725,23 @@ def create_sector_heatmap(sector_data):
 
 # ===================== LIVE PREVIEW CHART (for Portfolio Setup tab) =====================
 
-def create_preview_allocation_chart(portfolio_data, capital):
-    """Create compact live preview allocation chart"""
-    if not portfolio_data:
-        return None
-    
-    labels = [p['ticker'] for p in portfolio_data]
-    weights = [p['weight'] for p in portfolio_data]
-    values = [capital * p['weight'] / 100 for p in portfolio_data]
-    
-    colors = ['#e94560', '#00d26a', '#3742fa', '#ffa502', '#ff6b6b', 
-              '#1e90ff', '#9b59b6', '#2ecc71', '#e74c3c', '#f39c12']
-    
+PREVIEW_COLORS = ['#e94560', '#00d26a', '#3742fa', '#ffa502', '#ff6b6b', 
+                  '#1e90ff', '#9b59b6', '#2ecc71', '#e74c3c', '#f39c12']
+
+@st.cache_resource(show_spinner=False)
+def _preview_pie_skeleton(n):
+    """Donut skeleton (trace styling + layout) for n positions, built once per size"""
     fig = go.Figure(data=[go.Pie(
-        labels=labels,
-        values=weights,
+        labels=[''] * n,
+        values=[0] * n,
         hole=0.5,
-        marker=dict(colors=colors[:len(labels)]),
+        marker=dict(colors=PREVIEW_COLORS[:n]),
         textinfo='label+percent',
         textposition='outside',
         textfont=dict(size=10, color='white'),
-        pull=[0.02] * len(labels)
+        pull=[0.02] * n
     )])
     
-    total_value = sum(values)
-    
     fig.update_layout(
         template="plotly_dark",
         paper_bgcolor='rgba(0,0,0,0)',
@@ -622,7 +751,7 @@ def create_preview_allocation_chart(portfolio_data, capital):
         height=250,
         margin=dict(t=10, b=10, l=10, r=10),
         annotations=[dict(
-            text=f"<b>${total_value:,.0f}</b>",
+            text="",
             x=0.5, y=0.5,
             font=dict(size=14, color='white'),
             showarrow=False
@@ -631,971 +760,1057 @@ def create_preview_allocation_chart(portfolio_data, capital):
     
     return fig
 
+def create_preview_allocation_chart(portfolio_data, capital):
+    """Create compact live preview allocation chart"""
+    if not portfolio_data:
+        return None
+    
+    labels = [p['ticker'] for p in portfolio_data]
+    weights = np.fromiter((p['weight'] for p in portfolio_data), dtype=float, count=len(portfolio_data))
+    total_value = capital * weights.sum() / 100
+    
+    # Le squelette est partagé entre sessions : on travaille sur une copie
+    fig = go.Figure(_preview_pie_skeleton(len(labels)))
+    fig.data[0].labels = labels
+    fig.data[0].values = weights.tolist()
+    fig.layout.annotations[0].text = f"<b>${total_value:,.0f}</b>"
+    
+    return fig
+
+# ===================== LIVE MARKET QUOTES (auto-refresh fragment) =====================
+
+@st.fragment(run_every=MARKET_DATA_REFRESH_INTERVAL)
+def render_live_market_quotes():
+    """Indices, forex and commodities block, rerun on its own timer without re-executing the whole app"""
+    # Afficher l'heure de dernière mise à jour
+    caption = st.empty()
+    
+    # Grille fixe de placeholders (issue des tables de symboles) : d'un tick à l'autre seules
+    # les valeurs changent, les composants sont mis à jour sur place au lieu d'être recréés
+    # ========== MAJOR INDICES WITH SPARKLINES ==========
+    st.markdown('<div class="chart-category">MAJOR INDICES</div>', unsafe_allow_html=True)
+    index_slots = {}
+    index_names = list(MARKET_INDEXES)
+    for i in range(0, len(index_names), 3):
+        cols = st.columns(3)
+        for name, col in zip(index_names[i:i + 3], cols):
+            with col:
+                index_slots[name] = (st.empty(), st.empty())  # (metric, sparkline)
+    index_status = st.empty()
+    
+    st.divider()
+    
+    # ========== FOREX RATES ==========
+    st.markdown('<div class="chart-category">FOREX RATES</div>', unsafe_allow_html=True)
+    cols = st.columns(4)
+    forex_slots = {name: cols[i % 4].empty() for i, name in enumerate(MARKET_FOREX_PAIRS)}
+    forex_status = st.empty()
+    
+    st.divider()
+    
+    # ========== COMMODITIES ==========
+    st.markdown('<div class="chart-category">COMMODITIES</div>', unsafe_allow_html=True)
+    cols = st.columns(3)
+    commodity_slots = {name: cols[i % 3].empty() for i, name in enumerate(MARKET_COMMODITIES)}
+    commodity_status = st.empty()
+    
+    with st.spinner("Fetching market data..."):
+        market_data = fetch_market_data()
+    
+    current_time = datetime.now().strftime("%H:%M:%S")
+    caption.caption(f"● LIVE  |  Last updated: {current_time}  |  Cache: {MARKET_DATA_REFRESH_INTERVAL}s")
+    
+    indexes = market_data.get('indexes', {})
+    for name, (metric_slot, spark_slot) in index_slots.items():
+        data = indexes.get(name)
+        if data is None:
+            continue
+        # Metric with delta
+        metric_slot.metric(label=name, value=f"{data['price']:,.2f}", delta=f"{data['change']:+.2f}%")
+        
+        # Mini sparkline
+        spark_data = fetch_sparkline_data(MARKET_INDEXES[name], days=30)
+        if spark_data:
+            spark_fig = create_sparkline(spark_data, height=40)
+            if spark_fig:
+                spark_slot.plotly_chart(spark_fig, use_container_width=True,
+                                        config={'displayModeBar': False})
+    if not indexes:
+        index_status.warning("No index data available at the moment.")
+    
+    forex = market_data.get('forex', {})
+    for name, slot in forex_slots.items():
+        if name in forex:
+            data = forex[name]
+            slot.metric(label=name, value=f"{data['price']:.4f}", delta=f"{data['change']:+.2f}%")
+    if not forex:
+        forex_status.warning("No forex data available at the moment.")
+    
+    commodities = market_data.get('commodities', {})
+    for name, slot in commodity_slots.items():
+        if name in commodities:
+            data = commodities[name]
+            slot.metric(label=name, value=f"${data['price']:,.2f}", delta=f"{data['change']:+.2f}%")
+    if not commodities:
+        commodity_status.warning("No commodity data available at the moment.")
+
 # Anciennes fonctions supprimées - Maintenant dans app/charts.py
 
-# ===================== MAIN APPLICATION =====================
+# ===================== CACHED CHART BUILDERS =====================
+# Figures dont les entrées ne changent pas entre deux interactions :
+# reconstruites uniquement quand les poids / corrélations changent
 
-def main():
-    # Header
-    st.markdown("""
-    <div class="main-header">
-        <h1>PORTFOLIO ARCHITECT</h1>
-        <p>Advanced Portfolio Analysis & Risk Management Platform</p>
-    </div>
-    """, unsafe_allow_html=True)
+@st.cache_data(show_spinner=False)
+def build_allocation_chart(w_series, capital):
+    """Cached chart 1 (allocation) keyed on weights and capital"""
+    return CHART_FUNCTIONS[1](w_series, capital)
+
+@st.cache_data(show_spinner=False)
+def build_correlation_chart(corr):
+    """Cached chart 5 (correlation heatmap) keyed on the correlation matrix"""
+    return CHART_FUNCTIONS[5](corr)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def cached_figure_json(chart_num, analysis_id, mc_display_paths, _build):
+    """Results chart as Plotly JSON (or its warning), keyed on the analysis fingerprint"""
+    fig, warning = _build(chart_num)
+    return (fig.to_json() if fig is not None else None), warning
+
+def analysis_fingerprint(prices_pq, mc_npy, weights_dict, capital, bench_data):
+    """Content hash of one analysis run: same inputs -> same cached result figures"""
+    benches = tuple((name, data['prices'].to_numpy().tobytes()) for name, data in bench_data.items())
+    payload = (prices_pq, mc_npy, tuple(sorted(weights_dict.items())), capital, benches)
+    return hashlib.blake2b(pickle.dumps(payload, protocol=5), digest_size=16).hexdigest()
+
+# ===================== PORTFOLIO POSITIONS =====================
+
+def classify_sector(ticker):
+    """Coarse sector bucket used by chart 21"""
+    if ticker in TECH_TICKERS:
+        return "Technology"
+    if ticker in FINANCE_TICKERS:
+        return "Finance"
+    if any(marker in ticker for marker in ETF_MARKERS):
+        return "ETF"
+    return "Other"
+
+def classify_country(ticker):
+    """Listing country from the exchange suffix, used by chart 22"""
+    return next((country for suffix, country in COUNTRY_SUFFIXES.items() if suffix in ticker), "USA")
+
+def apply_positions_edits():
+    """on_change of the positions grid: fold its pending edits into the base frame"""
+    # La base reste stable entre les reruns : seules les modifications confirmées la changent
+    edits = st.session_state["positions_editor"]
+    positions = st.session_state.positions.copy()
+    for row, changes in edits.get("edited_rows", {}).items():
+        for column, value in changes.items():
+            positions.at[positions.index[int(row)], column] = value
+    st.session_state.positions = positions
+
+def build_portfolio_data(positions, capital, portfolio_mode):
+    """Turn the positions grid into validated portfolio rows; returns (portfolio_data, invalid_tickers)"""
+    entries = [
+        (ticker or "", input_type or "%", float(value_input) if pd.notna(value_input) else 0.0)
+        for ticker, input_type, value_input in positions[['Ticker', 'Type', 'Value']].itertuples(index=False)
+    ]
+    
+    # Cours des lignes "Shares" : un seul yf.download pour toutes les lignes
+    share_tickers = tuple(sorted({t for t, it, v in entries if t and it == "Shares" and v > 0}))
+    price_map = get_current_prices(share_tickers)  # Mis en cache (PRICE_CACHE_TTL)
+    
+    rows = []  # (ticker, weight, value_base, input_type, value_input) par ligne
+    for ticker, input_type, value_input in entries:
+        value_base = 0.0  # Value in base currency
+    
+        if input_type == "%":
+            weight = min(value_input, 100.0)  # Direct percentage
+            value_base = capital * weight / 100 if capital > 0 else weight * 100  # Estimate
+    
+        elif input_type == "$":
+            value_base = value_input
+            # Weight will be calculated later for progressive mode
+            weight = (value_input / capital * 100) if capital > 0 else 0.0
+    
+        else:  # Shares
+            # Calculate value from shares (need price)
+            current_price = price_map.get(ticker, 0) if ticker and value_input > 0 else 0
+            if current_price > 0:
+                value_base = value_input * current_price
+                weight = (value_base / capital * 100) if capital > 0 else 0.0
+            else:
+                weight = 0.0
+                value_base = 0.0
+    
+        rows.append((ticker, weight, value_base, input_type, value_input))
+    
+    # Validation concurrente des tickers saisis (I/O-bound : les appels se chevauchent)
+    pending = {row[0] for row in rows if row[0]}
+    ticker_infos = {}
+    if pending:
+        with ThreadPoolExecutor(max_workers=10, initializer=add_script_run_ctx,
+                                initargs=(None, get_script_run_ctx())) as executor:
+            ticker_infos = dict(zip(pending, executor.map(validate_and_get_ticker_info, pending)))
+    
+    portfolio_data = []
+    invalid_tickers = []
+    for ticker, weight, value_base, input_type, value_input in rows:
+        if not ticker:
+            continue
+        ticker_info = ticker_infos.get(ticker)
+        if ticker_info and ticker_info.get('valid'):
+            # Add to portfolio data with value_base
+            portfolio_data.append({
+                'ticker': ticker,
+                'weight': weight,
+                'value_base': value_base,
+                'input_type': input_type,
+                'input_value': value_input,
+                'name': ticker_info.get('name', ticker),
+                'exchange': ticker_info.get('exchange', '')
+            })
+        else:
+            invalid_tickers.append(ticker)
     
-    # Paramètres d'analyse fixés
-    years = "max"  # Toujours le maximum de données disponibles
-    mc_simulations = 100000  # 100K simulations pour précision
-    mc_display_paths = 5000  # Nombre de paths à afficher (esthétique)
+    # Recalculate weights for Progressive mode
+    if portfolio_mode == "Progressive Build" and portfolio_data:
+        # Calculate total value from all positions
+        values = np.fromiter((p['value_base'] for p in portfolio_data), dtype=float, count=len(portfolio_data))
+        total_value = values[values > 0].sum()
+        
+        if total_value > 0:
+            # Recalculate weights based on value proportions (en une passe vectorisée)
+            weights = np.where(values > 0, values / total_value * 100, 0.0)
+            for p, weight in zip(portfolio_data, weights.tolist()):
+                p['weight'] = weight
     
-    # Configuration du portfolio - À saisir avant les tabs
-    st.markdown('<h2 class="section-header">CONFIGURATION</h2>', unsafe_allow_html=True)
+    return portfolio_data, invalid_tickers
+
+# ===================== SECTION: MARKET DATA =====================
+
+def render_market_tab():
+    """Market Data section: live quotes, news, candlesticks, sectors and regions"""
+    # Header simple
+    st.markdown('<h2 class="section-header">MARKET DATA</h2>', unsafe_allow_html=True)
     
-    config_col1, config_col2, config_col3 = st.columns([1.5, 1, 1])
+    # Cotations live : seul ce fragment se ré-exécute à chaque rafraîchissement
+    render_live_market_quotes()
     
-    with config_col1:
-        portfolio_mode = st.radio(
-            "MODE",
-            options=["Fixed Capital", "Progressive Build"],
-            horizontal=True,
-            help="Fixed: Define total capital upfront | Progressive: Build portfolio position by position"
+    st.divider()
+    
+    # ========== SECTOR PERFORMANCE HEATMAP ==========
+    st.markdown('<div class="chart-category">SECTOR PERFORMANCE</div>', unsafe_allow_html=True)
+    
+    with st.spinner("Loading sector data..."):
+        sector_data = fetch_sector_performance()
+    
+    if sector_data:
+        # Display heatmap
+        heatmap_fig = create_sector_heatmap(sector_data)
+        if heatmap_fig:
+            st.plotly_chart(heatmap_fig, use_container_width=True)
+        
+        # Also show as expandable table
+        with st.expander("📊 View Sector Details"):
+            sector_df = pd.DataFrame([
+                {
+                    'Sector': sector,
+                    'ETF': data['symbol'],
+                    'Price': f"${data['price']:.2f}",
+                    '1 Day': f"{data['change_1d']:+.2f}%",
+                    '5 Days': f"{data['change_5d']:+.2f}%",
+                    '1 Month': f"{data['change_1m']:+.2f}%"
+                }
+                for sector, data in sector_data.items()
+            ])
+            st.dataframe(sector_df, use_container_width=True, hide_index=True)
+    else:
+        st.warning("Sector data unavailable at the moment.")
+    
+    st.divider()
+    
+    # ========== CANDLESTICK CHART ==========
+    st.markdown('<div class="chart-category">CANDLESTICK CHART</div>', unsafe_allow_html=True)
+    
+    candle_col1, candle_col2, candle_col3 = st.columns([2, 1, 1])
+    
+    with candle_col1:
+        candle_symbol = st.selectbox(
+            "Select Asset",
+            options=['^GSPC', '^IXIC', '^DJI', 'AAPL', 'MSFT', 'NVDA', 'GOOGL', 'AMZN', 'GC=F', 'CL=F'],
+            format_func=lambda x: {
+                '^GSPC': 'S&P 500', '^IXIC': 'NASDAQ', '^DJI': 'Dow Jones',
+                'AAPL': 'Apple', 'MSFT': 'Microsoft', 'NVDA': 'NVIDIA',
+                'GOOGL': 'Alphabet', 'AMZN': 'Amazon', 'GC=F': 'Gold', 'CL=F': 'Oil'
+            }.get(x, x),
+            key="candle_symbol"
         )
     
-    with config_col2:
-        currency = st.selectbox(
-            "BASE CURRENCY", 
-            options=["EUR", "USD", "GBP", "CHF", "JPY"],
-            index=0,
-            help="Your portfolio's base currency"
+    with candle_col2:
+        candle_period = st.selectbox(
+            "Period",
+            options=['1mo', '3mo', '6mo', '1y', '2y'],
+            format_func=lambda x: {'1mo': '1 Month', '3mo': '3 Months', '6mo': '6 Months', 
+                                   '1y': '1 Year', '2y': '2 Years'}.get(x, x),
+            key="candle_period"
         )
     
-    with config_col3:
-        if portfolio_mode == "Fixed Capital":
-            capital = st.number_input(
-                f"CAPITAL ({currency})", 
-                min_value=100.0, 
-                value=10000.0, 
-                step=1000.0,
-                format="%.0f",
-                help="Total capital to invest"
-            )
-        else:
-            # En mode progressif, le capital sera calculé automatiquement
-            capital = 0.0
-            st.info("Auto-calculated")
+    with candle_col3:
+        candle_interval = st.selectbox(
+            "Interval",
+            options=['1d', '1wk'],
+            format_func=lambda x: {'1d': 'Daily', '1wk': 'Weekly'}.get(x, x),
+            key="candle_interval"
+        )
+    
+    with st.spinner("Loading candlestick data..."):
+        ohlc_data = fetch_ohlc_data(candle_symbol, period=candle_period, interval=candle_interval)
+    
+    if ohlc_data is not None and not ohlc_data.empty:
+        candle_fig = create_candlestick_chart(ohlc_data, candle_symbol, show_volume=True)
+        if candle_fig:
+            st.plotly_chart(candle_fig, use_container_width=True)
+    else:
+        st.warning("Could not load candlestick data for this asset.")
     
     st.divider()
     
-    # Main Content - Tabs
-    tab1, tab2, tab3, tab4 = st.tabs(["MARKET DATA", "PORTFOLIO", "ANALYTICS", "RESULTS"])
+    # ========== REGIONAL MARKETS ==========
+    st.markdown('<div class="chart-category">REGIONAL MARKETS</div>', unsafe_allow_html=True)
     
-    # ==================== TAB 1: MARKET OVERVIEW ====================
-    with tab1:
-        # Header simple
-        st.markdown('<h2 class="section-header">MARKET DATA</h2>', unsafe_allow_html=True)
-        
-        # Afficher l'heure de dernière mise à jour
-        current_time = datetime.now().strftime("%H:%M:%S")
-        st.caption(f"● LIVE  |  Last updated: {current_time}  |  Cache: {MARKET_DATA_REFRESH_INTERVAL}s")
-        
-        with st.spinner("Fetching market data..."):
-            market_data = fetch_market_data()
-        
-        # ========== MAJOR INDICES WITH SPARKLINES ==========
-        st.markdown('<div class="chart-category">MAJOR INDICES</div>', unsafe_allow_html=True)
-        
-        if market_data.get('indexes'):
-            # Create columns for indices with sparklines
-            indices_list = list(market_data.get('indexes', {}).items())
-            
-            for i in range(0, len(indices_list), 3):
-                cols = st.columns(3)
-                for j, col in enumerate(cols):
-                    if i + j < len(indices_list):
-                        name, data = indices_list[i + j]
-                        with col:
-                            # Get sparkline data
-                            symbol_map = {'S&P 500': '^GSPC', 'Nasdaq': '^IXIC', 'Dow Jones': '^DJI', 
-                                         'DAX': '^GDAXI', 'CAC 40': '^FCHI', 'FTSE 100': '^FTSE'}
-                            symbol = symbol_map.get(name, '^GSPC')
-                            
-                            # Metric with delta
-                            delta_color = "normal" if data['change'] >= 0 else "inverse"
-                            st.metric(label=name, value=f"{data['price']:,.2f}", 
-                                     delta=f"{data['change']:+.2f}%")
-                            
-                            # Mini sparkline
-                            spark_data = fetch_sparkline_data(symbol, days=30)
-                            if spark_data:
-                                spark_fig = create_sparkline(spark_data, height=40)
-                                if spark_fig:
-                                    st.plotly_chart(spark_fig, use_container_width=True, 
-                                                   config={'displayModeBar': False})
-        else:
-            st.warning("No index data available at the moment.")
-        
-        st.divider()
-        
-        # ========== FOREX RATES ==========
-        st.markdown('<div class="chart-category">FOREX RATES</div>', unsafe_allow_html=True)
-        
-        if market_data.get('forex'):
-            cols = st.columns(4)
-            for i, (name, data) in enumerate(market_data.get('forex', {}).items()):
-                with cols[i % 4]:
-                    st.metric(label=name, value=f"{data['price']:.4f}", delta=f"{data['change']:+.2f}%")
-        else:
-            st.warning("No forex data available at the moment.")
-        
-        st.divider()
+    with st.spinner("Loading regional markets..."):
+        regional_data = fetch_regional_markets()
+    
+    if regional_data:
+        region_tabs = st.tabs(list(regional_data.keys()))
         
-        # ========== COMMODITIES ==========
-        st.markdown('<div class="chart-category">COMMODITIES</div>', unsafe_allow_html=True)
+        for region_tab, (region, indices) in zip(region_tabs, regional_data.items()):
+            with region_tab:
+                if indices:
+                    cols = st.columns(min(len(indices), 3))
+                    for i, (index_name, data) in enumerate(indices.items()):
+                        with cols[i % 3]:
+                            st.metric(
+                                label=index_name,
+                                value=f"{data['price']:,.2f}",
+                                delta=f"{data['change']:+.2f}%"
+                            )
+                else:
+                    st.info(f"No data available for {region}")
+    else:
+        st.warning("Regional market data unavailable.")
+    
+    st.divider()
+    
+    # ========== MARKET NEWS FEED ==========
+    st.markdown('<div class="chart-category">MARKET NEWS</div>', unsafe_allow_html=True)
+    
+    with st.spinner("Loading market news..."):
+        market_news = fetch_market_news(max_news=8)
+    
+    if market_news:
+        for news_item in market_news:
+            with st.container():
+                st.markdown(f"""
+                <div style="padding: 0.75rem; margin-bottom: 0.5rem; background: #F5F7FA; border-left: 3px solid #0052CC; border-radius: 0 4px 4px 0;">
+                    <a href="{news_item['link']}" target="_blank" style="color: #131722; text-decoration: none; font-weight: 500;">
+                        {news_item['title']}
+                    </a>
+                    <p style="margin: 0.25rem 0 0 0; font-size: 0.8rem; color: #6A6D78;">
+                        {news_item['publisher']} • {news_item['timestamp']}
+                    </p>
+                </div>
+                """, unsafe_allow_html=True)
+    else:
+        st.info("No market news available at the moment.")
+
+
+# ===================== SECTION: PORTFOLIO =====================
+
+def render_portfolio_tab(portfolio_mode, currency, capital):
+    """Portfolio section: positions grid, benchmarks and live preview"""
+    # Mode indicator
+    currency_symbol = CURRENCY_SYMBOLS.get(currency, currency)
+    if portfolio_mode == "Fixed Capital":
+        st.markdown(f'<p style="background:#E8F2FF;padding:0.75rem 1rem;border-left:4px solid #0052CC;margin-bottom:1rem;"><b>MODE:</b> Fixed Capital | <b>BASE:</b> {currency_symbol}{capital:,.0f} {currency}</p>', unsafe_allow_html=True)
+    else:
+        st.markdown(f'<p style="background:#E3FCEF;padding:0.75rem 1rem;border-left:4px solid #00875A;margin-bottom:1rem;"><b>MODE:</b> Progressive Build | <b>BASE CURRENCY:</b> {currency}</p>', unsafe_allow_html=True)
+    
+    col_input, col_preview = st.columns([1.2, 1])
+    
+    with col_input:
+        st.markdown('<h2 class="section-header">PORTFOLIO POSITIONS</h2>', unsafe_allow_html=True)
         
-        if market_data.get('commodities'):
-            cols = st.columns(3)
-            for i, (name, data) in enumerate(market_data.get('commodities', {}).items()):
-                with cols[i % 3]:
-                    st.metric(label=name, value=f"${data['price']:,.2f}", delta=f"{data['change']:+.2f}%")
+        if portfolio_mode == "Fixed Capital":
+            st.info(f"Allocate your {currency_symbol}{capital:,.0f} across different assets using percentages.")
         else:
-            st.warning("No commodity data available at the moment.")
+            st.info(f"Add positions in their native currency. Values will be converted to {currency}.")
         
-        st.divider()
-        
-        # ========== SECTOR PERFORMANCE HEATMAP ==========
-        st.markdown('<div class="chart-category">SECTOR PERFORMANCE</div>', unsafe_allow_html=True)
+        # Utiliser les options depuis app.config (+ tickers ajoutés via la recherche)
+        ticker_labels = {**quick_select_labels(tuple(QUICK_SELECT_OPTIONS)), **st.session_state.custom_tickers}
         
-        with st.spinner("Loading sector data..."):
-            sector_data = fetch_sector_performance()
+        # Grille unique : un seul composant au lieu de ~60 widgets par rerun
+        positions = st.data_editor(
+            st.session_state.positions,
+            key="positions_editor",
+            on_change=apply_positions_edits,
+            column_config={
+                'Ticker': st.column_config.SelectboxColumn(
+                    "Asset", width="large", options=list(ticker_labels),
+                    format_func=lambda t: ticker_labels.get(t, t),
+                    help="Select from popular list or search below"
+                ),
+                'Type': st.column_config.SelectboxColumn(
+                    "Type", options=["%", "$", "Shares"], required=True,
+                    help="% = Percentage | $ = Currency | Shares = Number of shares"
+                ),
+                'Value': st.column_config.NumberColumn(
+                    "Value", min_value=0.0, max_value=1000000.0, format="%.2f"
+                ),
+            },
+            num_rows="fixed",
+            hide_index=True,
+            use_container_width=True
+        )
         
-        if sector_data:
-            # Display heatmap
-            heatmap_fig = create_sector_heatmap(sector_data)
-            if heatmap_fig:
-                st.plotly_chart(heatmap_fig, use_container_width=True)
+        # Custom search: ajoute le ticker choisi dans la première ligne vide
+        with st.expander("🔍 Search for another ticker"):
+            search_query = st.text_input(
+                "Search ticker",
+                key="ticker_search",
+                placeholder="Type: LVMH, BNP, SAP...",
+                label_visibility="collapsed"
+            ).upper().strip()
             
-            # Also show as expandable table
-            with st.expander("📊 View Sector Details"):
-                sector_df = pd.DataFrame([
-                    {
-                        'Sector': sector,
-                        'ETF': data['symbol'],
-                        'Price': f"${data['price']:.2f}",
-                        '1 Day': f"{data['change_1d']:+.2f}%",
-                        '5 Days': f"{data['change_5d']:+.2f}%",
-                        '1 Month': f"{data['change_1m']:+.2f}%"
+            if search_query:
+                suggestions = search_tickers(search_query)
+                if suggestions:
+                    suggestion_labels = {
+                        s['symbol']: f"{s['symbol']} - {s['name'][:35]} ({s['exchange']})"
+                        for s in suggestions[:10]
                     }
-                    for sector, data in sector_data.items()
-                ])
-                st.dataframe(sector_df, use_container_width=True, hide_index=True)
-        else:
-            st.warning("Sector data unavailable at the moment.")
-        
-        st.divider()
-        
-        # ========== CANDLESTICK CHART ==========
-        st.markdown('<div class="chart-category">CANDLESTICK CHART</div>', unsafe_allow_html=True)
-        
-        candle_col1, candle_col2, candle_col3 = st.columns([2, 1, 1])
-        
-        with candle_col1:
-            candle_symbol = st.selectbox(
-                "Select Asset",
-                options=['^GSPC', '^IXIC', '^DJI', 'AAPL', 'MSFT', 'NVDA', 'GOOGL', 'AMZN', 'GC=F', 'CL=F'],
-                format_func=lambda x: {
-                    '^GSPC': 'S&P 500', '^IXIC': 'NASDAQ', '^DJI': 'Dow Jones',
-                    'AAPL': 'Apple', 'MSFT': 'Microsoft', 'NVDA': 'NVIDIA',
-                    'GOOGL': 'Alphabet', 'AMZN': 'Amazon', 'GC=F': 'Gold', 'CL=F': 'Oil'
-                }.get(x, x),
-                key="candle_symbol"
-            )
-        
-        with candle_col2:
-            candle_period = st.selectbox(
-                "Period",
-                options=['1mo', '3mo', '6mo', '1y', '2y'],
-                format_func=lambda x: {'1mo': '1 Month', '3mo': '3 Months', '6mo': '6 Months', 
-                                       '1y': '1 Year', '2y': '2 Years'}.get(x, x),
-                key="candle_period"
-            )
-        
-        with candle_col3:
-            candle_interval = st.selectbox(
-                "Interval",
-                options=['1d', '1wk'],
-                format_func=lambda x: {'1d': 'Daily', '1wk': 'Weekly'}.get(x, x),
-                key="candle_interval"
-            )
+                    selected_sug = st.selectbox(
+                        "Results",
+                        options=list(suggestion_labels),
+                        format_func=suggestion_labels.get,
+                        key="sug_result",
+                        label_visibility="collapsed"
+                    )
+                    empty_rows = positions.index[positions['Ticker'].fillna('') == '']
+                    if st.button("Add to portfolio", key="add_searched_ticker", disabled=empty_rows.empty):
+                        st.session_state.custom_tickers[selected_sug] = suggestion_labels[selected_sug]
+                        positions.loc[empty_rows[0], 'Ticker'] = selected_sug
+                        st.session_state.positions = positions
+                        del st.session_state["positions_editor"]  # Réapplique la grille depuis la nouvelle base
+                        st.rerun()
+                else:
+                    st.warning("No results found")
         
-        with st.spinner("Loading candlestick data..."):
-            ohlc_data = fetch_ohlc_data(candle_symbol, period=candle_period, interval=candle_interval)
+        portfolio_data, invalid_tickers = build_portfolio_data(positions, capital, portfolio_mode)
         
-        if ohlc_data is not None and not ohlc_data.empty:
-            candle_fig = create_candlestick_chart(ohlc_data, candle_symbol, show_volume=True)
-            if candle_fig:
-                st.plotly_chart(candle_fig, use_container_width=True)
-        else:
-            st.warning("Could not load candlestick data for this asset.")
+        # Validation status
+        if invalid_tickers:
+            st.warning(f"✗ Invalid ticker(s) ignored: {', '.join(invalid_tickers)}")
+        elif portfolio_data:
+            st.caption(f"✓ {len(portfolio_data)} valid position(s)")
         
         st.divider()
         
-        # ========== REGIONAL MARKETS ==========
-        st.markdown('<div class="chart-category">REGIONAL MARKETS</div>', unsafe_allow_html=True)
+        # Weight Summary
+        total_weight = math.fsum(p['weight'] for p in portfolio_data)
         
-        with st.spinner("Loading regional markets..."):
-            regional_data = fetch_regional_markets()
-        
-        if regional_data:
-            region_tabs = st.tabs(list(regional_data.keys()))
-            
-            for region_tab, (region, indices) in zip(region_tabs, regional_data.items()):
-                with region_tab:
-                    if indices:
-                        cols = st.columns(min(len(indices), 3))
-                        for i, (index_name, data) in enumerate(indices.items()):
-                            with cols[i % 3]:
-                                st.metric(
-                                    label=index_name,
-                                    value=f"{data['price']:,.2f}",
-                                    delta=f"{data['change']:+.2f}%"
-                                )
-                    else:
-                        st.info(f"No data available for {region}")
-        else:
-            st.warning("Regional market data unavailable.")
+        # Display summary based on mode
+        if portfolio_mode == "Fixed Capital":
+            if total_weight > 0:
+                if abs(total_weight - 100) < 0.01:
+                    st.success(f"Total Weight: {total_weight:.2f}%")
+                elif total_weight > 100:
+                    st.error(f"Total Weight: {total_weight:.2f}% (exceeds 100%)")
+                else:
+                    st.warning(f"Total Weight: {total_weight:.2f}% (need {100-total_weight:.1f}% more)")
+            else:
+                st.info("Add tickers with weights to see your allocation.")
+        else:  # Progressive Build
+            values = np.fromiter((p['value_base'] for p in portfolio_data), dtype=float, count=len(portfolio_data))
+            total_value = values.sum()
+            if total_value > 0:
+                currency_sym = CURRENCY_SYMBOLS.get(currency, currency)
+                st.success(f"Portfolio Value: {currency_sym}{total_value:,.0f} | Positions: {np.count_nonzero(values > 0)}")
+            else:
+                st.info("Add positions to build your portfolio.")
         
         st.divider()
         
-        # ========== MARKET NEWS FEED ==========
-        st.markdown('<div class="chart-category">MARKET NEWS</div>', unsafe_allow_html=True)
-        
-        with st.spinner("Loading market news..."):
-            market_news = fetch_market_news(max_news=8)
+        # Benchmarks
+        st.markdown('<h2 class="section-header">BENCHMARKS</h2>', unsafe_allow_html=True)
         
-        if market_news:
-            for news_item in market_news:
-                with st.container():
-                    st.markdown(f"""
-                    <div style="padding: 0.75rem; margin-bottom: 0.5rem; background: #F5F7FA; border-left: 3px solid #0052CC; border-radius: 0 4px 4px 0;">
-                        <a href="{news_item['link']}" target="_blank" style="color: #131722; text-decoration: none; font-weight: 500;">
-                            {news_item['title']}
-                        </a>
-                        <p style="margin: 0.25rem 0 0 0; font-size: 0.8rem; color: #6A6D78;">
-                            {news_item['publisher']} • {news_item['timestamp']}
-                        </p>
-                    </div>
-                    """, unsafe_allow_html=True)
-        else:
-            st.info("No market news available at the moment.")
+        st.multiselect(
+            "Select Benchmarks",
+            options=list(BENCHMARK_OPTIONS.keys()),
+            key="selected_benchmarks",
+            format_func=lambda x: BENCHMARK_OPTIONS.get(x, x)
+        )
     
-    # ==================== TAB 2: PORTFOLIO SETUP ====================
-    with tab2:
-        # Mode indicator
-        currency_symbol = CURRENCY_SYMBOLS.get(currency, currency)
-        if portfolio_mode == "Fixed Capital":
-            st.markdown(f'<p style="background:#E8F2FF;padding:0.75rem 1rem;border-left:4px solid #0052CC;margin-bottom:1rem;"><b>MODE:</b> Fixed Capital | <b>BASE:</b> {currency_symbol}{capital:,.0f} {currency}</p>', unsafe_allow_html=True)
-        else:
-            st.markdown(f'<p style="background:#E3FCEF;padding:0.75rem 1rem;border-left:4px solid #00875A;margin-bottom:1rem;"><b>MODE:</b> Progressive Build | <b>BASE CURRENCY:</b> {currency}</p>', unsafe_allow_html=True)
+    # ========== PREVIEW COLUMN ==========
+    with col_preview:
+        st.markdown('<h2 class="section-header">LIVE PREVIEW</h2>', unsafe_allow_html=True)
         
-        col_input, col_preview = st.columns([1.2, 1])
+        # Get FX rates for currency conversion
+        fx_rates, fx_approximated = get_fx_rates(currency)
+        currency_symbol = CURRENCY_SYMBOLS.get(currency, currency)
         
-        with col_input:
-            st.markdown('<h2 class="section-header">PORTFOLIO POSITIONS</h2>', unsafe_allow_html=True)
+        if portfolio_data:
+            # Add currency info to each position
+            for p in portfolio_data:
+                p['native_currency'] = get_ticker_currency(p['ticker'])
             
-            if portfolio_mode == "Fixed Capital":
-                st.info(f"Allocate your {currency_symbol}{capital:,.0f} across different assets using percentages.")
-            else:
-                st.info(f"Add positions in their native currency. Values will be converted to {currency}.")
+            # Filter only positions with weight > 0 for the chart
+            weighted_portfolio = [p for p in portfolio_data if p['weight'] > 0]
+            preview_df = pd.DataFrame(weighted_portfolio)  # Colonnes vectorisées pour table, FX et totaux
             
-            # Utiliser les options depuis app.config
-            popular_options = QUICK_SELECT_OPTIONS
-            
-            portfolio_data = []
+            # Calculate effective capital for progressive mode
+            if portfolio_mode == "Progressive Build" and weighted_portfolio:
+                # In progressive mode, sum up all position values
+                effective_capital = preview_df['value_base'].sum()
+                if effective_capital == 0:
+                    effective_capital = capital if capital > 0 else 10000
+            else:
+                effective_capital = capital if capital > 0 else 10000
             
-            # Column headers
-            header_col1, header_col2, header_col3, header_col4 = st.columns([3.5, 1.5, 1.5, 0.5])
-            with header_col1:
-                st.markdown("**Asset**")
-            with header_col2:
-                st.markdown("**Type**")
-            with header_col3:
-                st.markdown("**Value**")
-            with header_col4:
-                st.markdown("**Status**")
+            if weighted_portfolio:
+                # Show pie chart
+                fig_preview = create_preview_allocation_chart(weighted_portfolio, effective_capital)
+                if fig_preview:
+                    st.plotly_chart(fig_preview, use_container_width=True)
+            else:
+                st.info("Enter weights to see portfolio allocation")
             
-            st.markdown("---")
+            # Summary table with currency info
+            if weighted_portfolio:
+                st.markdown("**Portfolio Composition**")
+                summary_df = pd.DataFrame({
+                    'Ticker': preview_df['ticker'],
+                    'CCY': preview_df['native_currency'],
+                    'Weight': preview_df['weight'].map('{:.1f}%'.format),
+                    'Value': (effective_capital * preview_df['weight'] / 100).map(
+                        lambda v: f"{currency_symbol}{v:,.0f}")
+                })
+                st.dataframe(summary_df, use_container_width=True, hide_index=True)
             
-            for i in range(10):
-                col1, col2, col3, col4 = st.columns([3.5, 1.5, 1.5, 0.5])
+            # FX Exposure breakdown
+            if weighted_portfolio:
+                st.markdown("**FX Exposure**")
+                fx_exposure = preview_df.groupby('native_currency')['weight'].sum().sort_values(ascending=False)
                 
+                # Display FX exposure
+                fx_cols = st.columns(len(fx_exposure))
+                for idx, (ccy, weight) in enumerate(fx_exposure.items()):
+                    with fx_cols[idx]:
+                        ccy_symbol = CURRENCY_SYMBOLS.get(ccy, ccy)
+                        color = "#00875A" if ccy == currency else "#0052CC"
+                        st.markdown(f'<p style="text-align:center;"><span style="color:{color};font-weight:600;">{ccy_symbol}</span><br/>{weight:.1f}%</p>', unsafe_allow_html=True)
+            
+            # Metrics
+            if weighted_portfolio:
+                st.divider()
+                col1, col2 = st.columns(2)
                 with col1:
-                    # Build selectbox options
-                    selectbox_options = [f"{t[0]} - {t[1]}" if t[0] else t[1] for t in popular_options]
-                    selectbox_options.append("🔍 Search for another ticker...")
-                    
-                    # Single selectbox
-                    selected_option = st.selectbox(
-                        f"Asset {i+1}",
-                        options=selectbox_options,
-                        key=f"asset_{i}",
-                        label_visibility="collapsed",
-                        help="Select from popular list or search"
-                    )
-                    
-                    # Check if user wants custom search
-                    if "🔍 Search" in selected_option:
-                        # Show search input
-                        search_query = st.text_input(
-                            "Search ticker",
-                            key=f"search_{i}",
-                            placeholder="Type: LVMH, BNP, SAP...",
-                            label_visibility="collapsed"
-                        ).upper().strip()
-                        
-                        if search_query:
-                            suggestions = search_tickers(search_query)
-                            if suggestions:
-                                suggestion_options = [
-                                    f"{s['symbol']} - {s['name'][:35]} ({s['exchange']})" 
-                                    for s in suggestions[:10]
-                                ]
-                                
-                                selected_sug = st.selectbox(
-                                    "Results",
-                                    options=suggestion_options,
-                                    key=f"sug_result_{i}",
-                                    label_visibility="collapsed"
-                                )
-                                ticker = selected_sug.split(" - ")[0].strip() if selected_sug else ""
-                            else:
-                                st.warning("No results found")
-                                ticker = ""
-                        else:
-                            ticker = ""
-                    else:
-                        # Extract ticker from popular selection
-                        if selected_option and " - " in selected_option:
-                            ticker = selected_option.split(" - ")[0].strip()
-                        else:
-                            ticker = ""
-                
+                    st.metric("Total Allocated", f"{currency_symbol}{effective_capital * total_weight / 100:,.0f}")
                 with col2:
-                    # Input type selector
-                    input_type = st.selectbox(
-                        f"Type {i+1}",
-                        options=["%", "$", "Shares"],
-                        key=f"input_type_{i}",
-                        label_visibility="collapsed",
-                        help="% = Percentage | $ = Currency | Shares = Number of shares"
-                    )
+                    st.metric("Positions", f"{len(weighted_portfolio)}")
                 
-                with col3:
-                    # Value input (adapts based on type)
-                    value_base = 0.0  # Value in base currency
+                # Show FX rates if there are foreign currency positions
+                foreign_currencies = [c for c in fx_exposure.index if c != currency]
+                if foreign_currencies:
+                    st.caption(f"FX Rates vs {currency}: " + " | ".join(
+                        [f"{c}: {fx_rates.get(c, 1.0):.4f}" + (" (approx.)" if c in fx_approximated else "")
+                         for c in foreign_currencies]))
+        else:
+            st.info("Add tickers with weights > 0 to see the live preview!")
+            
+            # Show example portfolio
+            st.markdown("**Example Portfolio:**")
+            example_data = [
+                {'ticker': 'AAPL', 'weight': 25, 'name': 'Apple Inc.', 'exchange': 'NASDAQ'},
+                {'ticker': 'NVDA', 'weight': 25, 'name': 'NVIDIA Corp.', 'exchange': 'NASDAQ'},
+                {'ticker': 'MSFT', 'weight': 20, 'name': 'Microsoft', 'exchange': 'NASDAQ'},
+                {'ticker': 'GOOGL', 'weight': 15, 'name': 'Alphabet', 'exchange': 'NASDAQ'},
+                {'ticker': 'AMZN', 'weight': 15, 'name': 'Amazon', 'exchange': 'NASDAQ'},
+            ]
+            fig_example = create_preview_allocation_chart(example_data, capital)
+            if fig_example:
+                st.plotly_chart(fig_example, use_container_width=True)
+            st.caption("This is an example. Enter your own tickers above!")
+
+
+# ===================== CHART SELECTION STATE =====================
+
+def apply_chart_preset(charts):
+    """Quick-select callback: rewrite chart_mask and the chart multiselect"""
+    mask = np.isin(np.arange(1, 25), charts)
+    if np.array_equal(mask, st.session_state.chart_mask):
+        return  # Preset déjà actif : aucune écriture dans session_state
+    st.session_state.chart_mask[:] = mask
+    st.session_state.chart_multiselect = list(charts)
+
+def sync_chart_mask():
+    """Multiselect callback: mirror the selection into chart_mask"""
+    st.session_state.chart_mask[:] = np.isin(np.arange(1, 25), st.session_state.chart_multiselect)
+
+@st.fragment
+def render_chart_picker():
+    """Presets, chart multiselect and selection summary; a change reruns only this block"""
+    # Sélection initialisée depuis le masque (aussi après purge quand la section était masquée)
+    chart_mask = st.session_state.chart_mask
+    if 'chart_multiselect' not in st.session_state:
+        st.session_state.chart_multiselect = (np.flatnonzero(chart_mask) + 1).tolist()
+    
+    # Quick select buttons (callbacks : appliqués avant le rendu, sans second rerun)
+    st.markdown("**Quick Selection:**")
+    preset_cols = st.columns(len(CHART_PRESETS))
+    for col, (preset_key, (label, preset_charts)) in zip(preset_cols, CHART_PRESETS.items()):
+        with col:
+            st.button(label, use_container_width=True, key=preset_key,
+                      on_click=apply_chart_preset, args=(preset_charts,))
+    
+    st.divider()
+    
+    # Un seul widget pour les 24 graphiques (au lieu de 24 cases à cocher)
+    st.multiselect(
+        "Charts",
+        options=list(CHART_NAMES),
+        key="chart_multiselect",
+        format_func=lambda n: f"{n}. {CHART_NAMES[n]}",
+        on_change=sync_chart_mask,
+        placeholder="Select charts to generate"
+    )
+    
+    with st.expander("Chart descriptions"):
+        st.markdown("\n".join(
+            f"**{category}**\n" + "\n".join(f"- **{n}. {CHART_NAMES[n]}** : {CHART_DESCRIPTIONS[n]}" for n in chart_nums)
+            for category, chart_nums in CHART_GROUPS.items()
+        ))
+    
+    # Store for other tabs (tuple trié par construction : flatnonzero rend des indices croissants)
+    selected_charts = tuple((np.flatnonzero(chart_mask) + 1).tolist())
+    st.session_state.selected_charts = selected_charts
+    
+    st.divider()
+    
+    # Summary
+    st.markdown(f"### 📊 Selected: **{len(selected_charts)}** / 24 charts")
+    
+    if selected_charts:
+        selected_names = [f"{n}. {CHART_NAMES[n]}" for n in selected_charts]
+        st.success(f"Charts to generate: {', '.join(selected_names)}")
+    else:
+        st.warning("⚠️ No charts selected. Please select at least one chart.")
+
+# ===================== SECTION: ANALYTICS =====================
+
+def render_analytics_tab(portfolio_mode, currency, capital, mc_simulations):
+    """Analytics section: chart selection and analysis run"""
+    # La section Portfolio n'est pas exécutée ici : on repart de la grille persistée
+    portfolio_data, _ = build_portfolio_data(st.session_state.positions, capital, portfolio_mode)
+    total_weight = math.fsum(p['weight'] for p in portfolio_data)
+    selected_benchmarks = st.session_state.selected_benchmarks
+    
+    st.markdown('<h2 class="section-header">CHART SELECTION</h2>', unsafe_allow_html=True)
+    st.info("Choose which charts you want to generate. Select categories or individual charts.")
+    
+    render_chart_picker()
+    selected_charts = tuple((np.flatnonzero(st.session_state.chart_mask) + 1).tolist())
+    
+    st.divider()
+    
+    # Run Analysis Button
+    if st.button("RUN ANALYSIS", type="primary", use_container_width=True, key="run_analysis"):
+        if not portfolio_data:
+            st.error("Please add at least one position in the Portfolio Setup tab!")
+        elif not selected_charts:
+            st.error("Please select at least one chart to generate!")
+        elif abs(total_weight - 100) > 0.5:
+            st.error("Portfolio weights must sum to approximately 100%!")
+        else:
+            with st.spinner(f"Running analysis for {len(selected_charts)} charts... This may take a moment."):
+                try:
+                    # Préparer les données
+                    tickers = [p['ticker'] for p in portfolio_data]
+                    weights_dict = {p['ticker']: p['weight'] / 100 for p in portfolio_data}
+                    
+                    # Récupérer les prix historiques (maximum disponible) : un seul téléchargement
+                    # pour positions + benchmarks, découpé ensuite par colonnes
+                    prices = bench_prices = None
+                    prices_all = fetch_prices_cached(tickers + selected_benchmarks, period="max")
+                    if prices_all is not None:
+                        # dropna(how='all') : chaque sous-ensemble retrouve son propre calendrier de cotation
+                        prices = prices_all[[t for t in tickers if t in prices_all.columns]].dropna(how='all')
+                        bench_prices = prices_all[[b for b in selected_benchmarks if b in prices_all.columns]].dropna(how='all')
                     
-                    if input_type == "%":
-                        value_input = st.number_input(
-                            f"Value {i+1}",
-                            min_value=0.0,
-                            max_value=100.0,
-                            value=0.0,
-                            step=5.0,
-                            key=f"value_{i}",
-                            label_visibility="collapsed",
-                            format="%.1f"
+                    if prices is not None and not prices.empty:
+                        # Calculer les métriques complètes avec app.calculations
+                        portfolio_metrics = compute_portfolio_metrics_cached(
+                            prices=prices,
+                            weights_items=tuple(sorted(weights_dict.items())),
+                            cov_method="ledoit",
+                            annualization=252
                         )
-                        weight = value_input  # Direct percentage
-                        value_base = capital * value_input / 100 if capital > 0 else value_input * 100  # Estimate
                         
-                    elif input_type == "$":
-                        value_input = st.number_input(
-                            f"Value {i+1}",
-                            min_value=0.0,
-                            max_value=1000000.0,
-                            value=0.0,
-                            step=100.0,
-                            key=f"value_{i}",
-                            label_visibility="collapsed",
-                            format="%.0f"
-                        )
-                        value_base = value_input
-                        # Weight will be calculated later for progressive mode
-                        weight = (value_input / capital * 100) if capital > 0 else 0.0
+                        # Lancer simulations Monte Carlo si nécessaire
+                        mc_simulations_data = None
+                        if not MC_CHARTS.isdisjoint(selected_charts):
+                            mc_simulations_data = run_monte_carlo_cached(
+                                mu_a=portfolio_metrics['mu_a'],
+                                cov_a=portfolio_metrics['cov_a'],
+                                w=portfolio_metrics['w'],
+                                start_value=capital,
+                                steps=60,  # 5 ans en mois
+                                paths=mc_simulations,
+                                randomness_factor=0.30
+                            )  # float32 : moitié moins de mémoire en session et de JSON envoyé au navigateur
                         
-                    else:  # Shares
-                        value_input = st.number_input(
-                            f"Value {i+1}",
-                            min_value=0.0,
-                            max_value=100000.0,
-                            value=0.0,
-                            step=1.0,
-                            key=f"value_{i}",
-                            label_visibility="collapsed",
-                            format="%.0f"
-                        )
-                        # Calculate value from shares (need price)
-                        if ticker and value_input > 0:
-                            try:
-                                ticker_obj = yf.Ticker(ticker)
-                                current_price = ticker_obj.info.get('currentPrice') or ticker_obj.info.get('regularMarketPrice') or 0
-                                if current_price > 0:
-                                    value_base = value_input * current_price
-                                    weight = (value_base / capital * 100) if capital > 0 else 0.0
-                                else:
-                                    weight = 0.0
-                                    value_base = 0.0
-                            except:
-                                weight = 0.0
-                                value_base = 0.0
-                        else:
-                            weight = 0.0
-                            value_base = 0.0
-                
-                with col4:
-                    # Validation status (simple checkmark only)
-                    if ticker:
-                        ticker_info = validate_and_get_ticker_info(ticker)
-                        if ticker_info and ticker_info.get('valid'):
-                            st.markdown('<p style="color: #00875A; font-size: 1.5rem; margin: 0;">✓</p>', unsafe_allow_html=True)
-                            
-                            # Add to portfolio data with value_base
-                            portfolio_data.append({
-                                'ticker': ticker,
-                                'weight': weight,
-                                'value_base': value_base,
-                                'input_type': input_type,
-                                'input_value': value_input,
-                                'name': ticker_info.get('name', ticker),
-                                'exchange': ticker_info.get('exchange', '')
-                            })
-                        else:
-                            st.markdown('<p style="color: #DE350B; font-size: 1.5rem; margin: 0;">✗</p>', unsafe_allow_html=True)
-                    else:
-                        st.markdown('<p style="color: #6A6D78; font-size: 1.2rem; margin: 0;">—</p>', unsafe_allow_html=True)
-                
-                # Small spacer between rows
-                if i < 9:  # Don't add after last row
-                    st.markdown("<div style='margin-bottom: 4px;'></div>", unsafe_allow_html=True)
-            
-            st.divider()
-            
-            # Recalculate weights for Progressive mode
-            if portfolio_mode == "Progressive Build" and portfolio_data:
-                # Calculate total value from all positions
-                total_value = sum([p.get('value_base', 0) for p in portfolio_data if p.get('value_base', 0) > 0])
-                
-                if total_value > 0:
-                    # Recalculate weights based on value proportions
-                    for p in portfolio_data:
-                        if p.get('value_base', 0) > 0:
-                            p['weight'] = (p['value_base'] / total_value) * 100
-                        else:
-                            p['weight'] = 0.0
-            
-            # Weight Summary
-            total_weight = sum([p['weight'] for p in portfolio_data])
-            
-            # Display summary based on mode
-            if portfolio_mode == "Fixed Capital":
-                if total_weight > 0:
-                    if abs(total_weight - 100) < 0.01:
-                        st.success(f"Total Weight: {total_weight:.2f}%")
-                    elif total_weight > 100:
-                        st.error(f"Total Weight: {total_weight:.2f}% (exceeds 100%)")
-                    else:
-                        st.warning(f"Total Weight: {total_weight:.2f}% (need {100-total_weight:.1f}% more)")
-                else:
-                    st.info("Add tickers with weights to see your allocation.")
-            else:  # Progressive Build
-                total_value = sum([p.get('value_base', 0) for p in portfolio_data])
-                if total_value > 0:
-                    currency_sym = CURRENCY_SYMBOLS.get(currency, currency)
-                    st.success(f"Portfolio Value: {currency_sym}{total_value:,.0f} | Positions: {len([p for p in portfolio_data if p.get('value_base', 0) > 0])}")
-                else:
-                    st.info("Add positions to build your portfolio.")
-            
-            st.divider()
-            
-            # Benchmarks
-            st.markdown('<h2 class="section-header">BENCHMARKS</h2>', unsafe_allow_html=True)
-            
-            benchmark_options = {
-                '^GSPC': 'S&P 500', '^NDX': 'Nasdaq 100', '^DJI': 'Dow Jones',
-                '^GDAXI': 'DAX', '^FCHI': 'CAC 40', '^STOXX50E': 'Euro Stoxx 50',
-                '^FTSE': 'FTSE 100', '^N225': 'Nikkei 225', 'GC=F': 'Gold',
-            }
-            
-            selected_benchmarks = st.multiselect(
-                "Select Benchmarks",
-                options=list(benchmark_options.keys()),
-                default=['^GSPC', '^NDX'],
-                format_func=lambda x: benchmark_options.get(x, x)
-            )
-        
-        # ========== PREVIEW COLUMN ==========
-        with col_preview:
-            st.markdown('<h2 class="section-header">LIVE PREVIEW</h2>', unsafe_allow_html=True)
-            
-            # Get FX rates for currency conversion
-            fx_rates = get_fx_rates(currency)
-            currency_symbol = CURRENCY_SYMBOLS.get(currency, currency)
-            
-            if portfolio_data:
-                # Add currency info to each position
-                for p in portfolio_data:
-                    p['native_currency'] = get_ticker_currency(p['ticker'])
-                
-                # Filter only positions with weight > 0 for the chart
-                weighted_portfolio = [p for p in portfolio_data if p['weight'] > 0]
-                
-                # Calculate effective capital for progressive mode
-                if portfolio_mode == "Progressive Build" and weighted_portfolio:
-                    # In progressive mode, sum up all position values
-                    effective_capital = sum([p.get('value_base', 0) for p in weighted_portfolio])
-                    if effective_capital == 0:
-                        effective_capital = capital if capital > 0 else 10000
-                else:
-                    effective_capital = capital if capital > 0 else 10000
-                
-                if weighted_portfolio:
-                    # Show pie chart
-                    fig_preview = create_preview_allocation_chart(weighted_portfolio, effective_capital)
-                    if fig_preview:
-                        st.plotly_chart(fig_preview, use_container_width=True)
-                else:
-                    st.info("Enter weights to see portfolio allocation")
-                
-                # Summary table with currency info
-                if weighted_portfolio:
-                    st.markdown("**Portfolio Composition**")
-                    summary_df = pd.DataFrame([
-                        {
-                            'Ticker': p['ticker'],
-                            'CCY': p.get('native_currency', 'USD'),
-                            'Weight': f"{p['weight']:.1f}%",
-                            'Value': f"{currency_symbol}{effective_capital * p['weight'] / 100:,.0f}"
+                        # Récupérer benchmarks si sélectionnés
+                        bench_data = {}
+                        if selected_benchmarks and not bench_prices.empty:
+                            bench_cols = list(bench_prices.columns)
+                            # Rendements et cumul calculés en une passe sur toute la matrice
+                            # (1 + r).cumprod() == P_t / P_0 : une seule division, P_0 = premier prix valide
+                            bench_filled = bench_prices.ffill()
+                            # Rendements en NumPy (P_t / P_t-1 - 1) sur toute la matrice, index découpé une fois
+                            bench_arr = bench_filled.to_numpy()
+                            bench_returns_all = pd.DataFrame(bench_arr[1:] / bench_arr[:-1] - 1,
+                                                             index=bench_filled.index[1:], columns=bench_cols)
+                            bench_cumulative_all = bench_filled.div(bench_filled.bfill().iloc[0])
+                            for bench in bench_cols:
+                                bench_data[BENCHMARK_OPTIONS.get(bench, bench)] = {
+                                    'returns': bench_returns_all[bench].dropna(),
+                                    'cumulative': bench_cumulative_all[bench].dropna(),
+                                    'prices': bench_prices[bench]
+                                }
+                        
+                        # Stocker tous les résultats
+                        prices_pq = pack_prices(prices)
+                        mc_npy = pack_array(mc_simulations_data)
+                        st.session_state.analysis_results = {
+                            'portfolio_metrics': portfolio_metrics,
+                            'prices_pq': prices_pq,
+                            'weights_dict': weights_dict,
+                            'mc_npy': mc_npy,
+                            'mc_envelope': mc_percentile_envelope(mc_simulations_data) if mc_simulations_data is not None else None,
+                            'benchmarks': bench_data,
+                            'capital': capital,
+                            'selected_charts': selected_charts,
+                            'tickers': tickers,
+                            'sector_map': {t: classify_sector(t) for t in tickers},
+                            'country_map': {t: classify_country(t) for t in tickers},
+                            'analysis_id': analysis_fingerprint(prices_pq, mc_npy, weights_dict, capital, bench_data)
                         }
-                        for p in weighted_portfolio
-                    ])
-                    st.dataframe(summary_df, use_container_width=True, hide_index=True)
-                
-                # FX Exposure breakdown
-                if weighted_portfolio:
-                    st.markdown("**FX Exposure**")
-                    fx_exposure = {}
-                    for p in weighted_portfolio:
-                        ccy = p.get('native_currency', 'USD')
-                        fx_exposure[ccy] = fx_exposure.get(ccy, 0) + p['weight']
-                    
-                    # Display FX exposure
-                    fx_cols = st.columns(len(fx_exposure))
-                    for idx, (ccy, weight) in enumerate(sorted(fx_exposure.items(), key=lambda x: -x[1])):
-                        with fx_cols[idx]:
-                            ccy_symbol = CURRENCY_SYMBOLS.get(ccy, ccy)
-                            color = "#00875A" if ccy == currency else "#0052CC"
-                            st.markdown(f'<p style="text-align:center;"><span style="color:{color};font-weight:600;">{ccy_symbol}</span><br/>{weight:.1f}%</p>', unsafe_allow_html=True)
-                
-                # Metrics
-                if weighted_portfolio:
-                    st.divider()
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Total Allocated", f"{currency_symbol}{effective_capital * total_weight / 100:,.0f}")
-                    with col2:
-                        st.metric("Positions", f"{len(weighted_portfolio)}")
-                    
-                    # Show FX rates if there are foreign currency positions
-                    foreign_currencies = [c for c in fx_exposure.keys() if c != currency]
-                    if foreign_currencies:
-                        st.caption(f"FX Rates vs {currency}: " + " | ".join([f"{c}: {fx_rates.get(c, 1.0):.4f}" for c in foreign_currencies]))
-            else:
-                st.info("Add tickers with weights > 0 to see the live preview!")
-                
-                # Show example portfolio
-                st.markdown("**Example Portfolio:**")
-                example_data = [
-                    {'ticker': 'AAPL', 'weight': 25, 'name': 'Apple Inc.', 'exchange': 'NASDAQ'},
-                    {'ticker': 'NVDA', 'weight': 25, 'name': 'NVIDIA Corp.', 'exchange': 'NASDAQ'},
-                    {'ticker': 'MSFT', 'weight': 20, 'name': 'Microsoft', 'exchange': 'NASDAQ'},
-                    {'ticker': 'GOOGL', 'weight': 15, 'name': 'Alphabet', 'exchange': 'NASDAQ'},
-                    {'ticker': 'AMZN', 'weight': 15, 'name': 'Amazon', 'exchange': 'NASDAQ'},
-                ]
-                fig_example = create_preview_allocation_chart(example_data, capital)
-                if fig_example:
-                    st.plotly_chart(fig_example, use_container_width=True)
-                st.caption("This is an example. Enter your own tickers above!")
-    
-    # ==================== TAB 3: CHART SELECTION ====================
-    with tab3:
-        st.markdown('<h2 class="section-header">CHART SELECTION</h2>', unsafe_allow_html=True)
-        st.info("Choose which charts you want to generate. Select categories or individual charts.")
+                        
+                        st.success(f"✅ Analysis complete! {len(selected_charts)} charts ready. Check the Results tab.")
+                    else:
+                        st.error("Could not fetch price data. Please check your tickers and try again.")
+                except Exception as e:
+                    st.error(f"❌ Analysis failed: {str(e)}")
+                    with st.expander("Show error details"):
+                        st.code(traceback.format_exc())
+
+
+# ===================== SECTION: RESULTS =====================
+
+@st.fragment
+def render_results_tab(mc_display_paths):
+    """Results section: metrics, selected charts and CSV export"""
+    if st.session_state.analysis_results is None:
+        st.info("👆 Set up your portfolio, select charts, and run the analysis to see results.")
+    else:
+        results = st.session_state.analysis_results
+        portfolio_metrics = results['portfolio_metrics']
+        selected = results.get('selected_charts', tuple(range(1, 25)))  # Tuple déjà trié
+        capital = results['capital']
         
-        # Initialize all chart selection states if not exists
-        for i in range(1, 25):
-            if f'chart_{i}' not in st.session_state:
-                st.session_state[f'chart_{i}'] = True  # Default: all selected
+        st.markdown('<h2 class="section-header">PORTFOLIO METRICS</h2>', unsafe_allow_html=True)
         
-        # Quick select buttons
-        st.markdown("**Quick Selection:**")
-        col1, col2, col3, col4, col5 = st.columns(5)
+        # Calculer les métriques clés
+        port_returns = portfolio_metrics['port_ret_d']
+        cumulative_returns = portfolio_metrics['port_cum_d']
+        # Vues ndarray extraites une fois, partagées par toutes les métriques ci-dessous
+        port_ret_np = port_returns.to_numpy()
+        cumret_np = cumulative_returns.to_numpy()
+        total_return = (cumret_np[-1] - 1) * 100
+        annual_return = portfolio_metrics['mu_a'].mean() * 100 if isinstance(portfolio_metrics['mu_a'], np.ndarray) else port_ret_np.mean() * 252 * 100
+        volatility = portfolio_metrics['vol_a'] * 100
+        sharpe = calculate_sharpe_ratio(port_ret_np, risk_free_rate=0.02)
+        max_dd = calculate_max_drawdown(cumret_np) * 100
+        var_95 = calculate_var(port_ret_np, 0.95) * capital
+        cvar_95 = calculate_expected_shortfall(port_ret_np, 0.95) * capital
         
-        with col1:
-            if st.button("Select All", use_container_width=True, key="btn_all"):
-                for i in range(1, 25):
-                    st.session_state[f'chart_{i}'] = True
-                st.rerun()
-        with col2:
-            if st.button("Clear All", use_container_width=True, key="btn_none"):
-                for i in range(1, 25):
-                    st.session_state[f'chart_{i}'] = False
-                st.rerun()
-        with col3:
-            if st.button("Portfolio", use_container_width=True, key="btn_portfolio"):
-                for i in range(1, 25):
-                    st.session_state[f'chart_{i}'] = (i in [1, 2, 3, 4, 5, 6])
-                st.rerun()
-        with col4:
-            if st.button("Monte Carlo", use_container_width=True, key="btn_mc"):
-                for i in range(1, 25):
-                    st.session_state[f'chart_{i}'] = (i in [7, 8, 9, 10, 11, 12])
-                st.rerun()
-        with col5:
-            if st.button("Risk Metrics", use_container_width=True, key="btn_risk"):
-                for i in range(1, 25):
-                    st.session_state[f'chart_{i}'] = (i in [13, 14, 15, 16, 17])
-                st.rerun()
+        # Afficher les métriques
+        cols = st.columns(6)
+        with cols[0]:
+            st.metric("Total Return", f"{total_return:.2f}%")
+        with cols[1]:
+            st.metric("Annual Return", f"{annual_return:.2f}%")
+        with cols[2]:
+            st.metric("Volatility", f"{volatility:.2f}%")
+        with cols[3]:
+            st.metric("Sharpe Ratio", f"{sharpe:.2f}")
+        with cols[4]:
+            st.metric("Max Drawdown", f"{max_dd:.2f}%")
+        with cols[5]:
+            st.metric("VaR 95%", f"${var_95:,.2f}")
         
         st.divider()
         
-        # Chart selection by category
-        selected_charts = []
+        # Préparer les données pour les graphiques
+        w_series = portfolio_metrics['w_series']
+        mc_envelope = results.get('mc_envelope')  # Bandes de percentiles partagées par les charts 7 et 10
+        benchmarks = results.get('benchmarks', {})
+        tickers = results['tickers']
         
-        for category, chart_nums in CHART_GROUPS.items():
-            st.markdown(f'<div class="chart-category">{category}</div>', unsafe_allow_html=True)
-            
-            cols = st.columns(2)
-            for idx, chart_num in enumerate(chart_nums):
-                with cols[idx % 2]:
-                    chart_name = CHART_NAMES[chart_num]
-                    chart_desc = CHART_DESCRIPTIONS[chart_num]
-                    
-                    # Checkbox - reads directly from session state key
-                    is_selected = st.checkbox(
-                        f"**{chart_num}. {chart_name}**",
-                        key=f"chart_{chart_num}",
-                        help=chart_desc
-                    )
-                    
-                    # Show description
-                    st.caption(chart_desc)
-                    
-                    if is_selected:
-                        selected_charts.append(chart_num)
-            
-            st.markdown("")  # Spacing
-        
-        # Store for other tabs
-        st.session_state.selected_charts = selected_charts
-        
-        st.divider()
+        # Afficher les graphiques sélectionnés
+        st.markdown('<h2 class="section-header">ANALYSIS CHARTS</h2>', unsafe_allow_html=True)
         
-        # Summary
-        st.markdown(f"### 📊 Selected: **{len(selected_charts)}** / 24 charts")
+        # Résolus une fois avant la boucle : dispatch par simple lecture de dict
+        chart_funcs = {n: get_chart_function(n) for n in selected}
+        bench_name = next(iter(benchmarks), None)  # Premier benchmark sélectionné
+        bench_returns = benchmarks[bench_name]['returns'] if bench_name else None
+        bench_cumul = benchmarks[bench_name]['cumulative'] * capital if bench_name else None
         
-        if selected_charts:
-            selected_names = [f"{n}. {CHART_NAMES[n]}" for n in sorted(selected_charts)]
-            st.success(f"Charts to generate: {', '.join(selected_names)}")
-        else:
-            st.warning("⚠️ No charts selected. Please select at least one chart.")
+        # Prix (parquet) et chemins MC (.npy) décodés à la demande, une seule fois par rerun :
+        # avec un cache de figures chaud, build_chart n'est pas appelé et rien n'est décodé
+        decode_lock = threading.Lock()
+        decoded = {}
         
-        st.divider()
+        def decoded_blob(key, unpack):
+            """Decode results[key] on first use, shared by the worker threads"""
+            with decode_lock:
+                if key not in decoded:
+                    decoded[key] = unpack(results.get(key))
+                return decoded[key]
         
-        # Run Analysis Button
-        if st.button("RUN ANALYSIS", type="primary", use_container_width=True, key="run_analysis"):
-            if not portfolio_data:
-                st.error("Please add at least one position in the Portfolio Setup tab!")
-            elif not selected_charts:
-                st.error("Please select at least one chart to generate!")
-            elif abs(total_weight - 100) > 1:
-                st.error("Portfolio weights must sum to approximately 100%!")
-            else:
-                with st.spinner(f"Running analysis for {len(selected_charts)} charts... This may take a moment."):
-                    try:
-                        # Préparer les données
-                        tickers = [p['ticker'] for p in portfolio_data]
-                        weights_dict = {p['ticker']: p['weight'] / 100 for p in portfolio_data}
-                        
-                        # Récupérer les prix historiques (maximum disponible)
-                        prices = fetch_prices_new(tickers, period="max")
-                        
-                        if prices is not None and not prices.empty:
-                            # Calculer les métriques complètes avec app.calculations
-                            portfolio_metrics = compute_portfolio_metrics(
-                                prices=prices,
-                                weights_raw=weights_dict,
-                                cov_method="ledoit",
-                                annualization=252
-                            )
-                            
-                            # Lancer simulations Monte Carlo si nécessaire
-                            mc_simulations_data = None
-                            if any(n in selected_charts for n in range(7, 13)):  # Charts MC (7-12)
-                                mc_simulations_data = mc_gaussian_with_randomness(
-                                    mu_a=portfolio_metrics['mu_a'],
-                                    cov_a=portfolio_metrics['cov_a'],
-                                    w=portfolio_metrics['w'],
-                                    start_value=capital,
-                                    steps=60,  # 5 ans en mois
-                                    paths=mc_simulations,
-                                    randomness_factor=0.30
-                                )
-                            
-                            # Récupérer benchmarks si sélectionnés
-                            bench_data = {}
-                            if selected_benchmarks:
-                                bench_prices = fetch_prices_new(selected_benchmarks, period="max")
-                                if bench_prices is not None:
-                                    for bench in selected_benchmarks:
-                                        if bench in bench_prices.columns:
-                                            bench_returns = bench_prices[bench].pct_change().dropna()
-                                            bench_cumulative = (1 + bench_returns).cumprod()
-                                            bench_data[benchmark_options.get(bench, bench)] = {
-                                                'returns': bench_returns,
-                                                'cumulative': bench_cumulative,
-                                                'prices': bench_prices[bench]
-                                            }
-                            
-                            # Stocker tous les résultats
-                            st.session_state.analysis_results = {
-                                'portfolio_metrics': portfolio_metrics,
-                                'prices': prices,
-                                'weights_dict': weights_dict,
-                                'mc_simulations': mc_simulations_data,
-                                'benchmarks': bench_data,
-                                'capital': capital,
-                                'selected_charts': selected_charts,
-                                'tickers': tickers
-                            }
-                            
-                            st.success(f"✅ Analysis complete! {len(selected_charts)} charts ready. Check the Results tab.")
-                        else:
-                            st.error("Could not fetch price data. Please check your tickers and try again.")
-                    except Exception as e:
-                        st.error(f"❌ Analysis failed: {str(e)}")
-                        import traceback
-                        st.code(traceback.format_exc())
-    
-    # ==================== TAB 4: ANALYSIS RESULTS ====================
-    with tab4:
-        if st.session_state.analysis_results is None:
-            st.info("👆 Set up your portfolio, select charts, and run the analysis to see results.")
-        else:
-            results = st.session_state.analysis_results
-            portfolio_metrics = results['portfolio_metrics']
-            selected = results.get('selected_charts', list(range(1, 25)))
-            capital = results['capital']
+        def build_chart(chart_num):
+            """Figure (or warning message) for one chart; runs in a worker thread"""
+            chart_func = chart_funcs[chart_num]
             
-            st.markdown('<h2 class="section-header">PORTFOLIO METRICS</h2>', unsafe_allow_html=True)
+            # Portfolio Charts (1-6)
+            if chart_num == 1:
+                fig = build_allocation_chart(w_series, capital)
             
-            # Calculer les métriques clés
-            port_returns = portfolio_metrics['port_ret_d']
-            cumulative_returns = (1 + port_returns).cumprod()
-            total_return = (cumulative_returns.iloc[-1] - 1) * 100
-            annual_return = portfolio_metrics['mu_a'].mean() * 100 if isinstance(portfolio_metrics['mu_a'], np.ndarray) else port_returns.mean() * 252 * 100
-            volatility = portfolio_metrics['vol_a'] * 100
-            sharpe = calculate_sharpe_ratio(port_returns.values, risk_free_rate=0.02)
-            max_dd = calculate_max_drawdown(cumulative_returns.values) * 100
-            var_95 = calculate_var(port_returns.values, 0.95) * capital
+            elif chart_num == 2:
+                fig = chart_func(w_series, capital)
             
-            # Afficher les métriques
-            cols = st.columns(6)
-            with cols[0]:
-                st.metric("Total Return", f"{total_return:.2f}%")
-            with cols[1]:
-                st.metric("Annual Return", f"{annual_return:.2f}%")
-            with cols[2]:
-                st.metric("Volatility", f"{volatility:.2f}%")
-            with cols[3]:
-                st.metric("Sharpe Ratio", f"{sharpe:.2f}")
-            with cols[4]:
-                st.metric("Max Drawdown", f"{max_dd:.2f}%")
-            with cols[5]:
-                st.metric("VaR 95%", f"${var_95:,.2f}")
+            elif chart_num == 3:
+                prices = decoded_blob('prices_pq', unpack_prices)
+                fig = chart_func(port_returns, prices, tickers, cumulative=cumulative_returns)
             
-            st.divider()
+            elif chart_num == 4:
+                fig = chart_func(port_returns)
             
-            # Préparer les données pour les graphiques
-            prices = results['prices']
-            w_series = portfolio_metrics['w_series']
-            mc_sims = results.get('mc_simulations')
-            benchmarks = results.get('benchmarks', {})
-            tickers = results['tickers']
+            elif chart_num == 5:
+                fig = build_correlation_chart(portfolio_metrics['corr'])
             
-            # Afficher les graphiques sélectionnés
-            st.markdown('<h2 class="section-header">ANALYSIS CHARTS</h2>', unsafe_allow_html=True)
+            elif chart_num == 6:
+                fig = chart_func(port_returns, window=252)
             
-            for chart_num in sorted(selected):
-                try:
-                    chart_func = get_chart_function(chart_num)
-                    if not chart_func:
-                        st.warning(f"Chart {chart_num} function not found.")
-                        continue
-                    
-                    st.markdown(f"### {chart_num}. {CHART_NAMES.get(chart_num, f'Chart {chart_num}')}")
-                    
-                    # Portfolio Charts (1-6)
-                    if chart_num == 1:
-                        fig = chart_func(w_series, capital)
-                    
-                    elif chart_num == 2:
-                        fig = chart_func(w_series, capital)
-                    
-                    elif chart_num == 3:
-                        fig = chart_func(port_returns, prices, tickers)
-                    
-                    elif chart_num == 4:
-                        fig = chart_func(port_returns)
-                    
-                    elif chart_num == 5:
-                        fig = chart_func(portfolio_metrics['corr'])
-                    
-                    elif chart_num == 6:
-                        fig = chart_func(port_returns, window=252)
-                    
-                    # Monte Carlo Charts (7-12)
-                    elif chart_num in range(7, 13):
-                        if mc_sims is None:
-                            st.warning("Monte Carlo simulations required. Please select MC charts before running analysis.")
-                            continue
-                        
-                        if chart_num == 7:
-                            fig = chart_func(mc_sims, capital, n_display=mc_display_paths)
-                        elif chart_num == 8:
-                            fig = chart_func(mc_sims)
-                        elif chart_num == 9:
-                            fig = chart_func(mc_sims, confidence_levels=[0.95, 0.99])
-                        elif chart_num == 10:
-                            fig = chart_func(mc_sims)
-                        elif chart_num == 11:
-                            fig = chart_func(mc_sims, risk_free_rate=0.02)
-                        elif chart_num == 12:
-                            fig = chart_func(mc_sims, capital)
-                    
-                    # Risk Metrics Charts (13-18)
-                    elif chart_num == 13:
-                        fig = chart_func(port_returns, window=252, risk_free_rate=0.02)
-                    
-                    elif chart_num == 14:
-                        fig = chart_func(port_returns)
-                    
-                    elif chart_num == 15:
-                        fig = chart_func(portfolio_metrics, benchmarks)
-                    
-                    elif chart_num == 16:
-                        if not benchmarks:
-                            st.warning("No benchmark selected. Please add a benchmark for beta analysis.")
-                            continue
-                        bench_name = list(benchmarks.keys())[0]
-                        bench_returns = benchmarks[bench_name]['returns']
-                        fig = chart_func(port_returns, bench_returns)
-                    
-                    elif chart_num == 17:
-                        fig = chart_func(port_returns, window=252, confidence=0.95)
-                    
-                    elif chart_num == 18:
-                        fig = chart_func(port_returns, confidence=0.95)
-                    
-                    # Market Analysis Charts (19-24)
-                    elif chart_num == 19:
-                        if not benchmarks:
-                            st.warning("No benchmark selected for comparison.")
-                            continue
-                        bench_name = list(benchmarks.keys())[0]
-                        bench_cumul = benchmarks[bench_name]['cumulative'] * capital
-                        fig = chart_func(cumulative_returns * capital, bench_cumul, bench_name)
-                    
-                    elif chart_num == 20:
-                        if not benchmarks:
-                            st.warning("No benchmark selected for relative performance.")
-                            continue
-                        bench_name = list(benchmarks.keys())[0]
-                        bench_returns = benchmarks[bench_name]['returns']
-                        fig = chart_func(port_returns, bench_returns, bench_name)
-                    
-                    elif chart_num == 21:
-                        # Sector mapping simple
-                        tech_stocks = ["AAPL", "MSFT", "GOOGL", "GOOG", "NVDA", "AMD", "INTC", "META", "NFLX"]
-                        finance_stocks = ["JPM", "V", "MA", "BAC", "GS", "MS", "BLK"]
-                        sector_map = {}
-                        for t in tickers:
-                            if t in tech_stocks:
-                                sector_map[t] = "Technology"
-                            elif t in finance_stocks:
-                                sector_map[t] = "Finance"
-                            elif "SPY" in t or "QQQ" in t or "VOO" in t:
-                                sector_map[t] = "ETF"
-                            else:
-                                sector_map[t] = "Other"
-                        fig = chart_func(w_series, sector_map)
-                    
-                    elif chart_num == 22:
-                        # Geographic mapping
-                        country_map = {}
-                        for t in tickers:
-                            if ".PA" in t:
-                                country_map[t] = "France"
-                            elif ".DE" in t:
-                                country_map[t] = "Germany"
-                            elif ".AS" in t:
-                                country_map[t] = "Netherlands"
-                            else:
-                                country_map[t] = "USA"
-                        fig = chart_func(w_series, country_map)
-                    
-                    elif chart_num == 23:
-                        fig = chart_func(port_returns, window=60)
-                    
-                    elif chart_num == 24:
-                        if not benchmarks:
-                            st.warning("No benchmark selected for market correlation.")
-                            continue
-                        market_indices = {name: data['returns'] for name, data in benchmarks.items()}
-                        fig = chart_func(port_returns, market_indices)
-                    
-                    # Afficher le graphique
-                    st.plotly_chart(fig, use_container_width=True)
-                    st.markdown("---")
+            # Monte Carlo Charts (7-12)
+            elif chart_num in MC_CHARTS:
+                mc_sims = decoded_blob('mc_npy', unpack_array)
+                if mc_sims is None:
+                    return None, "Monte Carlo simulations required. Please select MC charts before running analysis."
                 
-                except Exception as e:
-                    st.error(f"❌ Error generating chart {chart_num}: {str(e)}")
-                    with st.expander("Show error details"):
-                        import traceback
-                        st.code(traceback.format_exc())
+                if chart_num == 7:
+                    fig = chart_func(mc_sims, capital, n_display=mc_display_paths, envelope=mc_envelope)
+                elif chart_num == 8:
+                    fig = chart_func(mc_sims)
+                elif chart_num == 9:
+                    fig = chart_func(mc_sims, confidence_levels=[0.95, 0.99])
+                elif chart_num == 10:
+                    fig = chart_func(mc_sims, envelope=mc_envelope)
+                elif chart_num == 11:
+                    fig = chart_func(mc_sims, risk_free_rate=0.02)
+                elif chart_num == 12:
+                    fig = chart_func(mc_sims, capital)
             
-            st.divider()
-            st.markdown('<h2 class="section-header">EXPORT DATA</h2>', unsafe_allow_html=True)
+            # Risk Metrics Charts (13-18)
+            elif chart_num == 13:
+                fig = chart_func(port_returns, window=252, risk_free_rate=0.02)
             
-            summary_df = pd.DataFrame({
-                'Metric': ['Total Return', 'Annual Return', 'Volatility', 'Sharpe Ratio', 'Max Drawdown', 'VaR 95%', 'CVaR 95%'],
-                'Value': [
-                    f"{total_return:.2f}%",
-                    f"{annual_return:.2f}%",
-                    f"{volatility:.2f}%",
-                    f"{sharpe:.2f}",
-                    f"{max_dd:.2f}%",
-                    f"${var_95:,.2f}",
-                    f"${calculate_expected_shortfall(port_returns.values, 0.95) * capital:,.2f}"
-                ]
-            })
+            elif chart_num == 14:
+                fig = chart_func(port_returns, cumulative=cumulative_returns)
+            
+            elif chart_num == 15:
+                fig = chart_func(portfolio_metrics, benchmarks)
             
-            csv = summary_df.to_csv(index=False)
-            st.download_button(
-                label="DOWNLOAD SUMMARY (CSV)",
-                data=csv,
-                file_name="portfolio_analysis.csv",
-                mime="text/csv"
+            elif chart_num == 16:
+                if not benchmarks:
+                    return None, "No benchmark selected. Please add a benchmark for beta analysis."
+                fig = chart_func(port_returns, bench_returns)
+            
+            elif chart_num == 17:
+                fig = chart_func(port_returns, window=252, confidence=0.95)
+            
+            elif chart_num == 18:
+                fig = chart_func(port_returns, confidence=0.95)
+            
+            # Market Analysis Charts (19-24)
+            elif chart_num == 19:
+                if not benchmarks:
+                    return None, "No benchmark selected for comparison."
+                fig = chart_func(cumulative_returns * capital, bench_cumul, bench_name)
+            
+            elif chart_num == 20:
+                if not benchmarks:
+                    return None, "No benchmark selected for relative performance."
+                fig = chart_func(port_returns, bench_returns, bench_name)
+            
+            elif chart_num == 21:
+                fig = chart_func(w_series, results['sector_map'])
+            
+            elif chart_num == 22:
+                fig = chart_func(w_series, results['country_map'])
+            
+            elif chart_num == 23:
+                fig = chart_func(port_returns, window=60, cumulative=cumulative_returns)
+            
+            elif chart_num == 24:
+                if not benchmarks:
+                    return None, "No benchmark selected for market correlation."
+                market_indices = {name: data['returns'] for name, data in benchmarks.items()}
+                fig = chart_func(port_returns, market_indices)
+            
+            return fig, None
+        
+        # Un emplacement par graphique, créé d'avance dans l'ordre d'affichage, puis rempli
+        # dès que sa figure est prête (le premier graphique n'attend plus les suivants)
+        slots = {}
+        for chart_num in selected:
+            if not chart_funcs[chart_num]:
+                st.warning(f"Chart {chart_num} function not found.")
+                continue
+            st.markdown(f"### {chart_num}. {CHART_NAMES.get(chart_num, f'Chart {chart_num}')}")
+            slots[chart_num] = st.empty()
+            st.markdown("---")
+        
+        with ThreadPoolExecutor(max_workers=4, initializer=add_script_run_ctx,
+                                initargs=(None, get_script_run_ctx())) as executor:
+            # Figures mises en cache par analyse : un rerun sans nouvelle analyse ne les reconstruit pas
+            futures = {executor.submit(cached_figure_json, n, results['analysis_id'], mc_display_paths, build_chart): n
+                       for n in slots}
+            for future in as_completed(futures):
+                chart_num = futures[future]
+                with slots[chart_num].container():
+                    try:
+                        fig_json, warning = future.result()
+                        if warning:
+                            st.warning(warning)
+                        elif chart_num in COLLAPSED_CHARTS:
+                            with st.expander("Show chart", expanded=False):
+                                st.plotly_chart(pio.from_json(fig_json), use_container_width=True)
+                        else:
+                            st.plotly_chart(pio.from_json(fig_json), use_container_width=True)
+                    except Exception as e:
+                        st.error(f"❌ Error generating chart {chart_num}: {str(e)}")
+                        with st.expander("Show error details"):
+                            st.code(''.join(traceback.format_exception(e)))
+        
+        st.divider()
+        st.markdown('<h2 class="section-header">EXPORT DATA</h2>', unsafe_allow_html=True)
+        
+        summary_values = [
+            f"{total_return:.2f}%",
+            f"{annual_return:.2f}%",
+            f"{volatility:.2f}%",
+            f"{sharpe:.2f}",
+            f"{max_dd:.2f}%",
+            f"${var_95:,.2f}",
+            f"${cvar_95:,.2f}"
+        ]
+        
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator='\n')
+        writer.writerow(['Metric', 'Value'])
+        writer.writerows(zip(SUMMARY_METRIC_NAMES, summary_values))
+        csv_data = buf.getvalue()
+        st.download_button(
+            label="DOWNLOAD SUMMARY (CSV)",
+            data=csv_data,
+            file_name="portfolio_analysis.csv",
+            mime="text/csv"
+        )
+
+
+# ===================== MAIN APPLICATION =====================
+
+def main():
+    # Header
+    st.markdown("""
+    <div class="main-header">
+        <h1>PORTFOLIO ARCHITECT</h1>
+        <p>Advanced Portfolio Analysis & Risk Management Platform</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Paramètres d'analyse fixés
+    years = "max"  # Toujours le maximum de données disponibles
+    mc_simulations = 100000  # 100K simulations pour précision
+    mc_display_paths = 500  # Nombre de paths à afficher (au-delà, visuellement identique)
+    
+    # Configuration du portfolio - À saisir avant les tabs
+    st.markdown('<h2 class="section-header">CONFIGURATION</h2>', unsafe_allow_html=True)
+    
+    config_col1, config_col2, config_col3 = st.columns([1.5, 1, 1])
+    
+    with config_col1:
+        portfolio_mode = st.radio(
+            "MODE",
+            options=["Fixed Capital", "Progressive Build"],
+            horizontal=True,
+            help="Fixed: Define total capital upfront | Progressive: Build portfolio position by position"
+        )
+    
+    with config_col2:
+        currency = st.selectbox(
+            "BASE CURRENCY", 
+            options=["EUR", "USD", "GBP", "CHF", "JPY"],
+            index=0,
+            help="Your portfolio's base currency"
+        )
+    
+    with config_col3:
+        if portfolio_mode == "Fixed Capital":
+            capital = st.number_input(
+                f"CAPITAL ({currency})", 
+                min_value=100.0, 
+                value=10000.0, 
+                step=1000.0,
+                format="%.0f",
+                help="Total capital to invest"
             )
+        else:
+            # En mode progressif, le capital sera calculé automatiquement
+            capital = 0.0
+            st.info("Auto-calculated")
+    
+    st.divider()
+    
+    # Main Content - Tabs
+    # Une seule section exécutée par rerun (st.tabs exécute tous les onglets à chaque rerun)
+    active_section = st.radio(
+        "Section",
+        options=APP_SECTIONS,
+        horizontal=True,
+        key="active_section",
+        label_visibility="collapsed"
+    )
+    
+    if active_section == "MARKET DATA":
+        render_market_tab()
+    elif active_section == "PORTFOLIO":
+        render_portfolio_tab(portfolio_mode, currency, capital)
+    elif active_section == "ANALYTICS":
+        render_analytics_tab(portfolio_mode, currency, capital, mc_simulations)
+    else:
+        render_results_tab(mc_display_paths)
 
 # ===================== FOOTER =====================
 def render_footer():
@@ -0,0 +1,53 @@
+# test_calculations.py - Tests des simulations Monte Carlo (app.calculations)
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import calculations
+from app.calculations import mc_gaussian_with_randomness, mc_parallel
+from app.config import MC_CHUNKS, MC_PARALLEL_MIN_PATHS
+
+MU = np.array([0.08, 0.05])
+COV = np.array([[0.04, 0.01], [0.01, 0.02]])
+W = np.array([0.6, 0.4])
+STEPS = 12
+PATHS = MC_PARALLEL_MIN_PATHS
+SEED = 7
+
+
+def _sequential_reference(paths, seed):
+    """Mêmes blocs et mêmes flux que mc_parallel, calculés en série"""
+    chunk_sizes = [len(c) for c in np.array_split(np.arange(paths), MC_CHUNKS) if len(c)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+    return np.concatenate([
+        mc_gaussian_with_randomness(MU, COV, W, 10000.0, STEPS, size, 0.30, 12, s)
+        for size, s in zip(chunk_sizes, seeds)
+    ], axis=1)
+
+
+def test_mc_parallel_matches_sequential_map(monkeypatch):
+    # Force le chemin multi-processus même sur une machine à un coeur
+    monkeypatch.setattr(calculations.os, "cpu_count", lambda: 4)
+    
+    out = mc_parallel(MU, COV, W, 10000.0, STEPS, PATHS, seed=SEED)
+    assert out.shape == (STEPS + 1, PATHS)
+    np.testing.assert_array_equal(out, _sequential_reference(PATHS, SEED))
+
+
+def test_mc_parallel_fallback_gives_same_paths(monkeypatch):
+    def no_pool(workers):
+        raise OSError("no child processes")
+    monkeypatch.setattr(calculations, "_mc_pool", no_pool)
+    
+    out = mc_parallel(MU, COV, W, 10000.0, STEPS, PATHS, seed=SEED)
+    assert out.shape == (STEPS + 1, PATHS)
+    np.testing.assert_array_equal(out, _sequential_reference(PATHS, SEED))
+
+
+def test_mc_parallel_small_run_shape():
+    out = mc_parallel(MU, COV, W, 10000.0, STEPS, 50, seed=SEED)
+    assert out.shape == (STEPS + 1, 50)
+    np.testing.assert_array_equal(out[0], np.full(50, 10000.0))
@@ -0,0 +1,65 @@
+# test_data_fetcher.py - Tests de get_current_prices (app.data_fetcher), yf.download simulé
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import data_fetcher
+
+# Fonction non cachée : st.cache_data ne doit pas servir un résultat d'un autre test
+get_current_prices = data_fetcher.get_current_prices.__wrapped__
+
+DATES = pd.date_range("2024-01-01", periods=3, freq="D")
+
+
+def _ohlc(closes):
+    return pd.DataFrame({"Open": closes, "Close": closes}, index=DATES)
+
+
+def _patch_download(monkeypatch, frame):
+    calls = []
+
+    def fake_download(tickers, **kwargs):
+        calls.append(list(tickers))
+        return frame
+
+    monkeypatch.setattr(data_fetcher.yf, "download", fake_download)
+    return calls
+
+
+def test_get_current_prices_multiindex(monkeypatch):
+    frame = pd.concat({
+        "AAPL": _ohlc([10.0, 11.0, 12.0]),
+        "MSFT": _ohlc([20.0, 21.0, float("nan")]),
+    }, axis=1)
+    calls = _patch_download(monkeypatch, frame)
+
+    prices = get_current_prices(("AAPL", "MSFT"))
+
+    assert calls == [["AAPL", "MSFT"]]  # un seul appel pour tous les symboles
+    assert prices == {"AAPL": 12.0, "MSFT": 21.0}  # dernière clôture non NaN
+
+
+def test_get_current_prices_flat_single_symbol(monkeypatch):
+    _patch_download(monkeypatch, _ohlc([5.0, 6.0, 7.5]))
+
+    assert get_current_prices(("AAPL",)) == {"AAPL": 7.5}
+
+
+def test_get_current_prices_missing_symbol(monkeypatch):
+    frame = pd.concat({"AAPL": _ohlc([10.0, 11.0, 12.0])}, axis=1)
+    _patch_download(monkeypatch, frame)
+
+    assert get_current_prices(("AAPL", "XXXX")) == {"AAPL": 12.0}
+
+
+def test_get_current_prices_download_error(monkeypatch):
+    def failing_download(tickers, **kwargs):
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(data_fetcher.yf, "download", failing_download)
+
+    assert get_current_prices(("AAPL",)) == {}
+    assert get_current_prices(()) == {}